@@ -19,6 +19,7 @@ from .error import (AccessDeniedError, HEREError, InvalidRequestError,
                     UnauthorizedError)
 from .ev_charging_stations_api import EVChargingStationsApi
 from .fleet_telematics_api import FleetTelematicsApi
+from .flexible_polyline import FlexiblePolyline
 from .geocoder_api import GeocoderApi
 from .geocoder_autocomplete_api import GeocoderAutoCompleteApi
 from .geocoder_reverse_api import GeocoderReverseApi
@@ -33,33 +34,41 @@ from .here_enum import (AerialMapTileResourceType, AvoidFeature,
                         MatrixRoutingProfile, MatrixRoutingTransportMode,
                         MatrixRoutingType, MatrixSummaryAttribute,
                         MultiplePickupOfferType, PlacesCategory,
-                        PublicTransitModeType, PublicTransitRoutingMode,
-                        PublicTransitSearchMethod, RouteMode,
-                        RoutingApiReturnField, RoutingApiSpanField,
+                        PolylineThirdDimension, PublicTransitModeType,
+                        PublicTransitRoutingMode, PublicTransitSearchMethod,
+                        RouteMode, RoutingApiReturnField, RoutingApiSpanField,
                         RoutingMetric, RoutingMode, RoutingTransportMode,
                         ShippedHazardousGood, TrafficMapTileResourceType,
                         TruckType, TunnelCategory, VectorMapTileLayer,
                         WeatherProductType)
+from .instrumentation import Instrumentation, RequestEvent
 from .isoline_routing_api import IsolineRoutingApi
+from .jobs import Job
 from .map_image_api import MapImageApi
 from .map_tile_api import MapTileApi
 from .mercator_projection import MercatorProjection
-from .models import (DestinationWeatherResponse, EVChargingStationsResponse,
-                     GeocoderAutoCompleteResponse, GeocoderResponse,
-                     GeocoderReverseResponse, IsolineRoutingResponse,
-                     PlacesResponse, PublicTransitResponse, RmeResponse,
+from .models import (Action, DestinationWeatherResponse,
+                     EVChargingStationsResponse, GeocoderAutoCompleteResponse,
+                     GeocoderResponse, GeocoderReverseResponse,
+                     IsolineRoutingResponse, PlacesResponse,
+                     PublicTransitResponse, RmeResponse, Route,
                      RoutingMatrixResponse, RoutingResponse, RoutingResponseV8,
-                     TrafficFlowAvailabilityResponse, TrafficFlowResponse,
-                     TrafficIncidentResponse, WaypointSequenceResponse)
+                     Section, Span, Spans, TrafficFlowAvailabilityResponse,
+                     TrafficFlowResponse, TrafficIncidentResponse,
+                     WaypointSequenceResponse)
 from .objects import Avoid, AvoidArea, AvoidFeature, Truck
 from .places_api import PlacesApi
 from .platform.tour_planning_api import TourPlanningApi
+from .polling import Poller
 from .public_transit_api import PublicTransitApi
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
 from .rme_api import RmeApi
 from .routing_api import (InvalidCredentialsError, InvalidInputDataError,
                           LinkIdNotFoundError, NoRouteFoundError,
                           RouteNotReconstructedError, RoutingApi,
                           WaypointNotFoundError)
+from .single_flight import SingleFlight
 from .traffic_api import TrafficApi
 from .utils import Utils
 from .vector_tile_api import VectorTileApi
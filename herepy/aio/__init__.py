@@ -0,0 +1,16 @@
+from .destination_weather_api import AsyncDestinationWeatherApi
+from .ev_charging_stations_api import AsyncEVChargingStationsApi
+from .fleet_telematics_api import AsyncFleetTelematicsApi
+from .geocoder_api import AsyncGeocoderApi
+from .geocoder_autocomplete_api import AsyncGeocoderAutoCompleteApi
+from .geocoder_reverse_api import AsyncGeocoderReverseApi
+from .here_api import AsyncHEREApi, AsyncResponse
+from .isoline_routing_api import AsyncIsolineRoutingApi
+from .map_image_api import AsyncMapImageApi
+from .map_tile_api import AsyncMapTileApi
+from .places_api import AsyncPlacesApi
+from .public_transit_api import AsyncPublicTransitApi
+from .rme_api import AsyncRmeApi
+from .routing_api import AsyncRoutingApi
+from .traffic_api import AsyncTrafficApi
+from .vector_tile_api import AsyncVectorTileApi
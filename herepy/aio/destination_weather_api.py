@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.destination_weather_api import DestinationWeatherApi
+
+
+class AsyncDestinationWeatherApi(AsyncHEREApi, DestinationWeatherApi):
+    """An asyncio interface into the HERE Destination Weather API.
+
+    Accepts the same arguments as `DestinationWeatherApi`, methods return awaitables.
+    """
@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.ev_charging_stations_api import EVChargingStationsApi
+
+
+class AsyncEVChargingStationsApi(AsyncHEREApi, EVChargingStationsApi):
+    """An asyncio interface into the HERE EV Charging Stations API.
+
+    Accepts the same arguments as `EVChargingStationsApi`, methods return awaitables.
+    """
@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.fleet_telematics_api import FleetTelematicsApi
+
+
+class AsyncFleetTelematicsApi(AsyncHEREApi, FleetTelematicsApi):
+    """An asyncio interface into the HERE Fleet Telematics API.
+
+    Accepts the same arguments as `FleetTelematicsApi`, methods return awaitables.
+    """
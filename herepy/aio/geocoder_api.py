@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.geocoder_api import GeocoderApi
+
+
+class AsyncGeocoderApi(AsyncHEREApi, GeocoderApi):
+    """An asyncio interface into the HERE Geocoder API.
+
+    Accepts the same arguments as `GeocoderApi`, methods return awaitables.
+    """
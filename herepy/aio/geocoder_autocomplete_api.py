@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.geocoder_autocomplete_api import GeocoderAutoCompleteApi
+
+
+class AsyncGeocoderAutoCompleteApi(AsyncHEREApi, GeocoderAutoCompleteApi):
+    """An asyncio interface into the HERE Geocoder Autocomplete API.
+
+    Accepts the same arguments as `GeocoderAutoCompleteApi`, methods return awaitables.
+    """
@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.geocoder_reverse_api import GeocoderReverseApi
+
+
+class AsyncGeocoderReverseApi(AsyncHEREApi, GeocoderReverseApi):
+    """An asyncio interface into the HERE Geocoder Reverse API.
+
+    Accepts the same arguments as `GeocoderReverseApi`, methods return awaitables.
+    """
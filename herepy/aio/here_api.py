@@ -0,0 +1,336 @@
+#!/usr/bin/env python
+
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from herepy import tracing
+from herepy.error import HEREError
+from herepy.here_api import HEREApi
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+def _create_trace_config() -> "aiohttp.TraceConfig":
+    """Returns a trace config recording the DNS lookup, the connection setup and
+    the bytes sent of a call in the dict passed as its `trace_request_ctx`."""
+
+    async def on_request_start(session, context, params):
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx["bytes_sent"] = 0
+
+    async def on_request_chunk_sent(session, context, params):
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx["bytes_sent"] += len(params.chunk)
+
+    async def on_dns_resolvehost_start(session, context, params):
+        context.dns_started_at = time.perf_counter()
+
+    async def on_dns_resolvehost_end(session, context, params):
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx["dns"] = (
+                time.perf_counter() - context.dns_started_at
+            )
+
+    async def on_connection_create_start(session, context, params):
+        context.connect_started_at = time.perf_counter()
+
+    async def on_connection_create_end(session, context, params):
+        trace = context.trace_request_ctx
+        if trace is not None:
+            trace["connect"] = (
+                time.perf_counter() - context.connect_started_at - trace.get("dns", 0.0)
+            )
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_chunk_sent.append(on_request_chunk_sent)
+    trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    return trace_config
+
+
+class AsyncResponse(object):
+    """Response of an async request, exposing the parts of `requests.Response`
+    the response parsers of the wrappers rely on.
+
+    The body of a streamed response is not read yet, it is read in chunks through
+    `iter_content` or at once through `read`, and the connection is released by
+    `close` or by leaving an `async with` block.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Dict,
+        content: Optional[bytes],
+        url: str,
+        attempts: int = 1,
+        timings: Optional[Dict[str, float]] = None,
+        raw: Optional["aiohttp.ClientResponse"] = None,
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.attempts = attempts
+        self.timings = timings or {}
+        self.raw = raw
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    async def read(self) -> bytes:
+        """Returns the body, reading it if the response is streamed."""
+        if self.content is None:
+            self.content = await self.raw.read()
+        return self.content
+
+    async def iter_content(self, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """Yields the body of a streamed response `chunk_size` bytes at a time."""
+        if self.content is not None:
+            for i in range(0, len(self.content), chunk_size):
+                yield self.content[i : i + chunk_size]
+            return
+        async for chunk in self.raw.content.iter_chunked(chunk_size):
+            yield chunk
+
+    def close(self):
+        """Releases the connection of a streamed response."""
+        if self.raw is not None:
+            self.raw.release()
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class AsyncHEREApi(HEREApi):
+    """Base class from which all asyncio wrappers inherit.
+
+    An async wrapper is combined with its synchronous counterpart, e.g.
+    `class AsyncGeocoderApi(AsyncHEREApi, GeocoderApi)`, so it reuses the request
+    building and response parsing of the synchronous wrapper and only swaps the
+    transport for a non-blocking aiohttp session. Public methods of async wrappers
+    return awaitables.
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        timeout: int = None,
+        session: Optional["aiohttp.ClientSession"] = None,
+        connection_limit: int = 100,
+        **kwargs
+    ):
+        """Returns a AsyncHEREApi instance.
+        Args:
+          api_key (str):
+            API key taken from HERE Developer Portal.
+          timeout (int):
+            Timeout limit for requests.
+          session (Optional[aiohttp.ClientSession]):
+            Session used for every HTTP call of this instance, can be shared by
+            several async wrapper instances running on the same event loop.
+            Created lazily on the first request when not given.
+          connection_limit (int):
+            Maximum number of simultaneous connections of the session created
+            by this instance.
+          **kwargs:
+            Transport options forwarded to HEREApi.
+        """
+
+        super(AsyncHEREApi, self).__init__(api_key, timeout, **kwargs)
+        self._async_session = session
+        self._owns_async_session = session is None
+        self._connection_limit = connection_limit
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def session(self) -> Optional["aiohttp.ClientSession"]:
+        """Returns the aiohttp session used by this instance."""
+        return self._async_session
+
+    def _get_transport_options(self) -> Dict[str, Any]:
+        options = super(AsyncHEREApi, self)._get_transport_options()
+        options["session"] = self._get_async_session()
+        return options
+
+    def _get_default_session(self) -> None:
+        """Async wrappers send every request through their aiohttp session and
+        never use, nor create, a requests session."""
+        return None
+
+    def _get_async_session(self) -> "aiohttp.ClientSession":
+        if aiohttp is None:
+            raise HEREError(
+                "aiohttp is required for the async clients, "
+                "install it with `pip install herepy[async]`."
+            )
+        if self._async_session is None or self._async_session.closed:
+            connector = aiohttp.TCPConnector(limit=self._connection_limit)
+            self._async_session = aiohttp.ClientSession(
+                connector=connector, trace_configs=[_create_trace_config()]
+            )
+            self._owns_async_session = True
+        return self._async_session
+
+    async def close(self):
+        """Closes the aiohttp session if it was created by this instance."""
+        if self._owns_async_session and self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    @staticmethod
+    def _build_cached_response(data: Dict) -> AsyncResponse:
+        return AsyncResponse(
+            data["status_code"], data["headers"], data["content"], data["url"]
+        )
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        json: Optional[Dict] = None,
+        stream: bool = False,
+        service: Optional[str] = None,
+        allow_redirects: bool = True,
+        cache_status: Optional[str] = None,
+    ) -> AsyncResponse:
+        """Sends a HTTP request through the aiohttp session of this instance, again
+        as long as the retry policy asks for it. Retries and the rate limiter of
+        `service` wait without blocking the event loop. Every attempt is reported
+        to the instrumentation hooks, DNS and connect timings are measured by
+        sessions created by this instance, connect including the TLS handshake.
+        The body of a `stream` response is left unread, see `AsyncResponse`."""
+        service = service or self.SERVICE
+        session = self._get_async_session()
+        started_at = time.monotonic()
+        attempt = 1
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async(service)
+            event = None
+            if self._instrumentation is not None:
+                event = self._instrumentation.start(
+                    service, method, url, attempt, cache_status
+                )
+            trace = {}
+            sent_at = time.perf_counter()
+            with tracing.start_http_span(method, url, service, attempt) as span:
+                try:
+                    response = await session.request(
+                        method,
+                        url,
+                        headers=tracing.inject(headers),
+                        json=json,
+                        timeout=aiohttp.ClientTimeout(total=self._timeout),
+                        allow_redirects=allow_redirects,
+                        trace_request_ctx=trace,
+                    )
+                    trace["ttfb"] = time.perf_counter() - sent_at
+                    content = None
+                    if not stream:
+                        try:
+                            content = await response.read()
+                        finally:
+                            response.release()
+                except Exception as error:
+                    if event is not None:
+                        self._instrumentation.finish(event, sent_at, error=error)
+                    if not isinstance(
+                        error, (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+                    ):
+                        raise
+                    tracing.set_http_error(span, error)
+                    delay = self._get_retry_delay(method, attempt, started_at)
+                    if delay is None:
+                        raise
+                else:
+                    bytes_sent = trace.pop("bytes_sent", None)
+                    async_response = AsyncResponse(
+                        response.status,
+                        response.headers,
+                        content,
+                        str(response.url),
+                        attempt,
+                        trace,
+                        response if stream else None,
+                    )
+                    tracing.set_http_response(span, async_response)
+                    if event is not None:
+                        async_response.bytes_sent = bytes_sent
+                        self._instrumentation.finish(
+                            event, sent_at, response=async_response, stream=stream
+                        )
+                    delay = self._get_retry_delay(
+                        method, attempt, started_at, response.status, response.headers
+                    )
+                    if delay is None:
+                        return async_response
+                    async_response.close()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _resolved(self, value: Any) -> Any:
+        return value
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        parse: Callable[[AsyncResponse], Any],
+        headers: Optional[Dict[str, str]] = None,
+        json: Optional[Dict] = None,
+        stream: bool = False,
+        service: Optional[str] = None,
+    ) -> Any:
+        service = service or self.SERVICE
+        key, ttl, cached = self._get_cache_entry(method, url, json, service)
+        if cached is not None:
+            response = self._build_cached_response(cached)
+            self._report_cache_hit(method, url, service, response)
+            with tracing.start_span("herepy.parse", {"herepy.cache_status": "hit"}):
+                return parse(response)
+
+        async def fetch():
+            response = await self._request(
+                method,
+                url,
+                headers=headers,
+                json=json,
+                stream=stream,
+                service=service,
+                cache_status=None if key is None else "miss",
+            )
+            if stream:
+                # Parsers take the whole body, only callers of `_request`
+                # iterate over the chunks of a streamed one.
+                async with response:
+                    await response.read()
+            if key is not None:
+                self._set_cache_entry(key, ttl, response)
+            with tracing.start_span("herepy.parse"):
+                return parse(response)
+
+        if self._single_flight is None or method != "GET":
+            return await fetch()
+        return await self._single_flight.do_async((method, url), fetch)
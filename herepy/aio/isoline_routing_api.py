@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.isoline_routing_api import IsolineRoutingApi
+
+
+class AsyncIsolineRoutingApi(AsyncHEREApi, IsolineRoutingApi):
+    """An asyncio interface into the HERE Isoline Routing API.
+
+    Accepts the same arguments as `IsolineRoutingApi`, methods return awaitables.
+    """
@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.map_image_api import MapImageApi
+
+
+class AsyncMapImageApi(AsyncHEREApi, MapImageApi):
+    """An asyncio interface into the HERE Map Image API.
+
+    Accepts the same arguments as `MapImageApi`, methods return awaitables.
+    """
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+import functools
+from typing import AsyncIterator, Iterable, List, Tuple, Union
+
+from herepy import tile_prefetch
+from herepy.aio import tile_prefetch as async_tile_prefetch
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.error import HEREError
+from herepy.map_tile_api import MapTileApi
+
+
+class AsyncMapTileApi(AsyncHEREApi, MapTileApi):
+    """An asyncio interface into the HERE Map Tile API.
+
+    Accepts the same arguments as `MapTileApi`, methods return awaitables.
+    """
+
+    async def get_maptiles_in_bbox(
+        self,
+        top_left: List[float],
+        bottom_right: List[float],
+        zooms: Iterable[int],
+        max_concurrency: int = 64,
+        skip_stored: bool = False,
+        **kwargs
+    ) -> AsyncIterator[Tuple[int, int, int, Union[bytes, HEREError]]]:
+        """Downloads every map tile covering a bounding box at the given zoom levels,
+        at most `max_concurrency` at a time. Takes the same arguments as
+        `MapTileApi.get_maptiles_in_bbox`.
+        Returns:
+          Async iterator of zoom, column, row and the map tile as bytes, or the
+          HEREError raised for that tile, in the order the tiles arrive.
+        """
+
+        async for tile in async_tile_prefetch.download_tiles(
+            self._get_tiles_in_bbox(top_left, bottom_right, zooms, skip_stored),
+            functools.partial(self._get_indexed_tile, **kwargs),
+            max_concurrency,
+        ):
+            yield tile
+
+    async def get_maptiles_along_route(
+        self,
+        route: tile_prefetch.Route,
+        zooms: Iterable[int],
+        buffer: float = 250.0,
+        max_concurrency: int = 64,
+        skip_stored: bool = False,
+        **kwargs
+    ) -> AsyncIterator[Tuple[int, int, int, Union[bytes, HEREError]]]:
+        """Downloads every map tile within a distance of a route at the given zoom
+        levels, at most `max_concurrency` at a time. Takes the same arguments as
+        `MapTileApi.get_maptiles_along_route`.
+        Returns:
+          Async iterator of zoom, column, row and the map tile as bytes, or the
+          HEREError raised for that tile, in the order the tiles arrive.
+        """
+
+        tiles = tile_prefetch.get_tiles_along_route(route, zooms, buffer)
+        if skip_stored:
+            tiles = tile_prefetch.skip_stored(tiles, self._tile_store)
+        async for tile in async_tile_prefetch.download_tiles(
+            tiles, functools.partial(self._get_indexed_tile, **kwargs), max_concurrency
+        ):
+            yield tile
@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.places_api import PlacesApi
+
+
+class AsyncPlacesApi(AsyncHEREApi, PlacesApi):
+    """An asyncio interface into the HERE Places API.
+
+    Accepts the same arguments as `PlacesApi`, methods return awaitables.
+    """
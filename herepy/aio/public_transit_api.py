@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.public_transit_api import PublicTransitApi
+
+
+class AsyncPublicTransitApi(AsyncHEREApi, PublicTransitApi):
+    """An asyncio interface into the HERE Public Transit API.
+
+    Accepts the same arguments as `PublicTransitApi`, methods return awaitables.
+    """
@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.rme_api import RmeApi
+
+
+class AsyncRmeApi(AsyncHEREApi, RmeApi):
+    """An asyncio interface into the HERE Route Matcher API.
+
+    Accepts the same arguments as `RmeApi`, methods return awaitables.
+    """
@@ -0,0 +1,358 @@
+#!/usr/bin/env python
+
+import asyncio
+from typing import BinaryIO, Dict, Iterable, List, Optional, Union
+
+import requests
+
+from herepy.aio.geocoder_api import AsyncGeocoderApi
+from herepy.aio.here_api import AsyncHEREApi, aiohttp
+from herepy.error import HEREError
+from herepy.here_enum import RoutingTransportMode
+from herepy.jobs import Job
+from herepy.matrix_result import Decompressor, MatrixResultParser
+from herepy.models import RoutingMatrixResponse, RoutingResponseV8
+from herepy.routing_api import (
+    DownloadedMatrixResult,
+    RoutingApi,
+    WaypointNotFoundError,
+)
+from herepy.utils import Utils
+
+
+class AsyncRoutingApi(AsyncHEREApi, RoutingApi):
+    """An asyncio interface into the HERE Routing API.
+
+    Accepts the same arguments as `RoutingApi`, methods return awaitables.
+    Location names given as waypoints are geocoded concurrently before the
+    routing request is sent.
+    """
+
+    async def _get_coordinates_for_location_name(
+        self, location_name: str
+    ) -> List[float]:
+        """Use the Geocoder API to resolve a location name to a set of coordinates.
+        Coordinates are looked up in the geocoding cache first."""
+
+        coordinates = self._geocoding_cache.get(location_name)
+        if coordinates is not None:
+            return coordinates
+        options = self._get_transport_options()
+        if (
+            self._geocoder_api is None
+            or self._geocoder_api.session is not options["session"]
+        ):
+            self._geocoder_api = AsyncGeocoderApi(
+                self._api_key, self._timeout, **options
+            )
+        try:
+            geocoder_response = await self._geocoder_api.free_form(location_name)
+        except HEREError as here_error:
+            raise WaypointNotFoundError(here_error.message)
+        if not geocoder_response.items:
+            raise WaypointNotFoundError(
+                str.format("No location found for {0}", location_name)
+            )
+        position = geocoder_response.items[0]["position"]
+        coordinates = [position["lat"], position["lng"]]
+        self._geocoding_cache.set(location_name, coordinates)
+        return coordinates
+
+    async def _resolve_waypoints(
+        self, waypoints: List[Union[List[float], str]]
+    ) -> List[List[float]]:
+        """Replace location names in `waypoints` with their coordinates, geocoding
+        every distinct name once and up to `geocoding_workers` names at a time."""
+
+        names = list(
+            dict.fromkeys(
+                waypoint for waypoint in waypoints if isinstance(waypoint, str)
+            )
+        )
+        if not names:
+            return waypoints
+        semaphore = asyncio.Semaphore(self._geocoding_workers)
+
+        async def resolve(name):
+            async with semaphore:
+                return await self._get_coordinates_for_location_name(name)
+
+        results = await asyncio.gather(
+            *[resolve(name) for name in names], return_exceptions=True
+        )
+        errors = {}
+        for name, result in zip(names, results):
+            if isinstance(result, HEREError):
+                errors[name] = result
+            elif isinstance(result, BaseException):
+                raise result
+        if errors:
+            raise self._get_waypoints_not_found_error(errors)
+        resolved = dict(zip(names, results))
+        return [
+            resolved[waypoint] if isinstance(waypoint, str) else waypoint
+            for waypoint in waypoints
+        ]
+
+    async def _resolve_matrix_waypoints(
+        self,
+        origins: List[Union[List[float], str]],
+        destinations: List[Union[List[float], str]],
+    ):
+        """Resolve the location names of a matrix, names used both as origin
+        and destination are geocoded once."""
+
+        waypoints = await self._resolve_waypoints(list(origins) + list(destinations))
+        return waypoints[: len(origins)], waypoints[len(origins) :]
+
+    async def _route(
+        self, waypoint_a, waypoint_b, modes=None, departure=None, arrival=None
+    ):
+        waypoint_a, waypoint_b = await self._resolve_waypoints([waypoint_a, waypoint_b])
+        return await super(AsyncRoutingApi, self)._route(
+            waypoint_a, waypoint_b, modes, departure, arrival
+        )
+
+    async def route_v8(
+        self,
+        transport_mode: RoutingTransportMode,
+        origin: Union[List[float], str],
+        destination: Union[List[float], str],
+        *args,
+        **kwargs
+    ) -> RoutingResponseV8:
+        """Calculates the route between given origin and destination.
+        Takes the same arguments as `RoutingApi.route_v8`.
+        Returns:
+          RoutingResponseV8
+        Raises:
+          HEREError
+        """
+
+        origin, destination = await self._resolve_waypoints([origin, destination])
+        return await super(AsyncRoutingApi, self).route_v8(
+            transport_mode, origin, destination, *args, **kwargs
+        )
+
+    async def route_v8_batch(
+        self, route_specs: Iterable[Dict], max_concurrency: int = 64, **kwargs
+    ) -> List[Union[RoutingResponseV8, HEREError]]:
+        """Calculates many routes concurrently, at most `max_concurrency` at a time.
+        Args:
+          route_specs (Iterable[Dict]):
+            Keyword arguments of `route_v8` for every route.
+          max_concurrency (int):
+            Maximum number of routes in flight at the same time.
+          **kwargs:
+            `route_v8` arguments shared by every route, values given in a
+            route spec take precedence.
+        Returns:
+          List with one item per route spec in input order, either the
+          RoutingResponseV8 or the HEREError raised for that route.
+        """
+
+        route_specs = enumerate(route_specs)
+        results = {}
+
+        async def worker():
+            for index, route_spec in route_specs:
+                try:
+                    results[index] = await self.route_v8(**dict(kwargs, **route_spec))
+                except HEREError as here_error:
+                    results[index] = here_error
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exception:
+                    results[index] = HEREError(str(exception) or repr(exception))
+
+        await asyncio.gather(*[worker() for _ in range(max_concurrency)])
+        return [results[index] for index in range(len(results))]
+
+    async def sync_matrix(
+        self,
+        origins: List[Union[List[float], str]],
+        destinations: List[Union[List[float], str]],
+        *args,
+        max_origins_per_request: Optional[int] = None,
+        max_destinations_per_request: Optional[int] = None,
+        max_workers: int = 4,
+        **kwargs
+    ) -> RoutingMatrixResponse:
+        """Sync request a matrix of route summaries between M starts and N destinations.
+        Takes the same arguments as `RoutingApi.sync_matrix`, sub-matrices of large
+        matrices are calculated concurrently, at most `max_workers` at a time.
+        Returns:
+          RoutingMatrixResponse
+        Raises:
+          HEREError: If an error is received from the server.
+        """
+
+        origins, destinations = await self._resolve_matrix_waypoints(
+            origins, destinations
+        )
+        tiles = self._get_matrix_tiles(
+            len(origins),
+            len(destinations),
+            max_origins_per_request,
+            max_destinations_per_request,
+        )
+        if len(tiles) == 1:
+            return await super(AsyncRoutingApi, self).sync_matrix(
+                origins, destinations, *args, **kwargs
+            )
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def calculate(tile):
+            origin_start, origin_end, destination_start, destination_end = tile
+            async with semaphore:
+                return await super(AsyncRoutingApi, self).sync_matrix(
+                    origins[origin_start:origin_end],
+                    destinations[destination_start:destination_end],
+                    *args,
+                    **kwargs
+                )
+
+        tile_responses = await asyncio.gather(*[calculate(tile) for tile in tiles])
+        return self._stitch_matrix_responses(
+            len(origins), len(destinations), tiles, tile_responses
+        )
+
+    async def submit_async_matrix(
+        self,
+        token: str,
+        origins: List[Union[List[float], str]],
+        destinations: List[Union[List[float], str]],
+        poll_step: float = 1.0,
+        max_poll_step: float = 30.0,
+        result_file: Optional[Union[str, BinaryIO]] = None,
+        **kwargs
+    ) -> Job:
+        """Submits an async matrix calculation and returns without waiting for it.
+        Takes the same arguments as `RoutingApi.submit_async_matrix`.
+        Returns:
+          Job resolving to a RoutingMatrixResponse when awaited.
+        Raises:
+          HEREError: If the service did not accept the calculation.
+        """
+
+        origins, destinations = await self._resolve_matrix_waypoints(
+            origins, destinations
+        )
+        request_body = self._prepare_matrix_request_body(
+            origins=origins, destinations=destinations, **kwargs
+        )
+        url = Utils.build_url(self.URL_CALCULATE_MATRIX, extra_params={})
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": str.format("Bearer {0}", token),
+        }
+        response = await self._request(
+            "POST", url, headers=headers, json=request_body, service="matrix"
+        )
+        status_headers = {"Authorization": str.format("Bearer {0}", token)}
+
+        async def request_status(status_url):
+            status_response = await self._request(
+                "GET",
+                status_url,
+                headers=status_headers,
+                service="matrix",
+                allow_redirects=False,
+            )
+            result_url = self._get_matrix_result_url(status_response)
+            if result_url is None:
+                return status_response
+            return DownloadedMatrixResult(
+                await self.download_matrix_result(token, result_url, result_file)
+            )
+
+        return self._create_matrix_job(
+            response, request_status, poll_step, max_poll_step
+        )
+
+    async def async_matrix(
+        self,
+        token: str,
+        origins: List[Union[List[float], str]],
+        destinations: List[Union[List[float], str]],
+        poll_step: float = 1.0,
+        max_poll_step: float = 30.0,
+        result_file: Optional[Union[str, BinaryIO]] = None,
+        **kwargs
+    ) -> RoutingMatrixResponse:
+        """Async request a matrix of route summaries between M starts and N destinations.
+        Polls the calculation status without blocking the event loop.
+        Args:
+          token (str):
+            Bearer token required for async calls.
+          origins (List):
+            List of lists of coordinates [lat,long] of start waypoints.
+            or list of string with the location names.
+          destinations (List):
+            List of lists of coordinates [lat,long] of destination waypoints.
+            or list of string with the location names.
+          poll_step (float):
+            Seconds between the first status requests, grows up to `max_poll_step`.
+          max_poll_step (float):
+            Maximum seconds between two status requests.
+          result_file (Optional[Union[str, BinaryIO]]):
+            Path or binary file object the result is written to instead of
+            being parsed.
+          **kwargs:
+            Matrix options of `RoutingApi.async_matrix`, e.g. `matrix_type`.
+        Returns:
+          RoutingMatrixResponse, or `result_file` once the result was written to it.
+        Raises:
+          HEREError: If an error is received from the server.
+        """
+
+        job = await self.submit_async_matrix(
+            token,
+            origins,
+            destinations,
+            poll_step,
+            max_poll_step,
+            result_file=result_file,
+            **kwargs
+        )
+        return await job
+
+    async def download_matrix_result(
+        self,
+        token: str,
+        result_url: str,
+        result_file: Optional[Union[str, BinaryIO]] = None,
+        chunk_size: int = 65536,
+    ) -> Union[RoutingMatrixResponse, str, BinaryIO]:
+        """Downloads the result of an async matrix calculation as a stream.
+        Takes the same arguments as `RoutingApi.download_matrix_result`,
+        writes to `result_file` block the event loop for the time of a write.
+        Returns:
+          RoutingMatrixResponse, or `result_file` once the result was written to it.
+        Raises:
+          HEREError: If the result could not be downloaded or parsed.
+        """
+
+        headers = {"Authorization": str.format("Bearer {0}", token)}
+        async with await self._request(
+            "GET", result_url, headers=headers, stream=True, service="matrix"
+        ) as response:
+            if response.status_code != requests.codes.OK:
+                raise self._get_matrix_result_error(
+                    response.status_code, await response.read()
+                )
+            decompressor = Decompressor()
+            if result_file is None:
+                parser = MatrixResultParser()
+                async for chunk in response.iter_content(chunk_size):
+                    parser.feed(decompressor.decompress(chunk))
+                parser.feed(decompressor.flush())
+                return RoutingMatrixResponse.new_from_jsondict(parser.close())
+            f = open(result_file, "wb") if isinstance(result_file, str) else result_file
+            try:
+                async for chunk in response.iter_content(chunk_size):
+                    f.write(decompressor.decompress(chunk))
+                f.write(decompressor.flush())
+            finally:
+                if f is not result_file:
+                    f.close()
+        return result_file
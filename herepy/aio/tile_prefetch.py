@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional, Tuple, Union
+
+from herepy.aio.here_api import aiohttp
+from herepy.error import HEREError
+
+
+async def download_tiles(
+    tiles: Iterable[Tuple[int, int, int]],
+    get_tile: Callable[[int, int, int, int], Awaitable[Optional[bytes]]],
+    max_concurrency: int = 64,
+) -> AsyncIterator[Tuple[int, int, int, Union[bytes, HEREError]]]:
+    """Downloads tiles at most `max_concurrency` at a time, see
+    `herepy.tile_prefetch.download_tiles`.
+    Returns:
+      Async iterator of zoom, column, row and the tile as bytes, or the
+      HEREError raised for that tile, in the order the tiles arrive.
+    """
+
+    async def fetch(index, zoom, column, row):
+        try:
+            tile = await get_tile(index, zoom, column, row)
+        except HEREError as here_error:
+            tile = here_error
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exception:
+            tile = HEREError(str(exception) or repr(exception))
+        return zoom, column, row, tile
+
+    pending = set()
+    try:
+        for index, (zoom, column, row) in enumerate(tiles):
+            if len(pending) >= max_concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+            pending.add(asyncio.ensure_future(fetch(index, zoom, column, row)))
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
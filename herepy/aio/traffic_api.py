@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.traffic_api import TrafficApi
+
+
+class AsyncTrafficApi(AsyncHEREApi, TrafficApi):
+    """An asyncio interface into the HERE Traffic API.
+
+    Accepts the same arguments as `TrafficApi`, methods return awaitables.
+    """
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+
+import functools
+from typing import AsyncIterator, Iterable, Tuple, Union
+
+from herepy import tile_prefetch
+from herepy.aio import tile_prefetch as async_tile_prefetch
+from herepy.aio.here_api import AsyncHEREApi
+from herepy.error import HEREError
+from herepy.vector_tile_api import VectorTileApi
+
+
+class AsyncVectorTileApi(AsyncHEREApi, VectorTileApi):
+    """An asyncio interface into the HERE Vector Tile API.
+
+    Accepts the same arguments as `VectorTileApi`, methods return awaitables.
+    """
+
+    async def get_vectortiles_along_route(
+        self,
+        route: tile_prefetch.Route,
+        zooms: Iterable[int],
+        buffer: float = 250.0,
+        max_concurrency: int = 64,
+        skip_stored: bool = False,
+        **kwargs
+    ) -> AsyncIterator[Tuple[int, int, int, Union[bytes, HEREError]]]:
+        """Downloads every vector tile within a distance of a route at the given
+        zoom levels, at most `max_concurrency` at a time. Takes the same arguments
+        as `VectorTileApi.get_vectortiles_along_route`.
+        Returns:
+          Async iterator of zoom, column, row and the vector tile as bytes, or the
+          HEREError raised for that tile, in the order the tiles arrive.
+        """
+
+        tiles = tile_prefetch.get_tiles_along_route(route, zooms, buffer)
+        if skip_stored:
+            tiles = tile_prefetch.skip_stored(tiles, self._tile_store)
+        async for tile in async_tile_prefetch.download_tiles(
+            tiles, functools.partial(self._get_indexed_tile, **kwargs), max_concurrency
+        ):
+            yield tile
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+
+import collections
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Hashable, Optional
+
+
+class LRUCache(object):
+    """Thread safe in-memory cache bounded by size, evicting the least recently
+    used entry first, with an optional time to live per entry.
+
+    Wrappers accept any object providing the same `get` and `set` methods,
+    so other storages can be plugged in.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        """Returns a LRUCache instance.
+        Args:
+          maxsize (int):
+            Maximum number of entries kept.
+          ttl (Optional[float]):
+            Seconds an entry stays valid, entries never expire if not given.
+        """
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value cached for `key`, `default` if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Caches `value` for `key`.
+        Args:
+          key (Hashable):
+            Key of the entry.
+          value (Any):
+            Value of the entry.
+          ttl (Optional[float]):
+            Seconds the entry stays valid, overrides the ttl of the cache.
+        """
+
+        ttl = self._ttl if ttl is None else ttl
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        """Removes the entry of `key` if there is one."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Removes every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(object):
+    """Cache persisted in a SQLite database, so entries survive the process and can
+    be shared by several processes. Bounded by size, evicting the least recently
+    used entry first, with an optional time to live per entry.
+
+    Values are stored pickled, only use databases written by herepy.
+    """
+
+    def __init__(
+        self, path: str, maxsize: Optional[int] = None, ttl: Optional[float] = None
+    ):
+        """Returns a SQLiteCache instance.
+        Args:
+          path (str):
+            Path of the database file, created if missing.
+          maxsize (Optional[int]):
+            Maximum number of entries kept, unbounded if not given.
+          ttl (Optional[float]):
+            Seconds an entry stays valid, entries never expire if not given.
+        """
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB, expires_at REAL, accessed_at REAL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)"
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the value cached for `key`, `default` if it is missing or expired."""
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return default
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return default
+            self._connection.execute(
+                "UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return pickle.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Caches `value` for `key`.
+        Args:
+          key (str):
+            Key of the entry.
+          value (Any):
+            Picklable value of the entry.
+          ttl (Optional[float]):
+            Seconds the entry stays valid, overrides the ttl of the cache.
+        """
+
+        now = time.time()
+        ttl = self._ttl if ttl is None else ttl
+        expires_at = None if ttl is None else now + ttl
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                (key, data, expires_at, now),
+            )
+            if self._maxsize is not None:
+                self._connection.execute(
+                    "DELETE FROM cache WHERE key IN (SELECT key FROM cache "
+                    "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self._maxsize,),
+                )
+
+    def delete(self, key: str):
+        """Removes the entry of `key` if there is one."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self):
+        """Removes every entry."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cache")
+
+    def close(self):
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
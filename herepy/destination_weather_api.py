@@ -1,11 +1,7 @@
 #!/usr/bin/env python
 
-import json
-import sys
 from typing import Optional
 
-import requests
-
 from herepy.error import HEREError, InvalidRequestError, UnauthorizedError
 from herepy.here_api import HEREApi
 from herepy.here_enum import WeatherProductType
@@ -16,38 +12,46 @@ from herepy.utils import Utils
 class DestinationWeatherApi(HEREApi):
     """A python interface into the HERE Destination Weather API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "weather"
+
+    def __init__(self, api_key: str = None, timeout: int = None, **kwargs):
         """Returns a DestinationWeatherApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(DestinationWeatherApi, self).__init__(api_key, timeout)
+        super(DestinationWeatherApi, self).__init__(api_key, timeout, **kwargs)
         self._base_url = "https://weather.cc.api.here.com/weather/1.0/report.json"
 
-    def _get(self, data, product):
+    def _get(self, data, product, function_name):
         url = Utils.build_url(self._base_url, extra_params=data)
-        response = requests.get(url, timeout=self._timeout)
-        json_data = json.loads(response.content.decode("utf8"))
+        return self._send(
+            "GET",
+            url,
+            lambda response: self._parse_response(response, product, function_name),
+        )
+
+    def _parse_response(self, response, product, function_name):
+        json_data = self._decode_json(response)
         if json_data.get(self._product_node(product)) != None:
             return DestinationWeatherResponse.new_from_jsondict(
                 json_data, param_defaults={self._product_node(product): None}
             )
         else:
-            error = self._get_error_from_response(json_data)
+            error = self._get_error_from_response(json_data, function_name)
             raise error
 
-    def _get_error_from_response(self, json_data):
+    def _get_error_from_response(self, json_data, function_name):
         if "error" in json_data:
             if json_data["error"] == "Unauthorized":
                 return UnauthorizedError(json_data["error_description"])
         error_type = json_data.get("Type")
-        error_message = json_data.get(
-            "Message", "Error occurred on " + sys._getframe(1).f_code.co_name
-        )
+        error_message = json_data.get("Message", "Error occurred on " + function_name)
         if error_type == "Invalid Request":
             return InvalidRequestError(error_message)
         else:
@@ -99,7 +103,7 @@ class DestinationWeatherApi(HEREApi):
             "metric": "true" if metric == True else "false",
             "name": location_name,
         }
-        return self._get(data, product)
+        return self._get(data, product, "weather_for_location_name")
 
     def weather_for_zip_code(
         self,
@@ -131,7 +135,7 @@ class DestinationWeatherApi(HEREApi):
             "metric": "true" if metric == True else "false",
             "zipcode": zip_code,
         }
-        return self._get(data, product)
+        return self._get(data, product, "weather_for_zip_code")
 
     def weather_for_coordinates(
         self,
@@ -167,4 +171,4 @@ class DestinationWeatherApi(HEREApi):
             "latitude": latitude,
             "longitude": longitude,
         }
-        return self._get(data, product)
+        return self._get(data, product, "weather_for_coordinates")
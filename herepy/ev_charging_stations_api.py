@@ -1,44 +1,49 @@
 #!/usr/bin/env python
 
-import json
-import sys
 from typing import List, Optional
 
-import requests
-
 from herepy.error import HEREError
+from herepy.here_api import HEREApi
 from herepy.here_enum import EVStationConnectorTypes
 from herepy.models import EVChargingStationsResponse
 from herepy.utils import Utils
 
 
-class EVChargingStationsApi:
+class EVChargingStationsApi(HEREApi):
     """A python interface into the HERE EV Charging Stations API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "ev_charging"
+
+    def __init__(self, api_key: str = None, timeout: int = None, **kwargs):
         """Returns a EVChargingStationsApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        self._api_key = api_key
-        if timeout:
-            self._timeout = timeout
-        else:
-            self._timeout = 20
+        super(EVChargingStationsApi, self).__init__(api_key, timeout, **kwargs)
         self._base_url = "https://ev-v2.cit.cc.api.here.com/ev/"
 
-    def __get(self, base_url, data, response_cls):
+    def __get(self, base_url, data, response_cls, function_name):
         url = Utils.build_url(base_url, extra_params=data)
-        response = requests.get(url, timeout=self._timeout)
-        json_data = json.loads(response.content.decode("utf8"))
+        return self._send(
+            "GET",
+            url,
+            lambda response: self.__parse_response(
+                response, response_cls, function_name
+            ),
+        )
+
+    def __parse_response(self, response, response_cls, function_name):
+        json_data = self._decode_json(response)
         if json_data.get("evStations") is not None:
             return response_cls.new_from_jsondict(json_data)
         else:
-            raise error_from_ev_charging_service_error(json_data)
+            raise error_from_ev_charging_service_error(json_data, function_name)
 
     def __connector_types_str(self, connector_types: List[EVStationConnectorTypes]):
         connector_types_str = ""
@@ -107,7 +112,10 @@ class EVChargingStationsApi:
                 "offset": offset,
             }
         response = self.__get(
-            self._base_url + "stations.json", data, EVChargingStationsResponse
+            self._base_url + "stations.json",
+            data,
+            EVChargingStationsResponse,
+            "get_stations_circular_search",
         )
         return response
 
@@ -169,7 +177,10 @@ class EVChargingStationsApi:
                 "offset": offset,
             }
         response = self.__get(
-            self._base_url + "stations.json", data, EVChargingStationsResponse
+            self._base_url + "stations.json",
+            data,
+            EVChargingStationsResponse,
+            "get_stations_bounding_box",
         )
         return response
 
@@ -216,7 +227,10 @@ class EVChargingStationsApi:
                 "offset": offset,
             }
         response = self.__get(
-            self._base_url + "stations.json", data, EVChargingStationsResponse
+            self._base_url + "stations.json",
+            data,
+            EVChargingStationsResponse,
+            "get_stations_corridor",
         )
         return response
 
@@ -242,7 +256,9 @@ class EVChargingStationsApi:
 
         data = {"apiKey": self._api_key, "maxresults": maxresults, "offset": offset}
         url = self._base_url + "stations/" + station_id + ".json"
-        response = self.__get(url, data, EVChargingStationsResponse)
+        response = self.__get(
+            url, data, EVChargingStationsResponse, "get_station_details"
+        )
         return response
 
 
@@ -256,7 +272,7 @@ class UnauthorizedError(HEREError):
 
 
 # pylint: disable=R0911
-def error_from_ev_charging_service_error(json_data: dict):
+def error_from_ev_charging_service_error(json_data: dict, function_name: str):
     """Return the correct subclass for ev charging errors"""
 
     if "Type" in json_data:
@@ -272,5 +288,4 @@ def error_from_ev_charging_service_error(json_data: dict):
             + ", description: "
             + json_data["error_description"]
         )
-    # pylint: disable=W0212
-    return HEREError("Error occurred on " + sys._getframe(1).f_code.co_name)
+    return HEREError("Error occurred on " + function_name)
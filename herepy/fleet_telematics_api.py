@@ -1,11 +1,7 @@
 #!/usr/bin/env python
 
-import json
-import sys
 from typing import List, Optional
 
-import requests
-
 from herepy.error import HEREError
 from herepy.here_api import HEREApi
 from herepy.here_enum import MultiplePickupOfferType, RouteMode
@@ -16,18 +12,22 @@ from herepy.utils import Utils
 class FleetTelematicsApi(HEREApi):
     """A python interface into the HERE Fleet Telematics API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "fleet_telematics"
+
+    def __init__(self, api_key: str = None, timeout: int = None, **kwargs):
         """Returns a FleetTelematicsApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         Returns:
           FleetTelematicsApi instance.
         """
 
-        super(FleetTelematicsApi, self).__init__(api_key, timeout)
+        super(FleetTelematicsApi, self).__init__(api_key, timeout, **kwargs)
         self._base_url = "https://wse.ls.hereapi.com/2/"
 
     def __create_find_sequence_parameters(
@@ -98,14 +98,22 @@ class FleetTelematicsApi(HEREApi):
         data["end"] = str.format("waypoint{0};{1}", count + 1, end)
         return data
 
-    def __get(self, base_url, data, response_cls):
+    def __get(self, base_url, data, response_cls, function_name):
         url = Utils.build_url(base_url, extra_params=data)
-        response = requests.get(url, timeout=self._timeout)
-        json_data = json.loads(response.content.decode("utf8"))
+        return self._send(
+            "GET",
+            url,
+            lambda response: self.__parse_response(
+                response, response_cls, function_name
+            ),
+        )
+
+    def __parse_response(self, response, response_cls, function_name):
+        json_data = self._decode_json(response)
         if json_data.get("results") is not None:
             return response_cls.new_from_jsondict(json_data)
         else:
-            raise error_from_fleet_telematics_service_error(json_data)
+            raise error_from_fleet_telematics_service_error(json_data, function_name)
 
     def find_sequence(
         self,
@@ -141,7 +149,10 @@ class FleetTelematicsApi(HEREApi):
             modes=modes,
         )
         response = self.__get(
-            self._base_url + "findsequence.json", data, WaypointSequenceResponse
+            self._base_url + "findsequence.json",
+            data,
+            WaypointSequenceResponse,
+            "find_sequence",
         )
         return response
 
@@ -216,7 +227,10 @@ class FleetTelematicsApi(HEREApi):
             end=end,
         )
         response = self.__get(
-            self._base_url + "findpickups.json", data, WaypointSequenceResponse
+            self._base_url + "findpickups.json",
+            data,
+            WaypointSequenceResponse,
+            "find_pickups",
         )
         return response
 
@@ -229,7 +243,7 @@ class UnauthorizedError(HEREError):
     """
 
 
-def error_from_fleet_telematics_service_error(json_data: dict):
+def error_from_fleet_telematics_service_error(json_data: dict, function_name: str):
     """Return the correct subclass for sequence errors"""
 
     if "error" in json_data:
@@ -238,5 +252,4 @@ def error_from_fleet_telematics_service_error(json_data: dict):
 
         if error_type == "Unauthorized":
             return UnauthorizedError(message)
-    # pylint: disable=W0212
-    return HEREError("Error occurred on " + sys._getframe(1).f_code.co_name)
+    return HEREError("Error occurred on " + function_name)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+
+import itertools
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from herepy.error import HEREError
+from herepy.here_enum import PolylineThirdDimension
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+ENCODING_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+FORMAT_VERSION = 1
+
+_DECODING_TABLE = bytearray(b"\xff" * 256)
+for _index, _char in enumerate(ENCODING_CHARS.encode("ascii")):
+    _DECODING_TABLE[_char] = _index
+_DECODING_TABLE = bytes(_DECODING_TABLE)
+_CHUNKS = bytes(range(0x40))
+_CONTINUATION_CHUNKS = bytes(range(0x20, 0x40))
+
+
+class FlexiblePolyline(object):
+    """Decoder and encoder of the flexible polyline format used by the Routing API v8
+    for the shape of route sections.
+
+    Decoded polylines are returned as a NumPy array of shape (points, dimensions)
+    when NumPy is installed, otherwise as a flat `array("d")` holding lat, lng and
+    the optional third value of every point one after the other.
+    """
+
+    @staticmethod
+    def _to_chunks(encoded: Union[str, bytes]) -> bytes:
+        """Maps every character of `encoded` to its 6 bit value."""
+        if isinstance(encoded, str):
+            try:
+                encoded = encoded.encode("ascii")
+            except UnicodeEncodeError:
+                raise HEREError("Invalid flexible polyline, non ASCII character found")
+        chunks = encoded.translate(_DECODING_TABLE)
+        if not chunks or chunks.translate(None, _CHUNKS):
+            raise HEREError("Invalid flexible polyline, unexpected character found")
+        if chunks[-1] & 0x20:
+            raise HEREError("Invalid flexible polyline, last value is incomplete")
+        return chunks
+
+    @staticmethod
+    def _decode_values(chunks: bytes) -> List[int]:
+        values = []
+        append = values.append
+        value = shift = 0
+        for chunk in chunks:
+            value |= (chunk & 0x1F) << shift
+            if chunk < 0x20:
+                append(value)
+                value = shift = 0
+            else:
+                shift += 5
+        return values
+
+    @staticmethod
+    def _decode_values_numpy(chunks: bytes) -> "numpy.ndarray":
+        chunks = numpy.frombuffer(chunks, dtype=numpy.uint8)
+        ends = numpy.flatnonzero(chunks < 0x20)
+        starts = numpy.empty_like(ends)
+        starts[0] = 0
+        starts[1:] = ends[:-1] + 1
+        positions = numpy.arange(len(chunks)) - numpy.repeat(starts, ends - starts + 1)
+        values = (chunks & 0x1F).astype(numpy.int64) << (5 * positions)
+        return numpy.add.reduceat(values, starts)
+
+    @staticmethod
+    def _parse_header(version: int, header: int) -> Tuple[int, int, int]:
+        if version != FORMAT_VERSION:
+            raise HEREError("Invalid flexible polyline, unsupported format version")
+        return header & 15, (header >> 4) & 7, (header >> 7) & 15
+
+    @staticmethod
+    def get_header(encoded: str) -> Tuple[int, PolylineThirdDimension, int]:
+        """Returns precision, third dimension and third dimension precision of a polyline."""
+        # Version and header take at most four characters.
+        values = FlexiblePolyline._decode_values(
+            encoded[:4].encode("ascii").translate(_DECODING_TABLE)
+        )
+        if len(values) < 2:
+            raise HEREError("Invalid flexible polyline, header is missing")
+        precision, third_dim, third_dim_precision = FlexiblePolyline._parse_header(
+            values[0], values[1]
+        )
+        return precision, PolylineThirdDimension(third_dim), third_dim_precision
+
+    @staticmethod
+    def decode(
+        encoded: str, use_numpy: Optional[bool] = None
+    ) -> Union[array, "numpy.ndarray"]:
+        """Decodes a flexible polyline.
+        Args:
+          encoded (str):
+            Encoded polyline, e.g. the `polyline` of a Routing API v8 section.
+          use_numpy (Optional[bool]):
+            Whether to decode into a NumPy array, defaults to True if NumPy is installed.
+        Returns:
+          NumPy array of shape (points, 2) or (points, 3) with a third dimension,
+          or a flat `array("d")` of the same values without NumPy.
+        Raises:
+          HEREError: If the polyline is invalid.
+        """
+
+        return FlexiblePolyline.decode_many([encoded], use_numpy)[0]
+
+    @staticmethod
+    def decode_many(
+        encoded_polylines: Iterable[str], use_numpy: Optional[bool] = None
+    ) -> List[Union[array, "numpy.ndarray"]]:
+        """Decodes many flexible polylines at once. With NumPy the characters of all
+        polylines are decoded in a single vectorized pass.
+        Args:
+          encoded_polylines (Iterable[str]):
+            Encoded polylines.
+          use_numpy (Optional[bool]):
+            Whether to decode into NumPy arrays, defaults to True if NumPy is installed.
+        Returns:
+          List with the decoded coordinates of every polyline, see `decode`.
+        Raises:
+          HEREError: If a polyline is invalid.
+        """
+
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise HEREError("NumPy is required to decode polylines into NumPy arrays.")
+        chunks = [FlexiblePolyline._to_chunks(encoded) for encoded in encoded_polylines]
+        if not use_numpy:
+            return [
+                FlexiblePolyline._decode_chunks(polyline_chunks)
+                for polyline_chunks in chunks
+            ]
+        if not chunks:
+            return []
+        values = FlexiblePolyline._decode_values_numpy(b"".join(chunks))
+        # Every value ends with the only chunk of it without continuation bit.
+        offsets = numpy.cumsum(
+            [0]
+            + [
+                len(polyline_chunks.translate(None, _CONTINUATION_CHUNKS))
+                for polyline_chunks in chunks
+            ]
+        )
+        starts = offsets[:-1]
+        headers = values[numpy.minimum(starts + 1, len(values) - 1)]
+        if (
+            len(chunks) > 1
+            and (values[starts] == FORMAT_VERSION).all()
+            and (headers == headers[0]).all()
+            and (offsets[1:] - starts >= 2).all()
+        ):
+            return FlexiblePolyline._decode_numpy_batch(values, offsets)
+        return [
+            FlexiblePolyline._decode_numpy_polyline(values[start:end])
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+
+    @staticmethod
+    def _decode_numpy_batch(
+        values: "numpy.ndarray", offsets: "numpy.ndarray"
+    ) -> List["numpy.ndarray"]:
+        """Decodes polylines sharing the same header without looping over them."""
+
+        precision, third_dim, third_dim_precision = FlexiblePolyline._parse_header(
+            int(values[0]), int(values[1])
+        )
+        dimensions = 3 if third_dim else 2
+        sizes = offsets[1:] - offsets[:-1] - 2
+        if (sizes % dimensions).any():
+            raise HEREError("Invalid flexible polyline, incomplete coordinates")
+        is_header = numpy.zeros(len(values), dtype=bool)
+        is_header[offsets[:-1]] = True
+        is_header[offsets[:-1] + 1] = True
+        deltas = values[~is_header]
+        deltas = ((deltas >> 1) ^ -(deltas & 1)).reshape(-1, dimensions)
+        coordinates = numpy.cumsum(deltas, axis=0)
+        # Restart the running sum at the first point of every polyline.
+        points = sizes // dimensions
+        ends = numpy.cumsum(points)
+        previous = numpy.zeros((len(points), dimensions), dtype=coordinates.dtype)
+        has_previous = ends[:-1] > 0
+        previous[1:][has_previous] = coordinates[ends[:-1][has_previous] - 1]
+        coordinates -= numpy.repeat(previous, points, axis=0)
+        factors = [10.0**precision, 10.0**precision, 10.0**third_dim_precision]
+        coordinates = coordinates / numpy.array(factors[:dimensions])
+        return numpy.split(coordinates, ends[:-1])
+
+    @staticmethod
+    def _decode_chunks(chunks: bytes) -> array:
+        values = FlexiblePolyline._decode_values(chunks)
+        if len(values) < 2:
+            raise HEREError("Invalid flexible polyline, header is missing")
+        precision, third_dim, third_dim_precision = FlexiblePolyline._parse_header(
+            values[0], values[1]
+        )
+        dimensions = 3 if third_dim else 2
+        deltas = values[2:]
+        if len(deltas) % dimensions:
+            raise HEREError("Invalid flexible polyline, incomplete coordinates")
+        deltas = [(value >> 1) ^ -(value & 1) for value in deltas]
+        coordinates = array("d", bytes(8 * len(deltas)))
+        for dimension in range(dimensions):
+            factor = 10 ** (third_dim_precision if dimension == 2 else precision)
+            coordinates[dimension::dimensions] = array(
+                "d",
+                [
+                    value / factor
+                    for value in itertools.accumulate(deltas[dimension::dimensions])
+                ],
+            )
+        return coordinates
+
+    @staticmethod
+    def _decode_numpy_polyline(values: "numpy.ndarray") -> "numpy.ndarray":
+        if len(values) < 2:
+            raise HEREError("Invalid flexible polyline, header is missing")
+        precision, third_dim, third_dim_precision = FlexiblePolyline._parse_header(
+            int(values[0]), int(values[1])
+        )
+        dimensions = 3 if third_dim else 2
+        deltas = values[2:]
+        if len(deltas) % dimensions:
+            raise HEREError("Invalid flexible polyline, incomplete coordinates")
+        deltas = (deltas >> 1) ^ -(deltas & 1)
+        coordinates = numpy.cumsum(deltas.reshape(-1, dimensions), axis=0)
+        factors = [10.0**precision, 10.0**precision, 10.0**third_dim_precision]
+        return coordinates / numpy.array(factors[:dimensions])
+
+    @staticmethod
+    def encode(
+        coordinates: Iterable[Sequence[float]],
+        precision: int = 5,
+        third_dim: PolylineThirdDimension = PolylineThirdDimension.absent,
+        third_dim_precision: int = 0,
+    ) -> str:
+        """Encodes coordinates into a flexible polyline.
+        Args:
+          coordinates (Iterable[Sequence[float]]):
+            Points as (lat, lng) or (lat, lng, third value), a NumPy array of shape
+            (points, dimensions) works as well.
+          precision (int):
+            Number of decimals kept of latitudes and longitudes.
+          third_dim (PolylineThirdDimension):
+            Meaning of the third value of the points.
+          third_dim_precision (int):
+            Number of decimals kept of the third value.
+        Returns:
+          Encoded polyline.
+        """
+
+        if not 0 <= precision <= 15 or not 0 <= third_dim_precision <= 15:
+            raise HEREError("Precision must be between 0 and 15.")
+        dimensions = 2 if third_dim == PolylineThirdDimension.absent else 3
+        header = precision | third_dim.value << 4 | third_dim_precision << 7
+        output = []
+        FlexiblePolyline._encode_unsigned(FORMAT_VERSION, output)
+        FlexiblePolyline._encode_unsigned(header, output)
+        factors = [10**precision, 10**precision, 10**third_dim_precision]
+        last = [0, 0, 0]
+        for point in coordinates:
+            for dimension in range(dimensions):
+                value = point[dimension] * factors[dimension]
+                scaled = int(abs(value) + 0.5)
+                if value < 0:
+                    scaled = -scaled
+                delta = scaled - last[dimension]
+                last[dimension] = scaled
+                FlexiblePolyline._encode_unsigned(
+                    ~(delta << 1) if delta < 0 else delta << 1, output
+                )
+        return "".join(output)
+
+    @staticmethod
+    def _encode_unsigned(value: int, output: List[str]):
+        while value > 0x1F:
+            output.append(ENCODING_CHARS[(value & 0x1F) | 0x20])
+            value >>= 5
+        output.append(ENCODING_CHARS[value])
+
+    @staticmethod
+    def decode_routes(
+        routes: List[dict], use_numpy: Optional[bool] = None
+    ) -> List[List[Optional[Union[array, "numpy.ndarray"]]]]:
+        """Decodes the polylines of every section of every route in one batch.
+        Args:
+          routes (List[dict]):
+            `routes` of a RoutingResponseV8.
+          use_numpy (Optional[bool]):
+            Whether to decode into NumPy arrays, defaults to True if NumPy is installed.
+        Returns:
+          List per route with the decoded polyline of every section,
+          None for sections without polyline.
+        """
+
+        encoded_polylines = [
+            section["polyline"]
+            for route in routes
+            for section in route.get("sections", [])
+            if section.get("polyline")
+        ]
+        decoded = iter(FlexiblePolyline.decode_many(encoded_polylines, use_numpy))
+        return [
+            [
+                next(decoded) if section.get("polyline") else None
+                for section in route.get("sections", [])
+            ]
+            for route in routes
+        ]
@@ -1,11 +1,7 @@
 #!/usr/bin/env python
 
-import json
-import sys
 from typing import List, Optional
 
-import requests
-
 from herepy.error import HEREError, UnauthorizedError
 from herepy.here_api import HEREApi
 from herepy.models import GeocoderResponse
@@ -15,23 +11,31 @@ from herepy.utils import Utils
 class GeocoderApi(HEREApi):
     """A python interface into the HERE Geocoder API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "geocoding"
+
+    def __init__(self, api_key: str = None, timeout: int = None, **kwargs):
         """Returns a GeocoderApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(GeocoderApi, self).__init__(api_key, timeout)
+        super(GeocoderApi, self).__init__(api_key, timeout, **kwargs)
         self._base_url = "https://geocode.search.hereapi.com/v1/geocode"
 
-    def __get(self, data):
+    def __get(self, data, function_name):
         url = Utils.build_url(self._base_url, extra_params=data)
-        response = requests.get(url, timeout=self._timeout)
+        return self._send(
+            "GET", url, lambda response: self.__parse_response(response, function_name)
+        )
+
+    def __parse_response(self, response, function_name):
         try:
-            json_data = json.loads(response.content.decode("utf8"))
+            json_data = self._decode_json(response)
             if json_data.get("items") != None:
                 return GeocoderResponse.new_from_jsondict(json_data)
             elif json_data["error"] == "Unauthorized":
@@ -40,15 +44,12 @@ class GeocoderApi(HEREApi):
                 raise HEREError(
                     json_data.get(
                         "Details",
-                        "Error occurred on function " + sys._getframe(1).f_code.co_name,
+                        "Error occurred on function " + function_name,
                     )
                 )
         except ValueError as err:
             raise HEREError(
-                "Error occurred on function "
-                + sys._getframe(1).f_code.co_name
-                + " "
-                + str(err)
+                "Error occurred on function " + function_name + " " + str(err)
             )
 
     def free_form(
@@ -66,7 +67,7 @@ class GeocoderApi(HEREApi):
           HEREError"""
 
         data = {"q": searchtext, "apiKey": self._api_key, "lang": lang}
-        return self.__get(data)
+        return self.__get(data, "free_form")
 
     def address_with_boundingbox(
         self,
@@ -102,7 +103,7 @@ class GeocoderApi(HEREApi):
             "apiKey": self._api_key,
             "lang": lang,
         }
-        return self.__get(data)
+        return self.__get(data, "address_with_boundingbox")
 
     def address_with_details(
         self,
@@ -152,7 +153,7 @@ class GeocoderApi(HEREApi):
             "apiKey": self._api_key,
             "lang": lang,
         }
-        return self.__get(data)
+        return self.__get(data, "address_with_details")
 
     def street_intersection(
         self, street: str, city: str, lang: str = "en-US"
@@ -175,4 +176,4 @@ class GeocoderApi(HEREApi):
             "apiKey": self._api_key,
             "lang": lang,
         }
-        return self.__get(data)
+        return self.__get(data, "street_intersection")
@@ -1,11 +1,7 @@
 #!/usr/bin/env python
 
-import json
-import sys
 from typing import List, Optional
 
-import requests
-
 from herepy.error import HEREError
 from herepy.here_api import HEREApi
 from herepy.models import GeocoderAutoCompleteResponse
@@ -15,29 +11,37 @@ from herepy.utils import Utils
 class GeocoderAutoCompleteApi(HEREApi):
     """A python interface into the HERE Geocoder Auto Complete API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "geocoding"
+
+    def __init__(self, api_key: str = None, timeout: int = None, **kwargs):
         """Returns a GeocoderAutoCompleteApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(GeocoderAutoCompleteApi, self).__init__(api_key, timeout)
+        super(GeocoderAutoCompleteApi, self).__init__(api_key, timeout, **kwargs)
         self._base_url = "https://autocomplete.search.hereapi.com/v1/autocomplete"
 
-    def __get(self, data):
+    def __get(self, data, function_name):
         url = Utils.build_url(self._base_url, extra_params=data)
-        response = requests.get(url, timeout=self._timeout)
-        json_data = json.loads(response.content.decode("utf8"))
+        return self._send(
+            "GET", url, lambda response: self.__parse_response(response, function_name)
+        )
+
+    def __parse_response(self, response, function_name):
+        json_data = self._decode_json(response)
         if json_data.get("items") != None:
             return GeocoderAutoCompleteResponse.new_from_jsondict(json_data)
         else:
             raise HEREError(
                 json_data.get(
                     "error_description",
-                    "Error occurred on " + sys._getframe(1).f_code.co_name,
+                    "Error occurred on " + function_name,
                 )
             )
 
@@ -65,7 +69,7 @@ class GeocoderAutoCompleteApi(HEREApi):
             "apikey": self._api_key,
             "lang": lang,
         }
-        return self.__get(data)
+        return self.__get(data, "address_suggestion")
 
     def limit_results_byaddress(
         self, query: str, country_code: str, lang: str = "en-US"
@@ -89,4 +93,4 @@ class GeocoderAutoCompleteApi(HEREApi):
             "apikey": self._api_key,
             "lang": lang,
         }
-        return self.__get(data)
+        return self.__get(data, "limit_results_byaddress")
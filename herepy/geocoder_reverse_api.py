@@ -1,11 +1,7 @@
 #!/usr/bin/env python
 
-import json
-import sys
 from typing import List, Optional
 
-import requests
-
 from herepy.error import HEREError, UnauthorizedError
 from herepy.here_api import HEREApi
 from herepy.models import GeocoderReverseResponse
@@ -15,23 +11,31 @@ from herepy.utils import Utils
 class GeocoderReverseApi(HEREApi):
     """A python interface into the HERE Geocoder Reverse API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "geocoding"
+
+    def __init__(self, api_key: str = None, timeout: int = None, **kwargs):
         """Returns a GeocoderApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(GeocoderReverseApi, self).__init__(api_key, timeout)
+        super(GeocoderReverseApi, self).__init__(api_key, timeout, **kwargs)
         self._base_url = "https://revgeocode.search.hereapi.com/v1/revgeocode"
 
-    def __get(self, data):
+    def __get(self, data, function_name):
         url = Utils.build_url(self._base_url, extra_params=data)
-        response = requests.get(url, timeout=self._timeout)
+        return self._send(
+            "GET", url, lambda response: self.__parse_response(response, function_name)
+        )
+
+    def __parse_response(self, response, function_name):
         try:
-            json_data = json.loads(response.content.decode("utf8"))
+            json_data = self._decode_json(response)
             if json_data.get("items") != None:
                 return GeocoderReverseResponse.new_from_jsondict(json_data)
             elif "error" in json_data:
@@ -41,15 +45,12 @@ class GeocoderReverseApi(HEREApi):
                 raise HEREError(
                     json_data.get(
                         "Details",
-                        "Error occurred on function " + sys._getframe(1).f_code.co_name,
+                        "Error occurred on function " + function_name,
                     )
                 )
         except ValueError as err:
             raise HEREError(
-                "Error occurred on function "
-                + sys._getframe(1).f_code.co_name
-                + " "
-                + str(err)
+                "Error occurred on function " + function_name + " " + str(err)
             )
 
     def retrieve_addresses(
@@ -74,4 +75,4 @@ class GeocoderReverseApi(HEREApi):
             "lang": lang,
             "apiKey": self._api_key,
         }
-        return self.__get(data)
+        return self.__get(data, "retrieve_addresses")
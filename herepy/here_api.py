@@ -1,16 +1,110 @@
 #!/usr/bin/env python
 
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from herepy import tracing
+from herepy.instrumentation import Instrumentation, InstrumentedHTTPAdapter
+from herepy.json_decoder import get_json_decoder
+from herepy.rate_limit import RateLimiter
+from herepy.retry import RetryPolicy
+from herepy.single_flight import SingleFlight
+from herepy.utils import Utils
+
 
 class HEREApi(object):
-    """Base class from which all wrappers inherit."""
+    """Base class from which all wrappers inherit.
+
+    If OpenTelemetry is installed, each call of a public wrapper method runs in a
+    span, with child spans for its HTTP calls, which carry the W3C trace context
+    in their headers, and for parsing their responses, see `herepy.tracing`.
+    """
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = None
+    DEFAULT_CACHE_TTLS = {
+        "geocoding": 7 * 24 * 60 * 60,
+        "places": 24 * 60 * 60,
+        "isoline": 24 * 60 * 60,
+        "tiles": 24 * 60 * 60,
+        "map_image": 24 * 60 * 60,
+        "weather": 30 * 60,
+        "traffic": 30,
+        # Routes depend on the departure time and live traffic, they are only
+        # cached when a ttl is configured for routing explicitly.
+        "routing": 0,
+    }
+
+    _shared_session = None
+    _shared_session_lock = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs):
+        super(HEREApi, cls).__init_subclass__(**kwargs)
+        tracing.trace_methods(cls)
+
+    def __init__(
+        self,
+        api_key: str = None,
+        timeout: int = None,
+        session: Optional[requests.Session] = None,
+        cache: Optional[Any] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        json_decoder: Optional[Union[str, Callable[[bytes], Any]]] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
         """Returns a Api instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          session (Optional[requests.Session]):
+            Session used for every HTTP call of this instance. Keeps connections
+            alive between calls and can be shared by several wrapper instances.
+            Defaults to a process wide session created by `HEREApi.shared_session`.
+          cache (Optional[Any]):
+            Cache of successful GET responses, e.g. `herepy.cache.LRUCache` or
+            `herepy.cache.SQLiteCache`, any object with their `get` and `set`
+            methods can be used. Responses are not cached if not given. Entries
+            are keyed by `Utils.get_cache_key` on the method, url and body only,
+            request headers such as `Authorization` or `Accept-Language` are
+            ignored, so do not share a cache between wrappers whose headers
+            change the response.
+          cache_ttls (Optional[Dict[str, float]]):
+            Seconds responses stay cached per service, e.g. `{"geocoding": 86400}`,
+            merged into `DEFAULT_CACHE_TTLS`. Services mapped to 0 are not cached,
+            services missing use the ttl of the cache.
+          retry_policy (Optional[RetryPolicy]):
+            Policy deciding which failed requests are sent again, e.g.
+            `herepy.retry.RetryPolicy()` to retry idempotent requests on
+            connection errors, 429 and 5xx answers. Requests are sent once
+            if not given.
+          rate_limiter (Optional[RateLimiter]):
+            Limiter consulted before every request, throttling each service to
+            its configured rate, e.g. `herepy.rate_limit.RateLimiter.shared(api_key,
+            {"routing": 10})`. Requests are not throttled if not given.
+          single_flight (Optional[SingleFlight]):
+            Group coalescing identical GET requests in flight at the same time,
+            keyed on the url, so they share one HTTP call and one parsed
+            response object which callers must not modify. Can be shared by
+            several wrapper instances. Requests are not coalesced if not given.
+          json_decoder (Optional[Union[str, Callable[[bytes], Any]]]):
+            Function parsing the JSON bodies of responses from bytes, or the name
+            of a library providing one, see `herepy.json_decoder.DECODERS`.
+            Defaults to the fastest library installed.
+          instrumentation (Optional[Instrumentation]):
+            Hooks called before and after every HTTP call with its service,
+            method, url, status, size, timings, attempt and cache status, see
+            `herepy.instrumentation.Instrumentation`. Can be shared by several
+            wrapper instances. DNS, connect, TLS and time to first byte are
+            measured by sessions of `create_session`.
         """
 
         self.__set_credentials(api_key)
@@ -18,6 +112,18 @@ class HEREApi(object):
             self._timeout = timeout
         else:
             self._timeout = 20
+        if session is None:
+            session = self._get_default_session()
+        self._session = session
+        self._cache = cache
+        self._cache_ttls = dict(self.DEFAULT_CACHE_TTLS, **(cache_ttls or {}))
+        self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._single_flight = single_flight
+        if json_decoder is None or isinstance(json_decoder, str):
+            json_decoder = get_json_decoder(json_decoder)
+        self._json_decoder = json_decoder
+        self._instrumentation = instrumentation
 
     def __set_credentials(self, api_key):
         """Setter for credentials.
@@ -26,3 +132,264 @@ class HEREApi(object):
             API key taken from HERE Developer Portal.
         """
         self._api_key = api_key
+
+    @property
+    def session(self) -> requests.Session:
+        """Returns the session used by this instance."""
+        return self._session
+
+    def _get_transport_options(self) -> Dict[str, Any]:
+        """Returns the keyword arguments of a wrapper created by this instance,
+        e.g. to geocode waypoints, so it shares the session, cache, retry policy,
+        rate limiter, single flight group, JSON decoder and instrumentation."""
+        return {
+            "session": self._session,
+            "cache": self._cache,
+            "cache_ttls": self._cache_ttls,
+            "retry_policy": self._retry_policy,
+            "rate_limiter": self._rate_limiter,
+            "single_flight": self._single_flight,
+            "json_decoder": self._json_decoder,
+            "instrumentation": self._instrumentation,
+        }
+
+    def _get_default_session(self) -> Optional[requests.Session]:
+        """Returns the session of an instance created without one."""
+        return HEREApi.shared_session()
+
+    @property
+    def instrumentation(self) -> Optional[Instrumentation]:
+        """Returns the instrumentation hooks of this instance."""
+        return self._instrumentation
+
+    @staticmethod
+    def create_session(
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        adapters: Optional[Dict[str, HTTPAdapter]] = None,
+    ) -> requests.Session:
+        """Creates a keep-alive session with pooled connections. Its adapters
+        measure the phases of each call for `Instrumentation` hooks.
+        Args:
+          pool_connections (int):
+            Number of per host connection pools to cache.
+          pool_maxsize (int):
+            Maximum number of connections kept open per host.
+          pool_block (bool):
+            Whether to block when no free connection is available
+            instead of opening a throwaway one.
+          adapters (Optional[Dict[str, HTTPAdapter]]):
+            Extra adapters to mount, keyed by url prefix.
+        Returns:
+          requests.Session
+        """
+
+        session = requests.Session()
+        adapter = InstrumentedHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if adapters:
+            for prefix, custom_adapter in adapters.items():
+                session.mount(prefix, custom_adapter)
+        return session
+
+    @classmethod
+    def shared_session(cls) -> requests.Session:
+        """Returns the session shared by all instances created without one."""
+        if HEREApi._shared_session is None:
+            with HEREApi._shared_session_lock:
+                if HEREApi._shared_session is None:
+                    HEREApi._shared_session = HEREApi.create_session()
+        return HEREApi._shared_session
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        json: Optional[Dict] = None,
+        stream: bool = False,
+        service: Optional[str] = None,
+        allow_redirects: bool = True,
+        cache_status: Optional[str] = None,
+    ) -> requests.Response:
+        """Sends a HTTP request through the session of this instance, again as long
+        as the retry policy asks for it. The number of requests sent is set as
+        `attempts` on the returned response. Every attempt waits for the rate
+        limiter of `service`, the `SERVICE` of the wrapper if not given, and is
+        reported to the instrumentation hooks."""
+        service = service or self.SERVICE
+        started_at = time.monotonic()
+        attempt = 1
+        while True:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(service)
+            event = None
+            if self._instrumentation is not None:
+                event = self._instrumentation.start(
+                    service, method, url, attempt, cache_status
+                )
+            sent_at = time.perf_counter()
+            with tracing.start_http_span(method, url, service, attempt) as span:
+                try:
+                    response = self._session.request(
+                        method,
+                        url,
+                        headers=tracing.inject(headers),
+                        json=json,
+                        timeout=self._timeout,
+                        stream=stream,
+                        allow_redirects=allow_redirects,
+                    )
+                except Exception as error:
+                    if event is not None:
+                        self._instrumentation.finish(event, sent_at, error=error)
+                    if not isinstance(
+                        error, (requests.ConnectionError, requests.Timeout)
+                    ):
+                        raise
+                    tracing.set_http_error(span, error)
+                    delay = self._get_retry_delay(method, attempt, started_at)
+                    if delay is None:
+                        raise
+                else:
+                    tracing.set_http_response(span, response)
+                    if event is not None:
+                        self._instrumentation.finish(
+                            event, sent_at, response=response, stream=stream
+                        )
+                    delay = self._get_retry_delay(
+                        method,
+                        attempt,
+                        started_at,
+                        response.status_code,
+                        response.headers,
+                    )
+                    if delay is None:
+                        response.attempts = attempt
+                        return response
+                    response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _get_retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        started_at: float,
+        status_code: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[float]:
+        """Returns the seconds to wait before sending a failed request again,
+        None if it must not be sent again."""
+        if self._retry_policy is None:
+            return None
+        return self._retry_policy.get_retry_delay(
+            method, attempt, time.monotonic() - started_at, status_code, headers
+        )
+
+    def _decode_json(self, response: Any) -> Any:
+        """Parses the JSON body of a response straight from its bytes."""
+        with tracing.start_span("herepy.decode_json"):
+            return self._json_decoder(response.content)
+
+    def _get_cache_entry(
+        self, method: str, url: str, json: Optional[Dict], service: Optional[str]
+    ) -> Tuple[Optional[str], Optional[float], Optional[Dict]]:
+        """Looks a request up in the response cache.
+        Returns:
+          Cache key and ttl of the request, both None if it is not cacheable,
+          and the cached response data if there is one.
+        """
+
+        if self._cache is None or method != "GET":
+            return None, None, None
+        ttl = self._cache_ttls.get(service)
+        if ttl == 0:
+            return None, None, None
+        key = Utils.get_cache_key(method, url, json)
+        return key, ttl, self._cache.get(key)
+
+    def _set_cache_entry(self, key: str, ttl: Optional[float], response: Any):
+        """Caches the data of a successful response."""
+        if response.status_code == requests.codes.OK:
+            self._cache.set(
+                key,
+                {
+                    "status_code": response.status_code,
+                    "headers": dict(response.headers),
+                    "content": response.content,
+                    "url": response.url,
+                },
+                ttl,
+            )
+
+    def _report_cache_hit(
+        self, method: str, url: str, service: Optional[str], response: Any
+    ):
+        """Reports a response served from the cache to the instrumentation hooks."""
+        if self._instrumentation is not None:
+            event = self._instrumentation.start(service, method, url, 0, "hit")
+            self._instrumentation.finish(event, time.perf_counter(), response=response)
+
+    @staticmethod
+    def _build_cached_response(data: Dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = data["status_code"]
+        response.headers = CaseInsensitiveDict(data["headers"])
+        response._content = data["content"]
+        response.url = data["url"]
+        response.encoding = "utf-8"
+        return response
+
+    def _resolved(self, value: Any) -> Any:
+        """Returns a value wrappers found without a request, e.g. in a tile store,
+        the way `_send` returns parsed responses."""
+        return value
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        parse: Callable[[requests.Response], Any],
+        headers: Optional[Dict[str, str]] = None,
+        json: Optional[Dict] = None,
+        stream: bool = False,
+        service: Optional[str] = None,
+    ) -> Any:
+        """Sends a HTTP request and returns the value `parse` builds from its response.
+        Wrappers keep request building and response parsing apart through this method,
+        so the async clients in `herepy.aio` can reuse both and only swap the transport.
+        `service` overrides the `SERVICE` of the wrapper for this request.
+        """
+        service = service or self.SERVICE
+        key, ttl, cached = self._get_cache_entry(method, url, json, service)
+        if cached is not None:
+            response = self._build_cached_response(cached)
+            self._report_cache_hit(method, url, service, response)
+            with tracing.start_span("herepy.parse", {"herepy.cache_status": "hit"}):
+                return parse(response)
+
+        def fetch():
+            response = self._request(
+                method,
+                url,
+                headers=headers,
+                json=json,
+                stream=stream,
+                service=service,
+                cache_status=None if key is None else "miss",
+            )
+            if key is not None:
+                self._set_cache_entry(key, ttl, response)
+            with tracing.start_span("herepy.parse"):
+                return parse(response)
+
+        if self._single_flight is None or method != "GET":
+            return fetch()
+        return self._single_flight.do((method, url), fetch)
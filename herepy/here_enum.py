@@ -549,3 +549,17 @@ class TruckType(Enum):
 
     def __str__(self):
         return self._value_
+
+
+class PolylineThirdDimension(Enum):
+    """Meaning of the optional third value of flexible polyline coordinates."""
+
+    absent = 0
+    level = 1
+    altitude = 2
+    elevation = 3
+    custom1 = 6
+    custom2 = 7
+
+    def __str__(self):
+        return "%s" % self._value_
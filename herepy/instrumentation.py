@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+
+import socket
+import threading
+import time
+from typing import Any, Callable, List, Optional
+from warnings import warn
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.connection import allowed_gai_family
+
+from herepy.utils import Utils
+
+_local = threading.local()
+
+
+class RequestEvent(object):
+    """Describes one HTTP call of a wrapper, or one response served from its cache.
+
+    `timings` holds the seconds spent in each phase of the call which was
+    measured: "dns", "connect" and "tls" only for calls opening a new
+    connection, "ttfb" until the response headers were received and "total"
+    until the body was read, or only the headers of streamed responses.
+    """
+
+    def __init__(
+        self,
+        service: Optional[str],
+        method: str,
+        url: str,
+        attempt: int = 1,
+        cache_status: Optional[str] = None,
+    ):
+        """Returns a RequestEvent instance.
+        Args:
+          service (Optional[str]):
+            Service family of the endpoint, e.g. "routing" or "tiles".
+          method (str):
+            HTTP method.
+          url (str):
+            Url of the request, credentials redacted.
+          attempt (int):
+            Number of the attempt, starting at 1, 0 for responses served
+            from the cache.
+          cache_status (Optional[str]):
+            "hit" or "miss", None if the request is not cacheable.
+        """
+
+        self.service = service
+        self.method = method
+        self.url = url
+        self.attempt = attempt
+        self.cache_status = cache_status
+        self.status_code = None
+        self.bytes_sent = None
+        self.bytes_received = None
+        self.timings = {}
+        self.error = None
+        self.started_at = time.time()
+
+    @property
+    def retries(self) -> int:
+        """Returns the number of attempts sent before this one."""
+        return max(0, self.attempt - 1)
+
+    def __repr__(self):
+        return str.format(
+            "RequestEvent({0} {1} {2}, status={3})",
+            self.service,
+            self.method,
+            self.url,
+            self.status_code,
+        )
+
+
+class Instrumentation(object):
+    """Hooks called before and after every HTTP call of the wrappers it is given to,
+    e.g. to record per endpoint latency histograms.
+
+    Hooks receive the `RequestEvent` of the call, `before` hooks once it is about
+    to be sent, `after` hooks once its response was received or it failed. Retried
+    calls fire both for every attempt. Responses served from the response cache
+    fire both as well, with a `cache_status` of "hit". Exceptions raised by hooks
+    are reported as warnings and never fail the request. An instance can be
+    shared by several wrappers and threads.
+    """
+
+    def __init__(
+        self,
+        before: Optional[List[Callable[[RequestEvent], Any]]] = None,
+        after: Optional[List[Callable[[RequestEvent], Any]]] = None,
+    ):
+        """Returns a Instrumentation instance.
+        Args:
+          before (Optional[List[Callable[[RequestEvent], Any]]]):
+            Hooks called before each call.
+          after (Optional[List[Callable[[RequestEvent], Any]]]):
+            Hooks called after each call.
+        """
+
+        self._before = list(before or [])
+        self._after = list(after or [])
+
+    def on_before(
+        self, hook: Callable[[RequestEvent], Any]
+    ) -> Callable[[RequestEvent], Any]:
+        """Adds a hook called before each call, can be used as a decorator."""
+        self._before.append(hook)
+        return hook
+
+    def on_after(
+        self, hook: Callable[[RequestEvent], Any]
+    ) -> Callable[[RequestEvent], Any]:
+        """Adds a hook called after each call, can be used as a decorator."""
+        self._after.append(hook)
+        return hook
+
+    def start(
+        self,
+        service: Optional[str],
+        method: str,
+        url: str,
+        attempt: int = 1,
+        cache_status: Optional[str] = None,
+    ) -> RequestEvent:
+        """Creates the event of a call and fires the `before` hooks."""
+        event = RequestEvent(
+            service, method, Utils.redact_url(url), attempt, cache_status
+        )
+        self._fire(self._before, event)
+        return event
+
+    def finish(
+        self,
+        event: RequestEvent,
+        started_at: float,
+        response: Optional[Any] = None,
+        error: Optional[BaseException] = None,
+        stream: bool = False,
+    ):
+        """Completes the event of a call from its response or error
+        and fires the `after` hooks.
+        Args:
+          event (RequestEvent):
+            Event returned by `start`.
+          started_at (float):
+            `time.perf_counter()` when the call was sent.
+          response (Optional[Any]):
+            Response of the call.
+          error (Optional[BaseException]):
+            Exception raised by the call.
+          stream (bool):
+            Whether the body of the response is still to be read.
+        """
+
+        total = time.perf_counter() - started_at
+        event.error = error
+        if response is not None:
+            event.status_code = response.status_code
+            event.timings.update(getattr(response, "timings", None) or {})
+            event.bytes_sent = _get_bytes_sent(response)
+            event.bytes_received = _get_bytes_received(response, stream)
+        event.timings["total"] = total
+        self._fire(self._after, event)
+
+    @staticmethod
+    def _fire(hooks: List[Callable[[RequestEvent], Any]], event: RequestEvent):
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception as error:
+                warn(
+                    str.format("Instrumentation hook {0} failed: {1!r}", hook, error),
+                    RuntimeWarning,
+                )
+
+
+def _get_bytes_sent(response: Any) -> Optional[int]:
+    if hasattr(response, "bytes_sent"):
+        return response.bytes_sent
+    request = getattr(response, "request", None)
+    if request is None:
+        return None
+    body = request.body
+    if body is None:
+        return 0
+    return len(body) if isinstance(body, (bytes, str)) else None
+
+
+def _get_bytes_received(response: Any, stream: bool) -> Optional[int]:
+    if not stream:
+        return len(response.content)
+    content_length = response.headers.get("Content-Length")
+    return int(content_length) if content_length else None
+
+
+class _TimedConnectionMixin(object):
+    """Records the DNS lookup and the TCP connect of a new connection
+    in the timings of the call it is opened for."""
+
+    def _new_conn(self):
+        timings = getattr(_local, "timings", None)
+        if timings is None:
+            return super(_TimedConnectionMixin, self)._new_conn()
+        host = self._dns_host
+        started_at = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(
+                host.strip("[]"), self.port, allowed_gai_family(), socket.SOCK_STREAM
+            )
+        except OSError:
+            # Leave reporting the failure to urllib3.
+            return super(_TimedConnectionMixin, self)._new_conn()
+        resolved_at = time.perf_counter()
+        timings["dns"] = resolved_at - started_at
+        error = None
+        try:
+            # Connect to the resolved addresses in order, like urllib3 does.
+            for address in addresses:
+                self._dns_host = address[4][0]
+                try:
+                    sock = super(_TimedConnectionMixin, self)._new_conn()
+                except ConnectTimeoutError as connect_error:
+                    error = connect_error
+                else:
+                    break
+            else:
+                raise error
+        finally:
+            self._dns_host = host
+        timings["connect"] = time.perf_counter() - resolved_at
+        return sock
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    def connect(self):
+        started_at = time.perf_counter()
+        super(_TimedHTTPSConnection, self).connect()
+        timings = getattr(_local, "timings", None)
+        if timings is not None:
+            timings["tls"] = (
+                time.perf_counter()
+                - started_at
+                - timings.get("dns", 0.0)
+                - timings.get("connect", 0.0)
+            )
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter setting the phases of each call it sends as `timings` on its
+    response, see `RequestEvent`. Used by the sessions of `HEREApi.create_session`.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(InstrumentedHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        timings = {}
+        _local.timings = timings
+        started_at = time.perf_counter()
+        try:
+            response = super(InstrumentedHTTPAdapter, self).send(request, **kwargs)
+        finally:
+            _local.timings = None
+        timings["ttfb"] = time.perf_counter() - started_at
+        response.timings = timings
+        return response
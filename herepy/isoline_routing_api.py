@@ -1,11 +1,7 @@
 #!/usr/bin/env python
 
-import json
-import sys
 from typing import List, Optional
 
-import requests
-
 from herepy.error import HEREError, InvalidRequestError, UnauthorizedError
 from herepy.here_api import HEREApi
 from herepy.here_enum import (IsolineRoutingMode, IsolineRoutingRangeType,
@@ -17,26 +13,28 @@ from herepy.utils import Utils
 class IsolineRoutingApi(HEREApi):
     """A python interface into the HERE Isoline Routing API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "isoline"
+
+    def __init__(self, api_key: str = None, timeout: int = None, **kwargs):
         """Returns a IsolineRoutingApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(IsolineRoutingApi, self).__init__(api_key, timeout)
+        super(IsolineRoutingApi, self).__init__(api_key, timeout, **kwargs)
         self._base_url = "https://isoline.router.hereapi.com/v8/isolines"
 
-    def __get_error_from_response(self, json_data):
+    def __get_error_from_response(self, json_data, function_name):
         if "error" in json_data:
             if json_data["error"] == "Unauthorized":
                 return UnauthorizedError(json_data["error_description"])
         error_type = json_data.get("Type")
-        error_message = json_data.get(
-            "Message", "Error occurred on " + sys._getframe(1).f_code.co_name
-        )
+        error_message = json_data.get("Message", "Error occurred on " + function_name)
         if error_type == "Invalid Request":
             return InvalidRequestError(error_message)
         else:
@@ -53,10 +51,16 @@ class IsolineRoutingApi(HEREApi):
         else:
             return HEREError("herepy got a 400 from isoline router API")
 
-    def __get(self, url, data, json_key):
+    def __get(self, url, data, json_key, function_name):
         url = Utils.build_url(url, extra_params=data)
-        response = requests.get(url, timeout=self._timeout)
-        json_data = json.loads(response.content.decode("utf8"))
+        return self._send(
+            "GET",
+            url,
+            lambda response: self.__parse_response(response, json_key, function_name),
+        )
+
+    def __parse_response(self, response, json_key, function_name):
+        json_data = self._decode_json(response)
         if json_data.get(json_key) != None and json_data.get("isolines") != None:
             return IsolineRoutingResponse.new_from_jsondict(
                 json_data, param_defaults={json_key: None, "isolines": None}
@@ -65,7 +69,7 @@ class IsolineRoutingApi(HEREApi):
             error = self.__get_client_error_from_response(json_data=json_data)
             raise error
         else:
-            error = self.__get_error_from_response(json_data)
+            error = self.__get_error_from_response(json_data, function_name)
             raise error
 
     def distance_based_isoline(
@@ -100,7 +104,7 @@ class IsolineRoutingApi(HEREApi):
             "routingMode": routing_mode.__str__(),
             "apiKey": self._api_key,
         }
-        return self.__get(self._base_url, data, "departure")
+        return self.__get(self._base_url, data, "departure", "distance_based_isoline")
 
     def time_isoline(
         self,
@@ -130,7 +134,7 @@ class IsolineRoutingApi(HEREApi):
             "range[values]": ",".join(string_ranges),
             "apiKey": self._api_key,
         }
-        return self.__get(self._base_url, data, "departure")
+        return self.__get(self._base_url, data, "departure", "time_isoline")
 
     def isoline_based_on_consumption(
         self,
@@ -193,7 +197,9 @@ class IsolineRoutingApi(HEREApi):
             "ev[auxiliaryConsumption]": auxiliary_consumption,
             "apiKey": self._api_key,
         }
-        return self.__get(self._base_url, data, "departure")
+        return self.__get(
+            self._base_url, data, "departure", "isoline_based_on_consumption"
+        )
 
     def isoline_routing_at_specific_time(
         self,
@@ -237,7 +243,9 @@ class IsolineRoutingApi(HEREApi):
                 "range[values]": ",".join(string_ranges),
                 "apiKey": self._api_key,
             }
-            return self.__get(self._base_url, data, "departure")
+            return self.__get(
+                self._base_url, data, "departure", "isoline_routing_at_specific_time"
+            )
         elif destination and arrival_time:
             data = {
                 "transportMode": transport_mode.__str__(),
@@ -247,7 +255,9 @@ class IsolineRoutingApi(HEREApi):
                 "range[values]": ",".join(string_ranges),
                 "apiKey": self._api_key,
             }
-            return self.__get(self._base_url, data, "arrival")
+            return self.__get(
+                self._base_url, data, "arrival", "isoline_routing_at_specific_time"
+            )
         else:
             raise HEREError(
                 "Please provide either origin & departure_time or destination & arrival_time."
@@ -285,7 +295,7 @@ class IsolineRoutingApi(HEREApi):
                 "range[values]": ",".join(string_ranges),
                 "apiKey": self._api_key,
             }
-            return self.__get(self._base_url, data, "departure")
+            return self.__get(self._base_url, data, "departure", "multi_range_routing")
         elif destination:
             data = {
                 "transportMode": transport_mode.__str__(),
@@ -294,7 +304,7 @@ class IsolineRoutingApi(HEREApi):
                 "range[values]": ",".join(string_ranges),
                 "apiKey": self._api_key,
             }
-            return self.__get(self._base_url, data, "arrival")
+            return self.__get(self._base_url, data, "arrival", "multi_range_routing")
         else:
             raise HEREError(
                 "Please provide values for origin or destination parameter."
@@ -332,7 +342,9 @@ class IsolineRoutingApi(HEREApi):
                 "range[values]": ",".join(string_ranges),
                 "apiKey": self._api_key,
             }
-            return self.__get(self._base_url, data, "departure")
+            return self.__get(
+                self._base_url, data, "departure", "reverse_direction_isoline"
+            )
         elif destination:
             data = {
                 "transportMode": transport_mode.__str__(),
@@ -341,7 +353,9 @@ class IsolineRoutingApi(HEREApi):
                 "range[values]": range,
                 "apiKey": self._api_key,
             }
-            return self.__get(self._base_url, data, "arrival")
+            return self.__get(
+                self._base_url, data, "arrival", "reverse_direction_isoline"
+            )
         else:
             raise HEREError(
                 "Please provide values for origin or destination parameter."
@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+from herepy.error import HEREError
+
+
+class Job(object):
+    """Handle of a calculation running asynchronously on the HERE servers.
+
+    A job is returned as soon as the service accepted the calculation. Its status
+    is requested with a growing step between two requests, either once through
+    `status`, blocking through `wait` or without blocking through `status_async`,
+    `wait_async` or by awaiting the job from a coroutine. Jobs of the async
+    clients request their status with a coroutine and can only be polled without
+    blocking. Jobs added to a `herepy.polling.Poller` are polled by its
+    background thread instead, `wait` and awaiting then only wait for the result.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(
+        self,
+        job_id: str,
+        request_status: Callable[[], Any],
+        check_status: Callable[[Any], Any],
+        step: float = 1.0,
+        max_step: float = 30.0,
+        backoff: float = 1.5,
+    ):
+        """Returns a Job instance.
+        Args:
+          job_id (str):
+            Identifier the service assigned to the calculation.
+          request_status (Callable):
+            Function or coroutine function sending the status request,
+            returns the response.
+          check_status (Callable):
+            Receives a status response, returns the result once the calculation
+            completed, None while it is running and raises HEREError if it failed.
+          step (float):
+            Seconds to wait after the first status request.
+          max_step (float):
+            Maximum seconds to wait between two status requests.
+          backoff (float):
+            Factor the step grows by after each status request.
+        """
+
+        self.id = job_id
+        self._request_status = request_status
+        self._check_status = check_status
+        self._step = step
+        self._max_step = max_step
+        self._backoff = backoff
+        self._running = False
+        self._poller = None
+        self._future = Future()
+        self._poll_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+
+    def __repr__(self):
+        return str.format("<Job {0} {1}>", self.id, self._get_status())
+
+    def __await__(self):
+        return self.wait_async().__await__()
+
+    def _get_status(self) -> str:
+        if self._future.cancelled():
+            return Job.CANCELLED
+        if self._future.done():
+            if self._future.exception() is not None:
+                return Job.FAILED
+            return Job.COMPLETED
+        if self._running:
+            return Job.RUNNING
+        return Job.PENDING
+
+    def _next_step(self) -> float:
+        """Returns the seconds to wait before the next status request
+        and grows the step for the one after."""
+        step = self._step
+        self._step = min(self._step * self._backoff, self._max_step)
+        return step
+
+    def _handle_status(self, response: Any) -> bool:
+        try:
+            result = self._check_status(response)
+        except HEREError as here_error:
+            with self._state_lock:
+                if not self._future.done():
+                    self._future.set_exception(here_error)
+            return True
+        if result is None:
+            self._running = True
+            return False
+        with self._state_lock:
+            if not self._future.done():
+                self._future.set_result(result)
+        return True
+
+    def _is_async(self) -> bool:
+        return asyncio.iscoroutinefunction(self._request_status)
+
+    def _check_sync(self):
+        if self._is_async() and not self._future.done():
+            raise HEREError(
+                "Jobs of async clients are polled with poll_async, status_async "
+                "and wait_async or by awaiting them."
+            )
+
+    def _fail(self, exception: BaseException):
+        with self._state_lock:
+            if not self._future.done():
+                self._future.set_exception(exception)
+
+    def done(self) -> bool:
+        """Returns True if the job completed, failed or was cancelled."""
+        return self._future.done()
+
+    def poll(self) -> bool:
+        """Requests the status of the job once unless it is already done.
+        Returns:
+          True if the job is done.
+        Raises:
+          HEREError: If the job requests its status with a coroutine.
+        """
+
+        self._check_sync()
+        with self._poll_lock:
+            if self._future.done():
+                return True
+            return self._handle_status(self._request_status())
+
+    def status(self) -> str:
+        """Requests the status of the job once unless it is already done
+        or tracked by a `herepy.polling.Poller`.
+        Returns:
+          One of `Job.PENDING`, `Job.RUNNING`, `Job.COMPLETED`, `Job.FAILED`
+          and `Job.CANCELLED`.
+        Raises:
+          HEREError: If the job requests its status with a coroutine.
+        """
+
+        if self._poller is None:
+            self.poll()
+        return self._get_status()
+
+    def wait(self, timeout: Optional[float] = None) -> Any:
+        """Blocks until the job is done.
+        Args:
+          timeout (Optional[float]):
+            Maximum seconds to wait, waits until the job is done if not given.
+        Returns:
+          Result of the calculation.
+        Raises:
+          HEREError: If the calculation failed or the job requests its status
+            with a coroutine.
+          concurrent.futures.TimeoutError: If the job is not done within `timeout`.
+          concurrent.futures.CancelledError: If the job was cancelled.
+        """
+
+        self._check_sync()
+        if self._poller is not None:
+            return self._future.result(timeout=timeout)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.poll():
+            step = self._next_step()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                step = min(step, remaining)
+            time.sleep(step)
+        return self._future.result(timeout=0)
+
+    def cancel(self) -> bool:
+        """Stops polling the job, waiting callers receive a CancelledError.
+        Returns:
+          False if the job was already done, True otherwise.
+        """
+
+        with self._state_lock:
+            return self._future.cancel()
+
+    def add_done_callback(self, callback: Callable[["Job"], Any]):
+        """Calls `callback` with the job once it is done."""
+        self._future.add_done_callback(lambda future: callback(self))
+
+    async def poll_async(self) -> bool:
+        """Requests the status of the job once unless it is already done,
+        without blocking the event loop.
+        Returns:
+          True if the job is done.
+        """
+
+        if self._future.done():
+            return True
+        if not self._is_async():
+            return await asyncio.get_running_loop().run_in_executor(None, self.poll)
+        response = await self._request_status()
+        return self._future.done() or self._handle_status(response)
+
+    async def status_async(self) -> str:
+        """Requests the status of the job once like `status`, without blocking
+        the event loop.
+        Returns:
+          One of `Job.PENDING`, `Job.RUNNING`, `Job.COMPLETED`, `Job.FAILED`
+          and `Job.CANCELLED`.
+        """
+
+        if self._poller is None:
+            await self.poll_async()
+        return self._get_status()
+
+    async def wait_async(self, timeout: Optional[float] = None) -> Any:
+        """Waits until the job is done like `wait`, without blocking the event
+        loop. Awaiting the job is the same as awaiting `wait_async()`.
+        Args:
+          timeout (Optional[float]):
+            Maximum seconds to wait, waits until the job is done if not given.
+        Returns:
+          Result of the calculation.
+        Raises:
+          HEREError: If the calculation failed.
+          concurrent.futures.TimeoutError: If the job is not done within `timeout`.
+          concurrent.futures.CancelledError: If the job was cancelled.
+        """
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        if self._poller is not None:
+            # asyncio.wait leaves the job running when the timeout expires.
+            await asyncio.wait([asyncio.wrap_future(self._future)], timeout=timeout)
+            return self._future.result(timeout=0)
+        while not await self.poll_async():
+            step = self._next_step()
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                step = min(step, remaining)
+            await asyncio.sleep(step)
+        return self._future.result(timeout=0)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+
+import importlib
+import json
+from typing import Any, Callable, Optional, Union
+
+from herepy.error import HEREError
+
+DECODERS = ("orjson", "ujson", "simdjson", "json")
+"""Modules providing a `loads` accepting bytes, in order of preference."""
+
+
+def get_json_decoder(
+    name: Optional[str] = None,
+) -> Callable[[Union[bytes, str]], Any]:
+    """Returns the `loads` function of a JSON library. Every decoder parses the
+    UTF-8 encoded body of a response directly, without decoding it to str first,
+    and raises a ValueError on invalid input.
+    Args:
+      name (Optional[str]):
+        One of `DECODERS`, the fastest one installed if not given.
+    Returns:
+      Function parsing a JSON document.
+    Raises:
+      HEREError: If the requested library is not installed.
+    """
+
+    if name is None:
+        for name in DECODERS:
+            try:
+                return get_json_decoder(name)
+            except HEREError:
+                continue
+    if name not in DECODERS:
+        raise HEREError(
+            str.format("Unknown JSON decoder {0}, use one of {1}.", name, DECODERS)
+        )
+    if name == "json":
+        return json.loads
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        raise HEREError(str.format("{0} is required for the {0} JSON decoder.", name))
+    return module.loads
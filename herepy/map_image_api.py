@@ -1,33 +1,36 @@
 #!/usr/bin/env python
 
-import json
-import sys
+import logging
 from typing import List, Optional
 
-import requests
-
 from herepy import MapImageFormatType, MapImageResourceType
 from herepy.error import HEREError, InvalidRequestError, UnauthorizedError
 from herepy.here_api import HEREApi
 from herepy.utils import Utils
 
+logger = logging.getLogger(__name__)
+
 
 class MapImageApi(HEREApi):
     """A python interface into the HERE Map Image API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "map_image"
+
+    def __init__(self, api_key: str = None, timeout: int = None, **kwargs):
         """Returns a MapImageApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(MapImageApi, self).__init__(api_key, timeout)
+        super(MapImageApi, self).__init__(api_key, timeout, **kwargs)
         self._base_url = "https://image.maps.ls.hereapi.com/mia/1.6/mapview"
 
-    def __get_error_from_response(self, json_data):
+    def __get_error_from_response(self, json_data, function_name):
         if "error" in json_data:
             error_description = json_data["error_description"]
             if json_data["error"] == "Unauthorized":
@@ -37,7 +40,7 @@ class MapImageApi(HEREApi):
             "Message",
             error_description
             + ", error occurred on "
-            + sys._getframe(1).f_code.co_name,
+            + function_name,
         )
         if error_type == "Invalid Request":
             return InvalidRequestError(error_message)
@@ -175,13 +178,19 @@ class MapImageApi(HEREApi):
         if second_label_language:
             data["ml2"] = second_label_language
         url = Utils.build_url(self._base_url, extra_params=data)
-        response = requests.get(url, timeout=self._timeout)
+        return self._send(
+            "GET", url, lambda response: self.__parse_response(response, "get_mapimage")
+        )
+
+    def __parse_response(self, response, function_name):
         if isinstance(response.content, bytes):
             try:
-                json_data = json.loads(response.content.decode("utf8"))
+                json_data = self._decode_json(response)
                 if "error" in json_data:
-                    error = self.__get_error_from_response(json_data)
+                    error = self.__get_error_from_response(
+                        json_data, function_name
+                    )
                     raise error
-            except UnicodeDecodeError as err:
-                print("Map image downloaded")
+            except ValueError:
+                logger.debug("Map image downloaded")
         return response.content
@@ -1,43 +1,73 @@
 #!/usr/bin/env python
 
-import json
-import sys
+import functools
+import logging
 from random import randrange
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import requests
 
-from herepy import BaseMapTileResourceType, MapTileApiType, MapTileResourceType
+from herepy import (
+    BaseMapTileResourceType,
+    MapTileApiType,
+    MapTileResourceType,
+    tile_prefetch,
+)
 from herepy.error import HEREError, InvalidRequestError, UnauthorizedError
 from herepy.here_api import HEREApi
 from herepy.utils import Utils
 
 from .mercator_projection import MercatorProjection
 
+logger = logging.getLogger(__name__)
+
 
 class MapTileApi(HEREApi):
     """A python interface into the HERE Map Tile API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "tiles"
+    NUM_SERVERS = 4
+    """Number of the numbered hosts `{1..4}.{api_type}.maps.ls.hereapi.com`."""
+
+    def __init__(
+        self,
+        api_key: str = None,
+        timeout: int = None,
+        tile_store: Optional[Any] = None,
+        tile_cache: Optional[Any] = None,
+        **kwargs
+    ):
         """Returns a MapTileApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          tile_store (Optional[Any]):
+            Store every downloaded tile is written to and which tiles are served
+            from without a request once stored, e.g.
+            `herepy.tile_store.MBTilesStore`, any object with its `get`, `put`
+            and `in` methods can be used. Tiles are addressed by zoom, column and
+            row only, so a store must be used with one set of tile parameters.
+          tile_cache (Optional[Any]):
+            Cache of downloaded tiles keyed by all their parameters, e.g.
+            `herepy.tile_cache.DiskTileCache`. Fresh tiles are served without a
+            request, stale ones are revalidated with their ETag.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(MapTileApi, self).__init__(api_key, timeout)
+        super(MapTileApi, self).__init__(api_key, timeout, **kwargs)
+        self._tile_store = tile_store
+        self._tile_cache = tile_cache
         self._base_url = None
 
-    def __get_error_from_response(self, json_data):
+    def __get_error_from_response(self, json_data, function_name):
         if "error" in json_data:
             if json_data["error"] == "Unauthorized":
                 return UnauthorizedError(json_data["error_description"])
         error_type = json_data.get("Type")
-        error_message = json_data.get(
-            "Message", "Error occurred on " + sys._getframe(1).f_code.co_name
-        )
+        error_message = json_data.get("Message", "Error occurred on " + function_name)
         if error_type == "Invalid Request":
             return InvalidRequestError(error_message)
         else:
@@ -95,10 +125,82 @@ class MapTileApi(HEREApi):
           HEREError
         """
 
-        server = randrange(1, 4)
         column, row = MercatorProjection.get_column_row(
             latitude=latitude, longitude=longitude, zoom=zoom
         )
+        return self.get_maptile_by_tile(
+            column,
+            row,
+            zoom,
+            api_type=api_type,
+            resource_type=resource_type,
+            map_id=map_id,
+            scheme=scheme,
+            size=size,
+            tile_format=tile_format,
+            query_parameters=query_parameters,
+        )
+
+    def get_maptile_by_tile(
+        self,
+        column: int,
+        row: int,
+        zoom: int,
+        api_type: MapTileApiType = MapTileApiType.base,
+        resource_type: MapTileResourceType = BaseMapTileResourceType.alabeltile,
+        map_id: str = "newest",
+        scheme: str = "normal.day",
+        size: int = 256,
+        tile_format: str = "png8",
+        query_parameters: Optional[Dict] = None,
+        server: Optional[int] = None,
+    ) -> Optional[bytes]:
+        """Returns optional bytes value of the map tile at given column and row.
+        Args:
+          column (int):
+            Column of the tile, see `MercatorProjection.get_column_row`.
+          row (int):
+            Row of the tile.
+          zoom (int):
+            Zoom level of the map image.
+          server (Optional[int]):
+            Number of the host the tile is requested from, 1 to `NUM_SERVERS`,
+            picked at random if not given.
+          The other arguments are the ones of `get_maptile`.
+        Returns:
+          Map tile as bytes.
+        Raises:
+          HEREError
+        """
+
+        if self._tile_store is not None:
+            tile = self._tile_store.get(zoom, column, row)
+            if tile is not None:
+                return self._resolved(tile)
+        tile_key = cached = headers = None
+        if self._tile_cache is not None:
+            tile_key = (
+                "maptile",
+                str(api_type),
+                str(resource_type),
+                map_id,
+                scheme,
+                zoom,
+                column,
+                row,
+                size,
+                tile_format,
+                sorted((query_parameters or {}).items()),
+            )
+            cached = self._tile_cache.get(tile_key)
+            if cached is not None and cached.is_fresh():
+                return self._resolved(
+                    self._store_tile(zoom, column, row, cached.content)
+                )
+            if cached is not None and cached.etag:
+                headers = {"If-None-Match": cached.etag}
+        if server is None:
+            server = randrange(1, self.NUM_SERVERS + 1)
         url = str.format(
             "https://{}.{}.maps.ls.hereapi.com/maptile/2.1/{}/{}/{}/{}/{}/{}/{}/{}",
             server,
@@ -112,18 +214,152 @@ class MapTileApi(HEREApi):
             size,
             tile_format,
         )
-        if query_parameters:
-            query_parameters.update({"apiKey": self._api_key})
-        else:
-            query_parameters = {"apiKey": self._api_key}
+        query_parameters = dict(query_parameters or {}, apiKey=self._api_key)
         url = Utils.build_url(url, extra_params=query_parameters)
-        response = requests.get(url, timeout=self._timeout, stream=True)
+        return self._send(
+            "GET",
+            url,
+            lambda response: self._store_tile(
+                zoom, column, row, self._parse_tile(response, tile_key, cached)
+            ),
+            headers=headers,
+            stream=True,
+        )
+
+    def _parse_tile(self, response, tile_key, cached):
+        if (
+            response.status_code == requests.codes.not_modified
+            and cached is not None
+            and cached.etag
+        ):
+            # Only answers to a revalidation of the cached tile are accepted.
+            self._tile_cache.refresh(tile_key, response.headers)
+            return cached.content
+        tile = self.__parse_response(response, "get_maptile")
+        if not response.ok or response.status_code == requests.codes.not_modified:
+            # Bodies of other answers, e.g. the HTML page of a gateway error or
+            # an unexpected revalidation, are no tiles and must neither be
+            # written to the tile store nor to the tile cache.
+            raise HEREError(
+                str.format(
+                    "Error occurred on get_maptile: status {0}", response.status_code
+                )
+            )
+        if tile_key is not None and tile and response.status_code == requests.codes.OK:
+            self._tile_cache.set(tile_key, tile, response.headers)
+        return tile
+
+    def _store_tile(
+        self, zoom: int, column: int, row: int, tile: Optional[bytes]
+    ) -> Optional[bytes]:
+        if self._tile_store is not None and tile:
+            self._tile_store.put(zoom, column, row, tile)
+        return tile
+
+    def get_maptiles_in_bbox(
+        self,
+        top_left: List[float],
+        bottom_right: List[float],
+        zooms: Iterable[int],
+        max_workers: int = 8,
+        skip_stored: bool = False,
+        **kwargs
+    ) -> Iterator[Tuple[int, int, int, Union[bytes, HEREError]]]:
+        """Downloads every map tile covering a bounding box at the given zoom levels,
+        concurrently on a bounded pool of worker threads. Requests are spread over
+        the numbered hosts in turn.
+        Args:
+          top_left (List):
+            List contains latitude and longitude in order.
+          bottom_right (List):
+            List contains latitude and longitude in order.
+          zooms (Iterable[int]):
+            Zoom levels of the tiles.
+          max_workers (int):
+            Maximum number of tiles downloaded at the same time.
+          skip_stored (bool):
+            Whether tiles already in the tile store are left out instead of
+            being read from it, so an interrupted seeding of the store resumes
+            where it stopped.
+          **kwargs:
+            `get_maptile_by_tile` arguments shared by every tile, e.g. `scheme`.
+        Returns:
+          Iterator of zoom, column, row and the map tile as bytes, or the
+          HEREError raised for that tile, in the order the tiles arrive.
+        """
+
+        yield from tile_prefetch.download_tiles(
+            self._get_tiles_in_bbox(top_left, bottom_right, zooms, skip_stored),
+            functools.partial(self._get_indexed_tile, **kwargs),
+            max_workers,
+        )
+
+    def get_maptiles_along_route(
+        self,
+        route: tile_prefetch.Route,
+        zooms: Iterable[int],
+        buffer: float = 250.0,
+        max_workers: int = 8,
+        skip_stored: bool = False,
+        **kwargs
+    ) -> Iterator[Tuple[int, int, int, Union[bytes, HEREError]]]:
+        """Downloads every map tile within a distance of a route at the given zoom
+        levels, like `get_maptiles_in_bbox`, to warm the tile store or tile cache
+        of this instance before the route is travelled.
+        Args:
+          route (tile_prefetch.Route):
+            `RoutingResponseV8` with polylines, an encoded flexible polyline or
+            a list of points, see `herepy.tile_prefetch.get_route_paths`.
+          zooms (Iterable[int]):
+            Zoom levels of the tiles.
+          buffer (float):
+            Distance from the route in meters.
+          The other arguments are the ones of `get_maptiles_in_bbox`.
+        Returns:
+          Iterator of zoom, column, row and the map tile as bytes, or the
+          HEREError raised for that tile, in the order the tiles arrive.
+        """
+
+        tiles = tile_prefetch.get_tiles_along_route(route, zooms, buffer)
+        if skip_stored:
+            tiles = tile_prefetch.skip_stored(tiles, self._tile_store)
+        yield from tile_prefetch.download_tiles(
+            tiles, functools.partial(self._get_indexed_tile, **kwargs), max_workers
+        )
+
+    def _get_indexed_tile(
+        self, index: int, zoom: int, column: int, row: int, **kwargs
+    ) -> Optional[bytes]:
+        # Tiles downloaded together are spread over the numbered hosts in turn.
+        return self.get_maptile_by_tile(
+            column, row, zoom, server=1 + index % self.NUM_SERVERS, **kwargs
+        )
+
+    def _get_tiles_in_bbox(
+        self,
+        top_left: List[float],
+        bottom_right: List[float],
+        zooms: Iterable[int],
+        skip_stored: bool = False,
+    ) -> Iterator[Tuple[int, int, int]]:
+        tiles = (
+            (zoom, column, row)
+            for zoom in zooms
+            for column, row in MercatorProjection.get_tiles_in_bbox(
+                top_left, bottom_right, zoom
+            )
+        )
+        if skip_stored:
+            return tile_prefetch.skip_stored(tiles, self._tile_store)
+        return tiles
+
+    def __parse_response(self, response, function_name):
         if isinstance(response.content, bytes):
             try:
-                json_data = json.loads(response.content.decode("utf8"))
+                json_data = self._decode_json(response)
                 if "error" in json_data:
-                    error = self.__get_error_from_response(json_data)
+                    error = self.__get_error_from_response(json_data, function_name)
                     raise error
-            except UnicodeDecodeError as err:
-                print("Map tile downloaded")
+            except ValueError:
+                logger.debug("Map tile downloaded")
         return response.content
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+import json
+import re
+import zlib
+from array import array
+from typing import Any, Dict
+
+from herepy.error import HEREError
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ARRAY_START = re.compile(rb'"(travelTimes|distances|errorCodes)"\s*:\s*\[')
+_TYPECODES = {b"travelTimes": "i", b"distances": "i", b"errorCodes": "b"}
+# Bytes held back while looking for an array start which may span two chunks.
+_LOOKBEHIND = 64
+
+
+class Decompressor(object):
+    """Decompresses a body chunk by chunk if it is gzip compressed, passes it
+    through otherwise. Bodies served with a gzip `Content-Encoding` are already
+    decompressed by the HTTP clients, result files may still be gzip files."""
+
+    def __init__(self):
+        self._decompressor = None
+        self._started = False
+
+    def decompress(self, chunk: bytes) -> bytes:
+        """Returns the decompressed bytes of `chunk`."""
+        if not self._started:
+            self._started = True
+            if chunk.startswith(_GZIP_MAGIC):
+                self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self._decompressor is None:
+            return chunk
+        return self._decompressor.decompress(chunk)
+
+    def flush(self) -> bytes:
+        """Returns the bytes remaining once the body was read."""
+        if self._decompressor is None:
+            return b""
+        return self._decompressor.flush()
+
+
+class MatrixResultParser(object):
+    """Incremental parser of an async matrix result.
+
+    The `travelTimes`, `distances` and `errorCodes` lists are parsed chunk by
+    chunk straight into `array("i")` and `array("b")`, so the Python lists of
+    a complete JSON parse are never built. The remaining, small part of the
+    document is parsed with `json` once it was read.
+    """
+
+    def __init__(self):
+        self._skeleton = bytearray()
+        self._pending = b""
+        self._array = None
+        self._arrays = {}
+
+    def feed(self, data: bytes):
+        """Parses the next bytes of the document."""
+        data = self._pending + data
+        self._pending = b""
+        while data:
+            if self._array is None:
+                match = _ARRAY_START.search(data)
+                if match is None:
+                    keep = max(len(data) - _LOOKBEHIND, 0)
+                    self._skeleton += data[:keep]
+                    self._pending = data[keep:]
+                    return
+                self._skeleton += data[: match.end()]
+                name = match.group(1)
+                self._array = array(_TYPECODES[name])
+                self._arrays[name.decode("ascii")] = self._array
+                data = data[match.end() :]
+                continue
+            end = data.find(b"]")
+            if end < 0:
+                # The last number may continue in the next chunk.
+                cut = data.rfind(b",")
+                if cut >= 0:
+                    self._extend(data[:cut])
+                    data = data[cut + 1 :]
+                self._pending = data
+                return
+            self._extend(data[:end])
+            self._array = None
+            data = data[end:]
+
+    def _extend(self, data: bytes):
+        if not data.strip():
+            return
+        # The C parser of json is faster than int() per value.
+        try:
+            numbers = json.loads(b"[" + data + b"]")
+        except ValueError as error:
+            raise HEREError(str.format("Invalid matrix result: {0}", error))
+        try:
+            self._array.extend(array(self._array.typecode, numbers))
+        except TypeError:
+            # Entries which failed to calculate may be null.
+            numbers = [0 if number is None else number for number in numbers]
+            try:
+                self._array.extend(array(self._array.typecode, numbers))
+            except (TypeError, OverflowError) as error:
+                raise HEREError(str.format("Invalid matrix result: {0}", error))
+        except OverflowError as error:
+            raise HEREError(str.format("Invalid matrix result: {0}", error))
+
+    def close(self) -> Dict[str, Any]:
+        """Returns the parsed document, its matrix holding the parsed arrays.
+        Raises:
+          HEREError: If the document is incomplete or invalid.
+        """
+
+        if self._array is not None:
+            raise HEREError("Matrix result ended inside of a list.")
+        self._skeleton += self._pending
+        self._pending = b""
+        try:
+            data = json.loads(bytes(self._skeleton))
+        except ValueError as error:
+            raise HEREError(str.format("Invalid matrix result: {0}", error))
+        matrix = data.get("matrix")
+        if matrix is None:
+            raise HEREError("Matrix result has no matrix.")
+        matrix.update(self._arrays)
+        return data
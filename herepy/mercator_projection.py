@@ -1,6 +1,16 @@
 #!/usr/bin/env python
 
 import math
+from array import array
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from herepy.error import HEREError
+from herepy.utils import Utils
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
 
 class MercatorProjection(object):
@@ -8,8 +18,16 @@ class MercatorProjection(object):
     surface of a sphere (the globe) to points on a plane, using the normalized Mercator projection.
 
     This class helps to create column and row values to be used in requests.
+    The batch methods taking sequences of coordinates or tiles compute whole
+    NumPy arrays at once when NumPy is installed, and loop over `array`s
+    otherwise, see their `use_numpy` argument.
     """
 
+    MAX_LATITUDE = 85.0511287798066
+    """Latitude of the top and bottom edges of the tile grid."""
+    EARTH_CIRCUMFERENCE = 40075016.686
+    """Meters around the equator, the width of the tile grid."""
+
     @staticmethod
     def get_column_row(latitude: float, longitude: float, zoom: int):
         lat_rad = latitude * math.pi / 180
@@ -21,3 +39,372 @@ class MercatorProjection(object):
             / 2
         )
         return int(x_tile), int(y_tile)
+
+    @staticmethod
+    def get_tiles_in_bbox(
+        top_left: List[float], bottom_right: List[float], zoom: int
+    ) -> Iterator[Tuple[int, int]]:
+        """Enumerates the tiles covering a bounding box, row by row.
+        Args:
+          top_left (List):
+            List contains latitude and longitude in order.
+          bottom_right (List):
+            List contains latitude and longitude in order.
+          zoom (int):
+            Zoom level of the tiles.
+        Returns:
+          Iterator of column and row of every tile. Boxes whose left edge lies
+          east of their right edge cross the antimeridian.
+        """
+
+        max_tile = 2**zoom - 1
+
+        def get_column_row(latitude, longitude):
+            latitude = max(
+                -MercatorProjection.MAX_LATITUDE,
+                min(MercatorProjection.MAX_LATITUDE, latitude),
+            )
+            column, row = MercatorProjection.get_column_row(
+                latitude=latitude, longitude=longitude, zoom=zoom
+            )
+            return min(max(column, 0), max_tile), min(max(row, 0), max_tile)
+
+        left, top = get_column_row(top_left[0], top_left[1])
+        right, bottom = get_column_row(bottom_right[0], bottom_right[1])
+        if top_left[1] <= bottom_right[1]:
+            columns = range(left, right + 1)
+        else:
+            columns = list(range(left, max_tile + 1)) + list(range(0, right + 1))
+        for row in range(top, bottom + 1):
+            for column in columns:
+                yield column, row
+
+    @staticmethod
+    def get_tiles_along_path(
+        coordinates: Iterable[Sequence[float]], zoom: int, buffer: float = 0.0
+    ) -> List[Tuple[int, int]]:
+        """Returns every tile a path passes through or comes within `buffer` meters
+        of, segment by segment rather than by sampling points, so no tile crossed
+        between two points is missed.
+        Args:
+          coordinates (Iterable[Sequence[float]]):
+            Points of the path, each starting with its latitude and longitude,
+            e.g. a decoded flexible polyline. Segments take the shorter way
+            around the globe, crossing the antimeridian if needed.
+          zoom (int):
+            Zoom level of the tiles.
+          buffer (float):
+            Distance from the path in meters. Tiles whose corners are only
+            within `buffer` of the path along both axes are included as well.
+        Returns:
+          List of column and row of every tile, in the order the path reaches them.
+        """
+
+        n = 1 << zoom
+        tiles = {}
+        previous = None
+        for point in coordinates:
+            latitude = max(
+                -MercatorProjection.MAX_LATITUDE,
+                min(MercatorProjection.MAX_LATITUDE, point[0]),
+            )
+            x, y = MercatorProjection._project(latitude, point[1], zoom, math)
+            # Mercator stretches distances by 1 / cos(latitude).
+            radius = (
+                buffer
+                * n
+                / (
+                    MercatorProjection.EARTH_CIRCUMFERENCE
+                    * math.cos(math.radians(latitude))
+                )
+            )
+            if previous is None:
+                previous = x, y, radius
+            previous_x, previous_y, previous_radius = previous
+            x -= n * round((x - previous_x) / n)
+            MercatorProjection._add_segment_tiles(
+                tiles, previous_x, previous_y, x, y, max(radius, previous_radius), n
+            )
+            previous = x, y, radius
+        return list(tiles)
+
+    @staticmethod
+    def _add_segment_tiles(tiles, x0, y0, x1, y1, radius, n):
+        """Adds the tiles within `radius` of a segment in tile units to `tiles`,
+        row by row from the part of the segment within reach of each row."""
+        top = max(0, math.floor(min(y0, y1) - radius))
+        bottom = min(n - 1, math.floor(max(y0, y1) + radius))
+        for row in range(top, bottom + 1):
+            start, end = 0.0, 1.0
+            if y0 != y1:
+                low = (row - radius - y0) / (y1 - y0)
+                high = (row + 1 + radius - y0) / (y1 - y0)
+                start, end = max(start, min(low, high)), min(end, max(low, high))
+                if start > end:
+                    continue
+            left = x0 + (x1 - x0) * start
+            right = x0 + (x1 - x0) * end
+            first = math.floor(min(left, right) - radius)
+            last = math.floor(max(left, right) + radius)
+            for column in range(first, min(last, first + n - 1) + 1):
+                tiles[(column % n, row)] = None
+
+    @staticmethod
+    def get_columns_rows(
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        zoom: int,
+        use_numpy: Optional[bool] = None,
+    ) -> Tuple[Union[array, "numpy.ndarray"], Union[array, "numpy.ndarray"]]:
+        """Returns the columns and rows of the tiles containing many points at once.
+        Unlike `get_column_row`, latitudes are clamped to `MAX_LATITUDE` and
+        tiles to the grid, so points at the poles or on the antimeridian map to
+        its edge tiles.
+        Args:
+          latitudes (Sequence[float]):
+            Latitudes of the points.
+          longitudes (Sequence[float]):
+            Longitudes of the points, in the same order.
+          zoom (int):
+            Zoom level of the tiles.
+          use_numpy (Optional[bool]):
+            Whether to compute NumPy arrays, defaults to True if NumPy is installed.
+        Returns:
+          Columns and rows as int32 NumPy arrays, or as `array("i")` without NumPy.
+        """
+
+        columns, rows, _, _ = MercatorProjection._get_pixels(
+            latitudes, longitudes, zoom, 1, use_numpy
+        )
+        return columns, rows
+
+    @staticmethod
+    def get_pixels_in_tiles(
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        zoom: int,
+        tile_size: int = 256,
+        use_numpy: Optional[bool] = None,
+    ) -> Tuple[Union[array, "numpy.ndarray"], ...]:
+        """Returns the tiles containing many points and the pixels of the points
+        within them, counted from the top left corner of each tile.
+        Args:
+          latitudes (Sequence[float]):
+            Latitudes of the points.
+          longitudes (Sequence[float]):
+            Longitudes of the points, in the same order.
+          zoom (int):
+            Zoom level of the tiles.
+          tile_size (int):
+            Width and height of the tiles in pixels, e.g. 512 for tiles
+            requested with `size=512`.
+          use_numpy (Optional[bool]):
+            Whether to compute NumPy arrays, defaults to True if NumPy is installed.
+        Returns:
+          Columns, rows, x and y pixels, see `get_columns_rows`.
+        """
+
+        return MercatorProjection._get_pixels(
+            latitudes, longitudes, zoom, tile_size, use_numpy
+        )
+
+    @staticmethod
+    def _get_pixels(latitudes, longitudes, zoom, tile_size, use_numpy):
+        if len(latitudes) != len(longitudes):
+            raise HEREError("latitudes and longitudes must have the same length.")
+        max_pixel = (1 << zoom) * tile_size - 1
+        if Utils.use_numpy(use_numpy):
+            latitudes = numpy.clip(
+                numpy.asarray(latitudes, dtype=numpy.float64),
+                -MercatorProjection.MAX_LATITUDE,
+                MercatorProjection.MAX_LATITUDE,
+            )
+            x, y = MercatorProjection._project(
+                latitudes, numpy.asarray(longitudes, dtype=numpy.float64), zoom, numpy
+            )
+            x = numpy.clip(numpy.floor(x * tile_size), 0, max_pixel).astype(numpy.int64)
+            y = numpy.clip(numpy.floor(y * tile_size), 0, max_pixel).astype(numpy.int64)
+            return (
+                (x // tile_size).astype(numpy.int32),
+                (y // tile_size).astype(numpy.int32),
+                (x % tile_size).astype(numpy.int32),
+                (y % tile_size).astype(numpy.int32),
+            )
+        columns, rows, pixel_xs, pixel_ys = (array("i") for _ in range(4))
+        for latitude, longitude in zip(latitudes, longitudes):
+            latitude = max(
+                -MercatorProjection.MAX_LATITUDE,
+                min(MercatorProjection.MAX_LATITUDE, latitude),
+            )
+            x, y = MercatorProjection._project(latitude, longitude, zoom, math)
+            x = min(max(math.floor(x * tile_size), 0), max_pixel)
+            y = min(max(math.floor(y * tile_size), 0), max_pixel)
+            columns.append(x // tile_size)
+            rows.append(y // tile_size)
+            pixel_xs.append(x % tile_size)
+            pixel_ys.append(y % tile_size)
+        return columns, rows, pixel_xs, pixel_ys
+
+    @staticmethod
+    def _project(latitude, longitude, zoom, functions):
+        """Returns the position of a point in tiles from the top left corner of
+        the grid, with `functions` being either the `math` or `numpy` module."""
+        lat_rad = latitude * math.pi / 180
+        n = float(1 << zoom)
+        x = n * ((longitude + 180) / 360)
+        y = (
+            n
+            * (
+                1
+                - functions.log(functions.tan(lat_rad) + 1 / functions.cos(lat_rad))
+                / math.pi
+            )
+            / 2
+        )
+        return x, y
+
+    @staticmethod
+    def get_tile_bounds(
+        columns: Sequence[int],
+        rows: Sequence[int],
+        zoom: int,
+        use_numpy: Optional[bool] = None,
+    ) -> Tuple[Union[array, "numpy.ndarray"], ...]:
+        """Returns the coordinates of the edges of many tiles at once.
+        Args:
+          columns (Sequence[int]):
+            Columns of the tiles.
+          rows (Sequence[int]):
+            Rows of the tiles, in the same order.
+          zoom (int):
+            Zoom level of the tiles.
+          use_numpy (Optional[bool]):
+            Whether to compute NumPy arrays, defaults to True if NumPy is installed.
+        Returns:
+          North and south latitudes and west and east longitudes, in the order
+          north, west, south, east, as float64 NumPy arrays, or as `array("d")`
+          without NumPy.
+        """
+
+        if len(columns) != len(rows):
+            raise HEREError("columns and rows must have the same length.")
+        n = float(1 << zoom)
+        if Utils.use_numpy(use_numpy):
+            columns = numpy.asarray(columns, dtype=numpy.float64)
+            rows = numpy.asarray(rows, dtype=numpy.float64)
+            return (
+                numpy.degrees(numpy.arctan(numpy.sinh(math.pi * (1 - 2 * rows / n)))),
+                columns / n * 360 - 180,
+                numpy.degrees(
+                    numpy.arctan(numpy.sinh(math.pi * (1 - 2 * (rows + 1) / n)))
+                ),
+                (columns + 1) / n * 360 - 180,
+            )
+        norths, wests, souths, easts = (array("d") for _ in range(4))
+        for column, row in zip(columns, rows):
+            norths.append(
+                math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+            )
+            wests.append(column / n * 360 - 180)
+            souths.append(
+                math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (row + 1) / n))))
+            )
+            easts.append((column + 1) / n * 360 - 180)
+        return norths, wests, souths, easts
+
+    @staticmethod
+    def get_quadkeys(
+        columns: Sequence[int],
+        rows: Sequence[int],
+        zoom: int,
+        use_numpy: Optional[bool] = None,
+    ) -> Union[List[str], "numpy.ndarray"]:
+        """Returns the quadkeys of many tiles at once, the strings of `zoom` digits
+        naming a tile by the quadrant it lies in at every zoom level.
+        Args:
+          columns (Sequence[int]):
+            Columns of the tiles.
+          rows (Sequence[int]):
+            Rows of the tiles, in the same order.
+          zoom (int):
+            Zoom level of the tiles, at least 1.
+          use_numpy (Optional[bool]):
+            Whether to compute a NumPy array, defaults to True if NumPy is installed.
+        Returns:
+          Quadkeys as a NumPy array of strings, or as a list without NumPy.
+        """
+
+        if len(columns) != len(rows):
+            raise HEREError("columns and rows must have the same length.")
+        if zoom < 1:
+            raise HEREError("Quadkeys need a zoom level of at least 1.")
+        if Utils.use_numpy(use_numpy):
+            columns = numpy.asarray(columns, dtype=numpy.int64)
+            rows = numpy.asarray(rows, dtype=numpy.int64)
+            shifts = numpy.arange(zoom - 1, -1, -1, dtype=numpy.int64)
+            digits = ((columns[:, None] >> shifts) & 1) | (
+                ((rows[:, None] >> shifts) & 1) << 1
+            )
+            characters = (digits + ord("0")).astype(numpy.uint8)
+            return characters.view("S" + str(zoom)).ravel().astype("U")
+        return [
+            "".join(
+                str(((column >> shift) & 1) | (((row >> shift) & 1) << 1))
+                for shift in range(zoom - 1, -1, -1)
+            )
+            for column, row in zip(columns, rows)
+        ]
+
+    @staticmethod
+    def get_tiles_from_quadkeys(
+        quadkeys: Iterable[str], use_numpy: Optional[bool] = None
+    ) -> Tuple[Union[array, "numpy.ndarray"], ...]:
+        """Returns the tiles named by many quadkeys at once, see `get_quadkeys`.
+        Args:
+          quadkeys (Iterable[str]):
+            Quadkeys, of any zoom levels.
+          use_numpy (Optional[bool]):
+            Whether to compute NumPy arrays, defaults to True if NumPy is installed.
+        Returns:
+          Columns, rows and zoom levels as int32 NumPy arrays, or as `array("i")`
+          without NumPy.
+        Raises:
+          HEREError
+            If a quadkey holds characters other than the digits 0 to 3.
+        """
+
+        if Utils.use_numpy(use_numpy):
+            quadkeys = numpy.asarray(list(quadkeys), dtype="S")
+            if quadkeys.size == 0:
+                empty = numpy.zeros(0, dtype=numpy.int32)
+                return empty, empty.copy(), empty.copy()
+            characters = quadkeys.view(numpy.uint8).reshape(len(quadkeys), -1)
+            zooms = numpy.count_nonzero(characters, axis=1)
+            digits = characters.astype(numpy.int64) - ord("0")
+            padding = numpy.arange(characters.shape[1]) >= zooms[:, None]
+            if numpy.any(~padding & ((digits < 0) | (digits > 3))):
+                raise HEREError("Quadkeys may only hold the digits 0 to 3.")
+            digits[padding] = 0
+            shifts = numpy.maximum(
+                zooms[:, None] - 1 - numpy.arange(digits.shape[1]), 0
+            )
+            columns = ((digits & 1) << shifts).sum(axis=1)
+            rows = ((digits >> 1) << shifts).sum(axis=1)
+            return (
+                columns.astype(numpy.int32),
+                rows.astype(numpy.int32),
+                zooms.astype(numpy.int32),
+            )
+        columns, rows, zooms = array("i"), array("i"), array("i")
+        for quadkey in quadkeys:
+            column = row = 0
+            for character in quadkey:
+                digit = ord(character) - ord("0")
+                if not 0 <= digit <= 3:
+                    raise HEREError("Quadkeys may only hold the digits 0 to 3.")
+                column = (column << 1) | (digit & 1)
+                row = (row << 1) | (digit >> 1)
+            columns.append(column)
+            rows.append(row)
+            zooms.append(len(quadkey))
+        return columns, rows, zooms
@@ -1,11 +1,44 @@
 import json
+import math
+from array import array
+from collections.abc import Sequence
+from typing import Any, Iterator, List, Optional
+
+from herepy.error import HEREError
+from herepy.flexible_polyline import FlexiblePolyline
+from herepy.utils import Utils
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def _array_to_list(value):
+    """Serializes the arrays `json` does not know to lists."""
+    if isinstance(value, array):
+        return value.tolist()
+    raise TypeError(
+        str.format("Object of type {0} is not JSON serializable", type(value).__name__)
+    )
 
 
 class HEREModel(object):
-    """Base class from which all here models will inherit."""
+    """Base class from which all here models will inherit.
+
+    A model wraps the JSON dict of a response without copying it. Attributes
+    named in `param_defaults` are read from the dict when accessed, values
+    assigned to attributes are kept apart so the dict itself is never modified.
+    """
+
+    __slots__ = ("_data", "_overrides", "_param_defaults")
+
+    param_defaults = {}
 
     def __init__(self, **kwargs):
-        self.param_defaults = {}
+        self._data = kwargs
+        self._overrides = None
+        self._param_defaults = None
 
     def __str__(self):
         """Returns a string representation of HEREModel. By default
@@ -18,285 +51,651 @@ class HEREModel(object):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __getattr__(self, name):
+        # Only called for names which are not slots, i.e. response fields.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        overrides = self._overrides
+        if overrides is not None and name in overrides:
+            return overrides[name]
+        param_defaults = self._get_param_defaults()
+        if name not in param_defaults:
+            raise AttributeError(
+                str.format("{0} has no attribute {1}", type(self).__name__, name)
+            )
+        try:
+            return self._data[name]
+        except KeyError:
+            default = param_defaults[name]
+        if isinstance(default, (list, dict)):
+            # Mutable defaults are copied once per instance.
+            default = type(default)(default)
+            setattr(self, name, default)
+        return default
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+            return
+        if self._overrides is None:
+            self._overrides = {}
+        self._overrides[name] = value
+
+    @property
+    def _json(self):
+        """JSON dict the model was created from."""
+        return self._data
+
+    def _get_param_defaults(self):
+        if self._param_defaults is not None:
+            return self._param_defaults
+        return self.param_defaults
+
     def as_json_string(self):
         """Returns the HEREModel as a JSON string based on key/value
-        pairs returned from the as_dict() method."""
-        return json.dumps(self.as_dict(), sort_keys=True)
+        pairs returned from the as_dict() method. Arrays of streamed results
+        are written as lists."""
+        return json.dumps(self.as_dict(), sort_keys=True, default=_array_to_list)
 
     def as_dict(self):
-        """Create a dictionary representation of the object. Please see inline
-        comments on construction when dictionaries contain HEREModels."""
+        """Create a dictionary representation of the object. Values read from the
+        JSON dict are returned as they are, only assigned values may contain
+        HEREModels which are converted with their as_dict() method."""
         data = {}
+        overrides = self._overrides or {}
 
-        for (key, value) in self.param_defaults.items():
+        for key in self._get_param_defaults():
+            value = getattr(self, key, None)
+
+            # Values of the JSON dict are plain JSON types, lists are kept
+            # even if empty and other values only if they are set.
+            if key not in overrides:
+                if isinstance(value, list) or value:
+                    data[key] = value
 
             # If the value is a list, we need to create a list to hold the
             # dicts created by an object supporting the as_dict() method,
             # i.e., if it inherits from HEREModel. If the item in the list
             # doesn't support the as_dict() method, then we assign the value
-            # directly. An example being a list of Media objects contained
-            # within a Status object.
-            if isinstance(getattr(self, key, None), (list, tuple, set)):
-                data[key] = list()
-                for subobj in getattr(self, key, None):
-                    if getattr(subobj, "as_dict", None):
-                        data[key].append(subobj.as_dict())
-                    else:
-                        data[key].append(subobj)
+            # directly.
+            elif isinstance(value, (list, tuple, set)):
+                data[key] = [
+                    item.as_dict() if getattr(item, "as_dict", None) else item
+                    for item in value
+                ]
 
             # Not a list, *but still a subclass of HEREModel* and
             # and we can assign the data[key] directly with the as_dict()
-            # method of the object. An example being a Status object contained
-            # within a User object.
-            elif getattr(getattr(self, key, None), "as_dict", None):
-                data[key] = getattr(self, key).as_dict()
+            # method of the object.
+            elif getattr(value, "as_dict", None):
+                data[key] = value.as_dict()
 
             # If the value doesn't have an as_dict() method, i.e., it's not
             # something that subclasses HEREModel, then we can use direct
             # assigment.
-            elif getattr(self, key, None):
-                data[key] = getattr(self, key, None)
+            elif value:
+                data[key] = value
         return data
 
     @classmethod
-    def new_from_jsondict(cls, data, **kwargs):
+    def new_from_jsondict(cls, data, param_defaults=None, **kwargs):
         """Create a new instance based on a JSON dict. Any kwargs should be
         supplied by the inherited, calling class.
 
         Args:
             data (dict):
               A JSON dict, as converted from the JSON in the here API.
+              It is wrapped, not copied.
+            param_defaults (dict):
+              Attributes of this instance and their defaults, added to the
+              `param_defaults` of the class.
+            kwargs:
+              Attribute values taking precedence over the JSON dict.
         """
 
-        json_data = data.copy()
-        if kwargs:
-            for key, val in kwargs.items():
-                json_data[key] = val
-
-        c = cls(**json_data)
-        c._json = data
-        return c
+        model = cls.__new__(cls)
+        model._data = data
+        model._overrides = kwargs or None
+        model._param_defaults = (
+            dict(cls.param_defaults, **param_defaults) if param_defaults else None
+        )
+        return model
 
 
 class GeocoderResponse(HEREModel):
     """A class representing the Geocoder Api response data."""
 
-    def __init__(self, **kwargs):
-        super(GeocoderResponse, self).__init__()
-        self.param_defaults = {"items": None}
+    __slots__ = ()
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    param_defaults = {"items": None}
 
 
 class GeocoderReverseResponse(HEREModel):
     """A class representing the Geocoder Reverse Api response data."""
 
-    def __init__(self, **kwargs):
-        super(GeocoderReverseResponse, self).__init__()
-        self.param_defaults = {"items": None}
+    __slots__ = ()
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    param_defaults = {"items": None}
 
 
 class RoutingResponse(HEREModel):
     """A class representing the Routing Api response data."""
 
-    def __init__(self, **kwargs):
-        super(RoutingResponse, self).__init__()
-        self.param_defaults = {"response": None, "route_short": None}
+    __slots__ = ()
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    param_defaults = {"response": None, "route_short": None}
 
 
 class RoutingResponseV8(HEREModel):
     """A class representing the Routing Api v8 response data."""
 
-    def __init__(self, **kwargs):
-        super(RoutingResponseV8, self).__init__()
-        self.param_defaults = {"routes": None}
+    __slots__ = ()
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    param_defaults = {"routes": None}
+
+    def decode_polylines(self, use_numpy: Optional[bool] = None):
+        """Decodes the polylines of all sections of all routes in one batch.
+        Args:
+          use_numpy (Optional[bool]):
+            Whether to decode into NumPy arrays, defaults to True if NumPy is installed.
+        Returns:
+          List per route with the decoded polyline of every section,
+          see `FlexiblePolyline.decode_routes`.
+        """
+
+        return FlexiblePolyline.decode_routes(self.routes or [], use_numpy)
+
+    def get_routes(self) -> List["Route"]:
+        """Returns the routes as typed `Route` objects wrapping the route dicts."""
+        return [Route.new_from_jsondict(route) for route in self.routes or []]
+
+    def get_spans(self) -> "Spans":
+        """Returns the spans of all sections of all routes as one columnar `Spans`,
+        its `section_indices` number the sections across routes in order."""
+        return Spans.from_sections(
+            section for route in self.routes or [] for section in route["sections"]
+        )
+
+
+class Route(HEREModel):
+    """A route of a Routing Api v8 response, summary fields are totals over
+    its sections."""
+
+    __slots__ = ()
+
+    param_defaults = {"id": None, "sections": None}
+
+    def get_sections(self) -> List["Section"]:
+        """Returns the sections as typed `Section` objects."""
+        return [Section.new_from_jsondict(section) for section in self.sections or []]
+
+    def get_spans(self) -> "Spans":
+        """Returns the spans of all sections as one columnar `Spans`."""
+        return Spans.from_sections(self.sections or [])
+
+    def _sum_sections(self, name: str) -> Optional[float]:
+        values = [getattr(section, name) for section in self.get_sections()]
+        values = [value for value in values if value is not None]
+        return sum(values) if values else None
+
+    @property
+    def duration(self) -> Optional[int]:
+        """Seconds needed to travel the route."""
+        return self._sum_sections("duration")
+
+    @property
+    def length(self) -> Optional[int]:
+        """Length of the route in meters."""
+        return self._sum_sections("length")
+
+    @property
+    def base_duration(self) -> Optional[int]:
+        """Seconds needed to travel the route without traffic."""
+        return self._sum_sections("base_duration")
+
+    @property
+    def toll_total(self) -> Optional[float]:
+        """Total toll cost of the route."""
+        return self._sum_sections("toll_total")
+
+
+class Section(HEREModel):
+    """A section of a Routing Api v8 route, travelled with one transport mode.
+    Summary fields are read from its `summary`, or its `travelSummary` if the
+    summary was not requested."""
+
+    __slots__ = ()
+
+    param_defaults = {
+        "id": None,
+        "type": None,
+        "departure": None,
+        "arrival": None,
+        "polyline": None,
+        "summary": None,
+        "travelSummary": None,
+        "actions": None,
+        "spans": None,
+        "transport": None,
+        "notices": None,
+        "tolls": None,
+        "tollSystems": None,
+    }
+
+    def _get_summary_value(self, name: str) -> Any:
+        summary = self._data.get("summary") or self._data.get("travelSummary")
+        if summary is None:
+            return None
+        return summary.get(name)
+
+    @property
+    def duration(self) -> Optional[int]:
+        """Seconds needed to travel the section."""
+        return self._get_summary_value("duration")
+
+    @property
+    def length(self) -> Optional[int]:
+        """Length of the section in meters."""
+        return self._get_summary_value("length")
+
+    @property
+    def base_duration(self) -> Optional[int]:
+        """Seconds needed to travel the section without traffic."""
+        return self._get_summary_value("baseDuration")
+
+    @property
+    def typical_duration(self) -> Optional[int]:
+        """Seconds typically needed to travel the section."""
+        return self._get_summary_value("typicalDuration")
+
+    @property
+    def toll_total(self) -> Optional[float]:
+        """Total toll cost of the section, in the currency of the summary."""
+        tolls = self._get_summary_value("tolls")
+        if not tolls or "total" not in tolls:
+            return None
+        return tolls["total"].get("value")
+
+    def get_actions(self) -> List["Action"]:
+        """Returns the actions as typed `Action` objects."""
+        return [Action.new_from_jsondict(action) for action in self.actions or []]
+
+    def get_spans(self) -> "Spans":
+        """Returns the spans of the section as columnar `Spans`."""
+        return Spans(self.spans or [])
+
+    def decode_polyline(self, use_numpy: Optional[bool] = None):
+        """Decodes the polyline of the section, see `FlexiblePolyline.decode`."""
+        return FlexiblePolyline.decode(self.polyline, use_numpy)
+
+
+class Action(HEREModel):
+    """A maneuver or instruction of a Routing Api v8 section."""
+
+    __slots__ = ()
+
+    param_defaults = {
+        "action": None,
+        "duration": None,
+        "length": None,
+        "instruction": None,
+        "offset": None,
+        "direction": None,
+        "severity": None,
+        "exit": None,
+        "currentRoad": None,
+        "nextRoad": None,
+        "turnAngle": None,
+    }
+
+
+class Span(HEREModel):
+    """A part of a Routing Api v8 section along which the requested span
+    attributes do not change, starting at the polyline point `offset`."""
+
+    __slots__ = ()
+
+    param_defaults = {
+        "offset": None,
+        "length": None,
+        "duration": None,
+        "baseDuration": None,
+        "typicalDuration": None,
+        "consumption": None,
+        "speedLimit": None,
+        "dynamicSpeedInfo": None,
+        "functionalClass": None,
+        "names": None,
+        "routeNumbers": None,
+        "countryCode": None,
+        "stateCode": None,
+        "streetAttributes": None,
+        "carAttributes": None,
+        "truckAttributes": None,
+        "walkAttributes": None,
+        "segmentRef": None,
+        "notices": None,
+        "incidents": None,
+        "tollSystems": None,
+    }
+
+
+class Spans(Sequence):
+    """Columnar view of the spans of one or many sections.
+
+    Numeric span attributes are extracted once into arrays by `column`, so
+    analytics run over arrays instead of looking every attribute up in every
+    span dict. Single spans are still available as `Span` objects by index.
+    """
+
+    __slots__ = ("_spans", "_section_indices", "_columns")
+
+    def __init__(self, spans: List[dict], section_indices: Optional[array] = None):
+        """Returns a Spans instance.
+        Args:
+          spans (List[dict]):
+            Span dicts of a Routing Api v8 response.
+          section_indices (Optional[array]):
+            Index of the section of every span, all spans belong to
+            section 0 if not given.
+        """
+
+        self._spans = spans
+        if section_indices is None:
+            section_indices = array("i", [0]) * len(spans)
+        self._section_indices = section_indices
+        self._columns = {}
+
+    @classmethod
+    def from_sections(cls, sections) -> "Spans":
+        """Returns the spans of several section dicts as one `Spans`."""
+        spans = []
+        section_indices = array("i")
+        for index, section in enumerate(sections):
+            section_spans = section.get("spans") or []
+            spans.extend(section_spans)
+            section_indices.extend([index] * len(section_spans))
+        return cls(spans, section_indices)
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Spans(self._spans[index], self._section_indices[index])
+        return Span.new_from_jsondict(self._spans[index])
+
+    def __iter__(self) -> Iterator[Span]:
+        for span in self._spans:
+            yield Span.new_from_jsondict(span)
+
+    @property
+    def section_indices(self) -> array:
+        """Index of the section of every span."""
+        return self._section_indices
+
+    @property
+    def offsets(self) -> array:
+        """Index of the first polyline point of every span in its section."""
+        return self.column("offset", typecode="i", default=0, use_numpy=False)
+
+    def column(
+        self,
+        name: str,
+        typecode: str = "d",
+        default: float = math.nan,
+        use_numpy: Optional[bool] = None,
+    ):
+        """Returns a numeric attribute of every span. Columns are built once and
+        cached, NumPy arrays are read-only and `array.array` ones must not be
+        modified.
+        Args:
+          name (str):
+            Span attribute, e.g. "length" or "speedLimit". Attributes nested in
+            objects are named by their path, e.g. "dynamicSpeedInfo.trafficSpeed".
+          typecode (str):
+            Type of the values, as used by `array.array`.
+          default (float):
+            Value of spans without the attribute.
+          use_numpy (Optional[bool]):
+            Whether to return a NumPy array, defaults to True if NumPy is installed.
+        Returns:
+          Array with one value per span.
+        Raises:
+          HEREError: If a value of the attribute does not fit `typecode`.
+        """
+
+        use_numpy = Utils.use_numpy(use_numpy)
+        key = (name, typecode, default, use_numpy)
+        values = self._columns.get(key)
+        if values is not None:
+            return values
+        path = name.split(".")
+        if len(path) == 1:
+            items = [span.get(name, default) for span in self._spans]
+        else:
+            items = [self._get_nested(span, path, default) for span in self._spans]
+        try:
+            values = array(typecode, items)
+        except TypeError:
+            raise HEREError(
+                str.format("Span attribute {0} does not fit type {1}", name, typecode)
+            )
+        if use_numpy:
+            values = numpy.frombuffer(values, dtype=values.typecode)
+            values.setflags(write=False)
+        self._columns[key] = values
+        return values
+
+    @staticmethod
+    def _get_nested(span: dict, path: List[str], default: float) -> Any:
+        value = span
+        for key in path:
+            if not isinstance(value, dict) or key not in value:
+                return default
+            value = value[key]
+        return value
 
 
 class RoutingMatrixResponse(HEREModel):
-    """A class representing the Routing Api matrix response data."""
+    """A class representing the Routing Api matrix response data.
+
+    Entries of the matrix are ordered by origin, then destination. The array
+    accessors return read-only NumPy arrays shaped (numOrigins, numDestinations)
+    when NumPy is installed, otherwise flat arrays in which the entry of origin i
+    and destination j is at index i * numDestinations + j.
+    """
+
+    __slots__ = ()
+
+    param_defaults = {
+        "matrixId": None,
+        "matrix": None,
+        "regionDefinition": None,
+    }
+
+    @property
+    def shape(self):
+        """Returns the number of origins and the number of destinations."""
+        matrix = self.matrix or {}
+        return matrix.get("numOrigins", 0), matrix.get("numDestinations", 0)
+
+    def _get_matrix_array(self, name: str, typecode: str, use_numpy: Optional[bool]):
+        use_numpy = Utils.use_numpy(use_numpy)
+        num_origins, num_destinations = self.shape
+        size = num_origins * num_destinations
+        values = (self.matrix or {}).get(name)
+        if values is None:
+            values = array(typecode, [0]) * size
+        else:
+            try:
+                values = array(typecode, values)
+            except TypeError:
+                # Entries which failed to calculate may be null.
+                values = array(typecode, [value or 0 for value in values])
+        if len(values) != size:
+            raise HEREError(
+                str.format(
+                    "Matrix {0} has {1} entries, expected {2}", name, len(values), size
+                )
+            )
+        if use_numpy:
+            values = numpy.frombuffer(values, dtype=typecode).reshape(
+                num_origins, num_destinations
+            )
+            values.setflags(write=False)
+        return values
+
+    def get_travel_times(self, use_numpy: Optional[bool] = None):
+        """Returns the travel times in seconds as 32 bit integers.
+        Args:
+          use_numpy (Optional[bool]):
+            Whether to return a NumPy array, defaults to True if NumPy is installed.
+        Returns:
+          Travel time of every entry, 0 where none was returned.
+        Raises:
+          HEREError: If the number of entries does not match the shape.
+        """
 
-    def __init__(self, **kwargs):
-        super(RoutingMatrixResponse, self).__init__()
-        self.param_defaults = {
-            "matrixId": None,
-            "matrix": None,
-            "regionDefinition": None,
-        }
+        return self._get_matrix_array("travelTimes", "i", use_numpy)
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    def get_distances(self, use_numpy: Optional[bool] = None):
+        """Returns the distances in meters as 32 bit integers.
+        Args:
+          use_numpy (Optional[bool]):
+            Whether to return a NumPy array, defaults to True if NumPy is installed.
+        Returns:
+          Distance of every entry, 0 where none was returned.
+        Raises:
+          HEREError: If the number of entries does not match the shape.
+        """
+
+        return self._get_matrix_array("distances", "i", use_numpy)
+
+    def get_error_codes(self, use_numpy: Optional[bool] = None):
+        """Returns the error code of every entry, 0 for entries calculated
+        successfully, as 8 bit integers."""
+        return self._get_matrix_array("errorCodes", "b", use_numpy)
+
+    def get_error_mask(self, use_numpy: Optional[bool] = None):
+        """Returns True for every entry which could not be calculated, as a
+        boolean NumPy array or as an `array("b")` of 0 and 1 without NumPy."""
+        error_codes = self.get_error_codes(use_numpy)
+        if isinstance(error_codes, array):
+            return array("b", [code != 0 for code in error_codes])
+        return error_codes != 0
 
 
 class GeocoderAutoCompleteResponse(HEREModel):
     """A class representing the Geocoder Autocomplete Api response data."""
 
-    def __init__(self, **kwargs):
-        super(GeocoderAutoCompleteResponse, self).__init__()
-        self.param_defaults = {"items": None}
+    __slots__ = ()
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    param_defaults = {"items": None}
 
 
 class RmeResponse(HEREModel):
     """A class representing the RME (Route Matcher) Api response data."""
 
-    def __init__(self, **kwargs):
-        super(RmeResponse, self).__init__()
-        self.param_defaults = {"RouteLinks": [], "TracePoints": [], "Warnings": []}
+    __slots__ = ()
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    param_defaults = {"RouteLinks": [], "TracePoints": [], "Warnings": []}
 
 
 class PlacesResponse(HEREModel):
     """A class representing the Places (Search) Api response data."""
 
-    def __init__(self, **kwargs):
-        super(PlacesResponse, self).__init__()
-        self.param_defaults = {"items": None}
+    __slots__ = ()
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    param_defaults = {"items": None}
 
 
 class PublicTransitResponse(HEREModel):
     """A class representing the Public Transit Api response data."""
 
-    def __init__(self, **kwargs):
-        super(PublicTransitResponse, self).__init__()
-        self.param_defaults = {"Res": None}
+    __slots__ = ()
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    param_defaults = {"Res": None}
 
 
 class TrafficIncidentResponse(HEREModel):
     """A class representing the Traffic Incidents response provided by Traffic Api."""
 
-    def __init__(self, **kwargs):
-        super(TrafficIncidentResponse, self).__init__()
-        self.param_defaults = {
-            "TIMESTAMP": None,
-            "VERSION": None,
-            "TRAFFIC_ITEMS": None,
-            "EXTENDED_COUNTRY_CODE": None,
-            "error": None,
-        }
+    __slots__ = ()
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    param_defaults = {
+        "TIMESTAMP": None,
+        "VERSION": None,
+        "TRAFFIC_ITEMS": None,
+        "EXTENDED_COUNTRY_CODE": None,
+        "error": None,
+    }
 
 
 class DestinationWeatherResponse(HEREModel):
     """A class representing the Weather Forecasts for DestinationWeather Api."""
 
-    def __init__(self, param_defaults, **kwargs):
-        super(DestinationWeatherResponse, self).__init__()
-        self.param_defaults = param_defaults
-
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    __slots__ = ()
 
-    @classmethod
-    def new_from_jsondict(cls, data, param_defaults, **kwargs):
-        """Create a new instance based on a JSON dict. Any kwargs should be
-        supplied by the inherited, calling class.
-
-        Args:
-            data (dict):
-              A JSON dict, as converted from the JSON in the here API.
-        """
-
-        json_data = data.copy()
-        if kwargs:
-            for key, val in kwargs.items():
-                json_data[key] = val
-
-        c = cls(param_defaults, **json_data)
-        c._json = data
-        return c
+    def __init__(self, param_defaults, **kwargs):
+        super(DestinationWeatherResponse, self).__init__(**kwargs)
+        self._param_defaults = param_defaults
 
 
 class EVChargingStationsResponse(HEREModel):
     """A class representing the EV Charging Stations response data."""
 
-    def __init__(self, **kwargs):
-        super(EVChargingStationsResponse, self).__init__()
-        self.param_defaults = {
-            "hasMore": False,
-            "count": 0,
-            "evStations": None,
-        }
+    __slots__ = ()
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    param_defaults = {
+        "hasMore": False,
+        "count": 0,
+        "evStations": None,
+    }
 
 
 class WaypointSequenceResponse(HEREModel):
     """A class representing the Fleet Telematics Waypoint Sequence response data."""
 
-    def __init__(self, **kwargs):
-        super(WaypointSequenceResponse, self).__init__()
-        self.param_defaults = {
-            "results": None,
-            "errors": None,
-            "warnings": None,
-        }
+    __slots__ = ()
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    param_defaults = {
+        "results": None,
+        "errors": None,
+        "warnings": None,
+    }
 
 
 class TrafficFlowResponse(HEREModel):
     """A class representing the Traffic API Flow response data."""
 
-    def __init__(self, **kwargs):
-        super(TrafficFlowResponse, self).__init__()
-        self.param_defaults = {
-            "RWS": [],
-            "error": None,
-        }
+    __slots__ = ()
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    param_defaults = {
+        "RWS": [],
+        "error": None,
+    }
 
 
 class TrafficFlowAvailabilityResponse(HEREModel):
     """A class representing the Traffic API Flow availability response data."""
 
-    def __init__(self, **kwargs):
-        super(TrafficFlowAvailabilityResponse, self).__init__()
-        self.param_defaults = {
-            "Response": [],
-            "error": None,
-        }
+    __slots__ = ()
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    param_defaults = {
+        "Response": [],
+        "error": None,
+    }
 
 
 class IsolineRoutingResponse(HEREModel):
     """A class representing the Isoline Routing API Flow response data."""
 
-    def __init__(self, **kwargs):
-        super(IsolineRoutingResponse, self).__init__()
-        self.param_defaults = {
-            "departure": None,
-            "arrival": None,
-            "isolines": [],
-            "error": None,
-        }
-
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    __slots__ = ()
+
+    param_defaults = {
+        "departure": None,
+        "arrival": None,
+        "isolines": [],
+        "error": None,
+    }
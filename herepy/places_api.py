@@ -1,11 +1,7 @@
 #!/usr/bin/env python
 
-import json
-import sys
 from typing import List, Optional
 
-import requests
-
 from herepy.error import HEREError, UnauthorizedError
 from herepy.here_api import HEREApi
 from herepy.here_enum import PlacesCategory
@@ -16,22 +12,30 @@ from herepy.utils import Utils
 class PlacesApi(HEREApi):
     """A python interface into the HERE Places (Search) API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "places"
+
+    def __init__(self, api_key: str = None, timeout: int = None, **kwargs):
         """Returns a PlacesApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(PlacesApi, self).__init__(api_key, timeout)
+        super(PlacesApi, self).__init__(api_key, timeout, **kwargs)
         self._base_url = "https://discover.search.hereapi.com/v1/discover"
 
-    def __get(self, data):
+    def __get(self, data, function_name):
         url = Utils.build_url(self._base_url, extra_params=data)
-        response = requests.get(url, timeout=self._timeout)
-        json_data = json.loads(response.content.decode("utf8"))
+        return self._send(
+            "GET", url, lambda response: self.__parse_response(response, function_name)
+        )
+
+    def __parse_response(self, response, function_name):
+        json_data = self._decode_json(response)
         if json_data.get("items") != None:
             return PlacesResponse.new_from_jsondict(json_data)
         elif "error" in json_data:
@@ -39,9 +43,7 @@ class PlacesApi(HEREApi):
                 raise UnauthorizedError(json_data["error_description"])
         else:
             raise HEREError(
-                json_data.get(
-                    "message", "Error occurred on " + sys._getframe(1).f_code.co_name
-                )
+                json_data.get("message", "Error occurred on " + function_name)
             )
 
     def onebox_search(
@@ -69,7 +71,7 @@ class PlacesApi(HEREApi):
             "lang": lang,
             "apiKey": self._api_key,
         }
-        return self.__get(data)
+        return self.__get(data, "onebox_search")
 
     def search_in_country(
         self,
@@ -104,7 +106,7 @@ class PlacesApi(HEREApi):
             "lang": lang,
             "apiKey": self._api_key,
         }
-        return self.__get(data)
+        return self.__get(data, "search_in_country")
 
     def places_in_circle(
         self,
@@ -138,4 +140,4 @@ class PlacesApi(HEREApi):
             "lang": lang,
             "apiKey": self._api_key,
         }
-        return self.__get(data)
+        return self.__get(data, "places_in_circle")
@@ -4,14 +4,18 @@ from herepy.here_api import HEREApi
 class TourPlanningApi(HEREApi):
     """A python interface into the HERE Tour Planning API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "tour_planning"
+
+    def __init__(self, api_key: str = None, timeout: int = None, **kwargs):
         """Returns a TourPlanningApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(TourPlanningApi, self).__init__(api_key, timeout)
+        super(TourPlanningApi, self).__init__(api_key, timeout, **kwargs)
         self._base_url = "https://tourplanning.hereapi.com/v3/"
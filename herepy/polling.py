@@ -1,7 +1,17 @@
 #!/usr/bin/env python
 # taken from https://github.com/justiniso/polling/blob/master/polling.py
 
+import asyncio
+import heapq
+import itertools
+import random
+import threading
 import time
+from concurrent.futures import TimeoutError
+
+import requests
+
+from herepy.error import HEREError
 
 try:
     from Queue import Queue
@@ -133,3 +143,124 @@ def poll(
 
         time.sleep(step)
         step = step_function(step)
+
+
+def step_jitter(step, jitter=0.1):
+    """Use this function to spread the polls of many targets started at the same time, it randomizes
+    the step by up to `jitter` of its value in both directions"""
+    return step * random.uniform(1 - jitter, 1 + jitter)
+
+
+class Poller(object):
+    """Polls the status of many `herepy.Job` instances from a single background thread.
+
+    Jobs are kept in a queue ordered by the time of their next status request, so
+    a single thread serves any number of outstanding calculations. The step of
+    every job grows with its backoff and is randomized by `jitter` so jobs
+    submitted together do not poll in lockstep. A job reaching its deadline fails
+    with a TimeoutError.
+    """
+
+    def __init__(self, jitter: float = 0.1):
+        """Returns a Poller instance.
+        Args:
+          jitter (float):
+            Fraction by which the step of a job is randomized in both directions.
+        """
+
+        self._jitter = jitter
+        self._queue = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        with self._condition:
+            return len(self._queue)
+
+    def add(self, job, timeout=None):
+        """Starts polling `job` in the background.
+        Args:
+          job (herepy.Job):
+            Job created by a synchronous client, e.g. `RoutingApi.submit_async_matrix`.
+          timeout (Optional[float]):
+            Seconds after which the job fails with a TimeoutError, no deadline if not given.
+        Returns:
+          The given job.
+        Raises:
+          HEREError: If the poller is closed or the job belongs to an async client.
+        """
+
+        if asyncio.iscoroutinefunction(job._request_status):
+            raise HEREError("Jobs of async clients are polled by awaiting them.")
+        now = time.monotonic()
+        deadline = None if timeout is None else now + timeout
+        with self._condition:
+            if self._closed:
+                raise HEREError("Poller is closed.")
+            job._poller = self
+            heapq.heappush(self._queue, (now, next(self._sequence), job, deadline))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="herepy-poller", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return job
+
+    def close(self):
+        """Stops the background thread, jobs still being polled are cancelled."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed and (
+                    not self._queue or self._queue[0][0] > time.monotonic()
+                ):
+                    wait_time = None
+                    if self._queue:
+                        wait_time = self._queue[0][0] - time.monotonic()
+                    self._condition.wait(wait_time)
+                if self._closed:
+                    remaining = [entry[2] for entry in self._queue]
+                    self._queue = []
+                    break
+                _, _, job, deadline = heapq.heappop(self._queue)
+            self._poll(job, deadline)
+        for job in remaining:
+            job.cancel()
+
+    def _poll(self, job, deadline):
+        if job.done():
+            return
+        if deadline is not None and time.monotonic() >= deadline:
+            job._fail(TimeoutError(str.format("Job {0} timed out.", job.id)))
+            return
+        try:
+            if job.poll():
+                return
+        except requests.RequestException:
+            # Transport errors are retried with the next step until the deadline.
+            pass
+        except Exception as exception:
+            job._fail(exception)
+            return
+        now = time.monotonic()
+        step = step_jitter(job._next_step(), self._jitter)
+        due = now + step
+        if deadline is not None:
+            due = min(due, deadline)
+        with self._condition:
+            heapq.heappush(self._queue, (due, next(self._sequence), job, deadline))
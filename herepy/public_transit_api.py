@@ -1,11 +1,7 @@
 #!/usr/bin/env python
 
-import json
-import sys
 from typing import List, Optional
 
-import requests
-
 from herepy.error import HEREError, UnauthorizedError
 from herepy.here_api import HEREApi
 from herepy.here_enum import (PublicTransitModeType, PublicTransitRoutingMode,
@@ -17,34 +13,49 @@ from herepy.utils import Utils
 class PublicTransitApi(HEREApi):
     """A python interface into the HERE Public Transit API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "public_transit"
+
+    def __init__(self, api_key: str = None, timeout: int = None, **kwargs):
         """Returns a PublicTransitApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(PublicTransitApi, self).__init__(api_key, timeout)
+        super(PublicTransitApi, self).__init__(api_key, timeout, **kwargs)
         self._base_url = "https://transit.ls.hereapi.com/v3/"
 
-    def __get(self, data, path, json_node):
+    def __get(self, data, path, json_node, function_name, post_process=None):
         url = Utils.build_url(self._base_url + path, extra_params=data)
-        response = requests.get(url, timeout=self._timeout)
-        json_data = json.loads(response.content.decode("utf8"))
+        return self._send(
+            "GET",
+            url,
+            lambda response: self.__parse_response(
+                response, json_node, function_name, post_process
+            ),
+        )
+
+    def __parse_response(self, response, json_node, function_name, post_process=None):
+        json_data = self._decode_json(response)
         if json_node in json_data.get("Res", {}):
-            return PublicTransitResponse.new_from_jsondict(json_data)
+            public_transit_response = PublicTransitResponse.new_from_jsondict(json_data)
+            if post_process:
+                return post_process(public_transit_response)
+            return public_transit_response
         elif "text" in json_data.get("Res", {}).get("Message", {}):
             raise HEREError(
                 json_data["Res"]["Message"]["text"],
-                "Error occurred on " + sys._getframe(1).f_code.co_name,
+                "Error occurred on " + function_name,
             )
         elif "error" in json_data:
             if json_data["error"] == "Unauthorized":
                 raise UnauthorizedError(json_data["error_description"])
         else:
-            raise HEREError("Error occurred on " + sys._getframe(1).f_code.co_name)
+            raise HEREError("Error occurred on " + function_name)
 
     def find_stations_by_name(
         self,
@@ -80,7 +91,9 @@ class PublicTransitApi(HEREApi):
             "method": method.__str__(),
             "radius": radius,
         }
-        return self.__get(data, "stations/by_name.json", "Stations")
+        return self.__get(
+            data, "stations/by_name.json", "Stations", "find_stations_by_name"
+        )
 
     def find_stations_nearby(
         self, center: List[float], radius: int = 500, max_count: int = 5
@@ -105,7 +118,9 @@ class PublicTransitApi(HEREApi):
             "apikey": self._api_key,
             "max": max_count,
         }
-        return self.__get(data, "stations/by_geocoord.json", "Stations")
+        return self.__get(
+            data, "stations/by_geocoord.json", "Stations", "find_stations_nearby"
+        )
 
     @classmethod
     def __prepare_station_ids(cls, ids):
@@ -135,7 +150,9 @@ class PublicTransitApi(HEREApi):
             "lang": lang,
             "apikey": self._api_key,
         }
-        return self.__get(data, "stations/by_ids.json", "Stations")
+        return self.__get(
+            data, "stations/by_ids.json", "Stations", "find_stations_by_id"
+        )
 
     def find_transit_coverage_in_cities(
         self, center: List[float], political_view: str, radius: int
@@ -160,7 +177,9 @@ class PublicTransitApi(HEREApi):
             "radius": radius,
             "apikey": self._api_key,
         }
-        return self.__get(data, "coverage/city.json", "Coverage")
+        return self.__get(
+            data, "coverage/city.json", "Coverage", "find_transit_coverage_in_cities"
+        )
 
     def next_nearby_departures_of_station(
         self, station_id: int, time: str, lang: str = "en"
@@ -185,7 +204,9 @@ class PublicTransitApi(HEREApi):
             "time": time,
             "apikey": self._api_key,
         }
-        return self.__get(data, "board.json", "NextDepartures")
+        return self.__get(
+            data, "board.json", "NextDepartures", "next_nearby_departures_of_station"
+        )
 
     def next_departures_from_location(
         self,
@@ -221,7 +242,12 @@ class PublicTransitApi(HEREApi):
             "max": max,
             "maxStn": max_station,
         }
-        return self.__get(data, "multiboard/by_geocoord.json", "MultiNextDepartures")
+        return self.__get(
+            data,
+            "multiboard/by_geocoord.json",
+            "MultiNextDepartures",
+            "next_departures_from_location",
+        )
 
     def next_departures_for_stations(
         self,
@@ -257,7 +283,12 @@ class PublicTransitApi(HEREApi):
             "maxStn": max_station,
             "stnIds": self.__prepare_station_ids(station_ids),
         }
-        return self.__get(data, "multiboard/by_stn_ids.json", "MultiNextDepartures")
+        return self.__get(
+            data,
+            "multiboard/by_stn_ids.json",
+            "MultiNextDepartures",
+            "next_departures_for_stations",
+        )
 
     def calculate_route(
         self,
@@ -340,9 +371,13 @@ class PublicTransitApi(HEREApi):
         if modes is not None:
             data["modes"] = modes
 
-        response = self.__get(data, "route.json", "Connections")
-        response_with_short_route = self._get_response_with_short_route(response)
-        return response_with_short_route
+        return self.__get(
+            data,
+            "route.json",
+            "Connections",
+            "calculate_route",
+            self._get_response_with_short_route,
+        )
 
     def coverage_witin_a_city(
         self,
@@ -381,7 +416,9 @@ class PublicTransitApi(HEREApi):
         }
         if max is None:
             del data["max"]
-        return self.__get(data, "coverage/search.json", "Coverage")
+        return self.__get(
+            data, "coverage/search.json", "Coverage", "coverage_witin_a_city"
+        )
 
     def coverage_nearby(
         self, details: int, center: List[float]
@@ -402,7 +439,9 @@ class PublicTransitApi(HEREApi):
             "center": str.format("{0},{1}", center[0], center[1]),
             "apikey": self._api_key,
         }
-        return self.__get(data, "coverage/nearby.json", "LocalCoverage")
+        return self.__get(
+            data, "coverage/nearby.json", "LocalCoverage", "coverage_nearby"
+        )
 
     def _get_response_with_short_route(self, public_transit_response):
         response = public_transit_response
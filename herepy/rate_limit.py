@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket(object):
+    """Thread safe token bucket refilled at `rate` tokens per second, holding at
+    most `burst` tokens.
+
+    Tokens are reserved rather than taken: a caller always gets its token and
+    is told how long to wait before using it. Waiting then happens outside of
+    the lock, with `time.sleep` in threads or `asyncio.sleep` in coroutines, so
+    the same bucket throttles both.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """Returns a TokenBucket instance.
+        Args:
+          rate (float):
+            Tokens added per second.
+          burst (Optional[float]):
+            Maximum number of tokens stored, i.e. of requests sent at once after
+            an idle period. Defaults to `rate`, but at least 1.
+        """
+
+        self.rate = rate
+        self.burst = max(1.0, rate) if burst is None else burst
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Reserves `tokens` tokens.
+        Returns:
+          Seconds to wait before the tokens may be used.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Blocks until `tokens` tokens are available.
+        Returns:
+          Seconds waited.
+        """
+
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, tokens: float = 1) -> float:
+        """Waits without blocking the event loop until `tokens` tokens are available.
+        Returns:
+          Seconds waited.
+        """
+
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class RateLimiter(object):
+    """Client side rate limiter with one token bucket per service family, e.g.
+    `RateLimiter({"routing": 10, "geocoding": 5, "matrix": 1})`.
+
+    Wrappers given the same limiter share its buckets, across threads and event
+    loops. `RateLimiter.shared` returns one limiter per API key, so every wrapper
+    of a key runs at the QPS licensed for it.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        rates: Dict[str, float],
+        default_rate: Optional[float] = None,
+        bursts: Optional[Dict[str, float]] = None,
+    ):
+        """Returns a RateLimiter instance.
+        Args:
+          rates (Dict[str, float]):
+            Requests per second allowed per service, keyed by the `SERVICE` of the
+            wrappers, e.g. "routing", "matrix", "geocoding" or "tiles".
+          default_rate (Optional[float]):
+            Requests per second of services missing in `rates`,
+            not limited if not given.
+          bursts (Optional[Dict[str, float]]):
+            Requests sent at once after an idle period per service,
+            defaults to the rate of the service.
+        """
+
+        self._rates = dict(rates)
+        self._default_rate = default_rate
+        self._bursts = dict(bursts or {})
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(
+        cls, key: str, rates: Optional[Dict[str, float]] = None, **kwargs
+    ) -> "RateLimiter":
+        """Returns the limiter of `key`, usually the API key, creating it from
+        `rates` and `kwargs` on the first call. Later calls ignore them."""
+        with cls._shared_lock:
+            limiter = cls._shared.get(key)
+            if limiter is None:
+                limiter = cls(rates or {}, **kwargs)
+                cls._shared[key] = limiter
+            return limiter
+
+    def get_bucket(self, service: Optional[str]) -> Optional[TokenBucket]:
+        """Returns the bucket of `service`, None if it is not limited."""
+        with self._lock:
+            bucket = self._buckets.get(service)
+            if bucket is None:
+                rate = self._rates.get(service, self._default_rate)
+                if rate is None:
+                    return None
+                bucket = TokenBucket(rate, self._bursts.get(service))
+                self._buckets[service] = bucket
+            return bucket
+
+    def acquire(self, service: Optional[str]) -> float:
+        """Blocks until a request to `service` may be sent.
+        Returns:
+          Seconds waited.
+        """
+
+        bucket = self.get_bucket(service)
+        if bucket is None:
+            return 0.0
+        return bucket.acquire()
+
+    async def acquire_async(self, service: Optional[str]) -> float:
+        """Waits without blocking the event loop until a request to `service`
+        may be sent.
+        Returns:
+          Seconds waited.
+        """
+
+        bucket = self.get_bucket(service)
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire_async()
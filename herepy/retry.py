@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+
+import email.utils
+import random
+import time
+from typing import Iterable, Mapping, Optional
+
+
+class RetryPolicy(object):
+    """Decides whether and when a failed request is sent again.
+
+    Requests are retried on connection errors, timeouts and the `status_codes`
+    answers of the service, only for the idempotent `methods` by default. The
+    delay before attempt n is drawn from [0, backoff_factor * 2 ** (n - 2)]
+    (exponential backoff with full jitter), capped by `max_backoff`. A
+    `Retry-After` header of a 429 or 503 answer takes precedence. No attempt is
+    made once `max_attempts` or `max_elapsed` seconds are reached.
+    """
+
+    DEFAULT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+    DEFAULT_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        max_elapsed: Optional[float] = 60.0,
+        methods: Iterable[str] = DEFAULT_METHODS,
+        status_codes: Iterable[int] = DEFAULT_STATUS_CODES,
+        respect_retry_after: bool = True,
+    ):
+        """Returns a RetryPolicy instance.
+        Args:
+          max_attempts (int):
+            Maximum number of times a request is sent, including the first one.
+          backoff_factor (float):
+            Upper bound in seconds of the delay before the first retry,
+            doubled for every further retry.
+          max_backoff (float):
+            Maximum seconds to wait between two attempts.
+          max_elapsed (Optional[float]):
+            Seconds after the first attempt from which no retry is made,
+            no limit if not given.
+          methods (Iterable[str]):
+            HTTP methods which are retried.
+          status_codes (Iterable[int]):
+            Response status codes which are retried.
+          respect_retry_after (bool):
+            Whether to wait as long as the `Retry-After` header asks for.
+        """
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_elapsed = max_elapsed
+        self.methods = frozenset(method.upper() for method in methods)
+        self.status_codes = frozenset(status_codes)
+        self.respect_retry_after = respect_retry_after
+
+    def get_backoff(self, attempt: int) -> float:
+        """Returns the seconds to wait after the failed attempt number `attempt`."""
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        )
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Returns the seconds a `Retry-After` header value asks to wait,
+        given either in seconds or as a HTTP date."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, date.timestamp() - time.time())
+
+    def get_retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        elapsed: float,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[float]:
+        """Returns the seconds to wait before sending a request again.
+        Args:
+          method (str):
+            HTTP method of the request.
+          attempt (int):
+            Number of the attempt which failed, starting at 1.
+          elapsed (float):
+            Seconds passed since the first attempt.
+          status_code (Optional[int]):
+            Status code of the response, None if no response was received.
+          headers (Optional[Mapping[str, str]]):
+            Headers of the response.
+        Returns:
+          Seconds to wait, None if the request must not be sent again.
+        """
+
+        if method.upper() not in self.methods or attempt >= self.max_attempts:
+            return None
+        if status_code is not None and status_code not in self.status_codes:
+            return None
+        delay = self.get_backoff(attempt)
+        if self.respect_retry_after and headers is not None:
+            retry_after = self.parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = retry_after
+        if self.max_elapsed is not None and elapsed + delay > self.max_elapsed:
+            return None
+        return delay
@@ -1,11 +1,7 @@
 #!/usr/bin/env python
 
-import json
-import sys
 from typing import List, Optional
 
-import requests
-
 from herepy.error import HEREError
 from herepy.here_api import HEREApi
 from herepy.models import RmeResponse
@@ -15,38 +11,43 @@ from herepy.utils import Utils
 class RmeApi(HEREApi):
     """A python interface into the RME API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "rme"
+
+    def __init__(self, api_key: str = None, timeout: int = None, **kwargs):
         """Returns a RmeApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(RmeApi, self).__init__(api_key, timeout)
+        super(RmeApi, self).__init__(api_key, timeout, **kwargs)
         self._base_url = "https://m.fleet.ls.hereapi.com/2/matchroute.json"
 
-    def __get(self, data):
+    def __get(self, data, function_name):
         url = Utils.build_url(self._base_url, extra_params=data)
-        response = requests.get(url, timeout=self._timeout)
+        return self._send(
+            "GET", url, lambda response: self.__parse_response(response, function_name)
+        )
+
+    def __parse_response(self, response, function_name):
         try:
-            json_data = json.loads(response.content.decode("utf8"))
+            json_data = self._decode_json(response)
             if json_data.get("TracePoints") != None:
                 return RmeResponse.new_from_jsondict(json_data)
             else:
                 raise HEREError(
                     json_data.get(
                         "Details",
-                        "Error occurred on function " + sys._getframe(1).f_code.co_name,
+                        "Error occurred on function " + function_name,
                     )
                 )
         except ValueError as err:
             raise HEREError(
-                "Error occurred on function "
-                + sys._getframe(1).f_code.co_name
-                + " "
-                + str(err)
+                "Error occurred on function " + function_name + " " + str(err)
             )
 
     def match_route(
@@ -79,4 +80,4 @@ class RmeApi(HEREApi):
             "attributes": ",".join(pde_layers),
             "apikey": self._api_key,
         }
-        return self.__get(data)
+        return self.__get(data, "match_route")
@@ -1,15 +1,18 @@
 #!/usr/bin/env python
 
+import collections
 import datetime
-import json
-import os
+import functools
 import sys
-from typing import Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import (BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple,
+                    Union)
 from warnings import warn
 
 import requests
 
 from herepy import polling
+from herepy.cache import LRUCache
 from herepy.error import AccessDeniedError, HEREError, InvalidRequestError
 from herepy.geocoder_api import GeocoderApi
 from herepy.here_api import HEREApi
@@ -18,29 +21,61 @@ from herepy.here_enum import (MatrixRoutingMode, MatrixRoutingProfile,
                               MatrixSummaryAttribute, RouteMode,
                               RoutingApiReturnField, RoutingApiSpanField,
                               RoutingMetric, RoutingMode, RoutingTransportMode)
+from herepy.jobs import Job
+from herepy.matrix_result import Decompressor, MatrixResultParser
 from herepy.models import (RoutingMatrixResponse, RoutingResponse,
                            RoutingResponseV8)
 from herepy.objects import Avoid, Truck
 from herepy.utils import Utils
 
 
+class DownloadedMatrixResult(object):
+    """Status of an async matrix calculation whose result was already downloaded
+    while requesting the status, holds the RoutingMatrixResponse or the file
+    the result was written to."""
+
+    def __init__(self, result: Union[RoutingMatrixResponse, str, BinaryIO]):
+        self.result = result
+
+
 class RoutingApi(HEREApi):
     """A python interface into the HERE Routing API"""
 
+    SERVICE = "routing"
     URL_CALCULATE_ROUTE = "https://route.ls.hereapi.com/routing/7.2/calculateroute.json"
     URL_CALCULATE_ROUTE_V8 = "https://router.hereapi.com/v8/routes"
     URL_CALCULATE_MATRIX = "https://matrix.router.hereapi.com/v8/matrix"
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        timeout: int = None,
+        geocoding_cache: Optional[LRUCache] = None,
+        geocoding_workers: int = 8,
+        **kwargs
+    ):
         """Returns a RoutingApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          geocoding_cache (Optional[LRUCache]):
+            Cache of the coordinates of location names given as waypoints, any
+            object with the `get` and `set` methods of `LRUCache` can be used.
+            Defaults to a cache of 1024 names kept for a day.
+          geocoding_workers (int):
+            Maximum number of location names geocoded at the same time.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(RoutingApi, self).__init__(api_key, timeout)
+        super(RoutingApi, self).__init__(api_key, timeout, **kwargs)
+        if geocoding_cache is None:
+            geocoding_cache = LRUCache(maxsize=1024, ttl=24 * 60 * 60)
+        self._geocoding_cache = geocoding_cache
+        self._geocoding_workers = geocoding_workers
+        self._geocoder_api = None
 
     def __get(
         self,
@@ -51,15 +86,37 @@ class RoutingApi(HEREApi):
         manipulation_key: str = None,
         keys_for_manipulation: List = None,
         headers: Optional[Dict[str, str]] = None,
+        post_process=None,
     ):
         url = Utils.build_url(base_url, extra_params=data)
         if manipulation_key and keys_for_manipulation:
             for k in keys_for_manipulation:
                 url = url.replace(k, manipulation_key)
-        response = requests.get(url, timeout=self._timeout, headers=headers)
-        json_data = json.loads(response.content.decode("utf8"))
+        return self._send(
+            "GET",
+            url,
+            lambda response: self.__parse_response(
+                response, response_cls, post_process
+            ),
+            headers=headers,
+        )
+
+    def __parse_response(self, response, response_cls, post_process=None):
+        try:
+            json_data = self._decode_json(response)
+        except ValueError:
+            # e.g. the HTML page of a gateway error
+            raise HEREError(
+                str.format(
+                    "Error occurred on routing_api: status {0}, body is not JSON",
+                    response.status_code,
+                )
+            )
         if response.status_code == requests.codes.OK:
-            return response_cls.new_from_jsondict(json_data)
+            routing_response = response_cls.new_from_jsondict(json_data)
+            if post_process:
+                return post_process(routing_response)
+            return routing_response
         else:
             raise error_from_routing_service_error(json_data)
 
@@ -94,9 +151,15 @@ class RoutingApi(HEREApi):
         if arrival is not None:
             arrival = self._convert_datetime_to_isoformat(arrival)
             data["arrival"] = arrival
-        response = self.__get(
-            self.URL_CALCULATE_ROUTE, data, "response", RoutingResponse
+        return self.__get(
+            self.URL_CALCULATE_ROUTE,
+            data,
+            "response",
+            RoutingResponse,
+            post_process=lambda response: self.__add_route_short(response, modes),
         )
+
+    def __add_route_short(self, response, modes):
         route = response.response["route"]
         maneuver = route[0]["leg"][0]["maneuver"]
 
@@ -486,7 +549,7 @@ class RoutingApi(HEREApi):
         if scooter:
             data["scooter"] = scooter
 
-        response = self.__get(
+        return self.__get(
             self.URL_CALCULATE_ROUTE_V8,
             data,
             "routes",
@@ -495,9 +558,48 @@ class RoutingApi(HEREApi):
             keys_for_manipulation=via_keys,
             headers=headers
         )
-        return response
 
-    def __prepare_matrix_request_body(
+    def route_v8_batch(
+        self,
+        route_specs: Iterable[Dict],
+        max_workers: int = 8,
+        **kwargs
+    ) -> List[Union[RoutingResponseV8, HEREError]]:
+        """Calculates many routes concurrently on a bounded pool of worker threads.
+        Args:
+          route_specs (Iterable[Dict]):
+            Keyword arguments of `route_v8` for every route,
+            e.g. `{"origin": [52.5, 13.4], "destination": [52.4, 13.3]}`.
+          max_workers (int):
+            Maximum number of routes calculated at the same time.
+          **kwargs:
+            `route_v8` arguments shared by every route, values given in a
+            route spec take precedence.
+        Returns:
+          List with one item per route spec in input order, either the
+          RoutingResponseV8 or the HEREError raised for that route.
+        """
+
+        def calculate(route_spec):
+            try:
+                return self.route_v8(**dict(kwargs, **route_spec))
+            except HEREError as here_error:
+                return here_error
+            except requests.RequestException as exception:
+                return HEREError(str(exception))
+
+        results = []
+        pending = collections.deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for route_spec in route_specs:
+                if len(pending) >= max_workers * 2:
+                    results.append(pending.popleft().result())
+                pending.append(executor.submit(calculate, route_spec))
+            while pending:
+                results.append(pending.popleft().result())
+        return results
+
+    def _prepare_matrix_request_body(
         self,
         origins: Union[List[float], str],
         destinations: Union[List[float], str],
@@ -549,27 +651,15 @@ class RoutingApi(HEREApi):
                 "trailerCount": truck.trailer_count,
             }
 
-        origin_list = []
-        for i, origin in enumerate(origins):
-            if isinstance(origin, str):
-                origin_waypoint = self._get_coordinates_for_location_name(origin)
-            else:
-                origin_waypoint = origin
-            lat_long = {"lat": origin_waypoint[0], "lng": origin_waypoint[1]}
-            origin_list.append(lat_long)
-        request_body["origins"] = origin_list
-
-        destination_list = []
-        for i, destination in enumerate(destinations):
-            if isinstance(destination, str):
-                destination_waypoint = self._get_coordinates_for_location_name(
-                    destination
-                )
-            else:
-                destination_waypoint = destination
-            lat_long = {"lat": destination_waypoint[0], "lng": destination_waypoint[1]}
-            destination_list.append(lat_long)
-        request_body["destinations"] = destination_list
+        waypoints = self.__resolve_location_names(list(origins) + list(destinations))
+        request_body["origins"] = [
+            {"lat": waypoint[0], "lng": waypoint[1]}
+            for waypoint in waypoints[: len(origins)]
+        ]
+        request_body["destinations"] = [
+            {"lat": waypoint[0], "lng": waypoint[1]}
+            for waypoint in waypoints[len(origins) :]
+        ]
 
         return request_body
 
@@ -587,8 +677,14 @@ class RoutingApi(HEREApi):
         avoid: Optional[Avoid] = None,
         truck: Optional[Truck] = None,
         matrix_attributes: Optional[List[MatrixSummaryAttribute]] = None,
+        max_origins_per_request: Optional[int] = None,
+        max_destinations_per_request: Optional[int] = None,
+        max_workers: int = 4,
     ) -> Optional[RoutingMatrixResponse]:
         """Sync request a matrix of route summaries between M starts and N destinations.
+        Matrices larger than `max_origins_per_request` x `max_destinations_per_request`
+        are split into sub-matrices which are calculated concurrently and stitched
+        back into a single response.
         Args:
           origins (List):
             List of lists of coordinates [lat,long] of start waypoints.
@@ -617,18 +713,65 @@ class RoutingApi(HEREApi):
             Different truck options to use during route calculation when transportMode = truck.
           matrix_attributes (List):
             List of MatrixSummaryAttribute enums.
+          max_origins_per_request (Optional[int]):
+            Maximum number of origins sent in one request, no limit if not given.
+          max_destinations_per_request (Optional[int]):
+            Maximum number of destinations sent in one request, no limit if not given.
+          max_workers (int):
+            Maximum number of sub-matrices calculated at the same time.
         Returns:
           RoutingMatrixResponse
         Raises:
           HEREError: If an error is received from the server.
         """
 
+        tiles = self._get_matrix_tiles(
+            len(origins),
+            len(destinations),
+            max_origins_per_request,
+            max_destinations_per_request,
+        )
+        if len(tiles) > 1:
+            options = dict(
+                matrix_type=matrix_type,
+                center=center,
+                radius=radius,
+                profile=profile,
+                departure=departure,
+                routing_mode=routing_mode,
+                transport_mode=transport_mode,
+                avoid=avoid,
+                truck=truck,
+                matrix_attributes=matrix_attributes,
+            )
+            origins = self.__resolve_location_names(origins)
+            destinations = self.__resolve_location_names(destinations)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self.sync_matrix,
+                        origins[origin_start:origin_end],
+                        destinations[destination_start:destination_end],
+                        **options,
+                    )
+                    for (
+                        origin_start,
+                        origin_end,
+                        destination_start,
+                        destination_end,
+                    ) in tiles
+                ]
+                tile_responses = [future.result() for future in futures]
+            return self._stitch_matrix_responses(
+                len(origins), len(destinations), tiles, tile_responses
+            )
+
         query_params = {
             "apiKey": self._api_key,
             "async": "false",
         }
 
-        request_body = self.__prepare_matrix_request_body(
+        request_body = self._prepare_matrix_request_body(
             origins=origins,
             destinations=destinations,
             matrix_type=matrix_type,
@@ -645,17 +788,142 @@ class RoutingApi(HEREApi):
 
         url = Utils.build_url(self.URL_CALCULATE_MATRIX, extra_params=query_params)
         headers = {"Content-Type": "application/json"}
-        response = requests.post(
-            url, json=request_body, headers=headers, timeout=self._timeout
+        return self._send(
+            "POST",
+            url,
+            lambda response: self.__parse_sync_matrix_response(response, "sync_matrix"),
+            headers=headers,
+            json=request_body,
+            service="matrix",
+        )
+
+    def __resolve_location_names(
+        self, waypoints: List[Union[List[float], str]]
+    ) -> List[List[float]]:
+        """Replace location names in `waypoints` with their coordinates, geocoding
+        every distinct name once and up to `geocoding_workers` names at a time.
+        Raises:
+          WaypointNotFoundError: Naming every location which could not be geocoded.
+        """
+
+        names = list(
+            dict.fromkeys(
+                waypoint for waypoint in waypoints if isinstance(waypoint, str)
+            )
+        )
+        if not names:
+            return waypoints
+        with ThreadPoolExecutor(
+            max_workers=min(self._geocoding_workers, len(names))
+        ) as executor:
+            futures = [
+                executor.submit(self._get_coordinates_for_location_name, name)
+                for name in names
+            ]
+        resolved = {}
+        errors = {}
+        for name, future in zip(names, futures):
+            try:
+                resolved[name] = future.result()
+            except HEREError as here_error:
+                errors[name] = here_error
+        if errors:
+            raise self._get_waypoints_not_found_error(errors)
+        return [
+            resolved[waypoint] if isinstance(waypoint, str) else waypoint
+            for waypoint in waypoints
+        ]
+
+    @staticmethod
+    def _get_waypoints_not_found_error(
+        errors: Dict[str, HEREError]
+    ) -> "WaypointNotFoundError":
+        """Build one error reporting every location name which could not be geocoded."""
+
+        error = WaypointNotFoundError(
+            "Location names could not be geocoded: "
+            + "; ".join(
+                str.format("{0}: {1}", name, here_error)
+                for name, here_error in errors.items()
+            )
+        )
+        error.errors = errors
+        return error
+
+    @staticmethod
+    def _get_matrix_tiles(
+        num_origins: int,
+        num_destinations: int,
+        max_origins: Optional[int] = None,
+        max_destinations: Optional[int] = None,
+    ) -> List[Tuple[int, int, int, int]]:
+        """Splits a matrix into sub-matrices of at most `max_origins` x `max_destinations`.
+        Returns:
+          List of (origin_start, origin_end, destination_start, destination_end)
+          index ranges, ordered row by row.
+        """
+
+        origin_step = max_origins or num_origins or 1
+        destination_step = max_destinations or num_destinations or 1
+        return [
+            (
+                origin_start,
+                min(origin_start + origin_step, num_origins),
+                destination_start,
+                min(destination_start + destination_step, num_destinations),
+            )
+            for origin_start in range(0, max(num_origins, 1), origin_step)
+            for destination_start in range(
+                0, max(num_destinations, 1), destination_step
+            )
+        ]
+
+    @staticmethod
+    def _stitch_matrix_responses(
+        num_origins: int,
+        num_destinations: int,
+        tiles: List[Tuple[int, int, int, int]],
+        tile_responses: List[RoutingMatrixResponse],
+    ) -> RoutingMatrixResponse:
+        """Merges the responses of sub-matrices created by `_get_matrix_tiles`
+        into one response indexed by the position in the full matrix."""
+
+        size = num_origins * num_destinations
+        matrix = {"numOrigins": num_origins, "numDestinations": num_destinations}
+        for (
+            origin_start,
+            origin_end,
+            destination_start,
+            destination_end,
+        ), response in zip(tiles, tile_responses):
+            width = destination_end - destination_start
+            for key, values in response.matrix.items():
+                if not isinstance(values, list):
+                    continue
+                if key not in matrix:
+                    matrix[key] = [0 if key == "errorCodes" else None] * size
+                for row in range(origin_end - origin_start):
+                    offset = (origin_start + row) * num_destinations + destination_start
+                    matrix[key][offset : offset + width] = values[
+                        row * width : (row + 1) * width
+                    ]
+        return RoutingMatrixResponse.new_from_jsondict(
+            {
+                "matrixId": None,
+                "matrix": matrix,
+                "regionDefinition": tile_responses[0].regionDefinition,
+            }
         )
-        json_data = json.loads(response.content.decode("utf8"))
+
+    def __parse_sync_matrix_response(self, response, function_name):
+        json_data = self._decode_json(response)
         if response.status_code == requests.codes.OK:
             if json_data.get("matrix") is not None:
                 return RoutingMatrixResponse.new_from_jsondict(json_data)
             else:
                 raise HEREError(
-                    "Error occurred on routing_api sync_matrix "
-                    + sys._getframe(1).f_code.co_name
+                    "Error occurred on routing_api "
+                    + function_name
                     + " response status code "
                     + str(response.status_code)
                 )
@@ -669,48 +937,234 @@ class RoutingApi(HEREApi):
                     )
                 )
             else:
-                raise HEREError(
-                    "Error occurred on routing_api sync_matrix "
-                    + sys._getframe(1).f_code.co_name
+                raise HEREError("Error occurred on routing_api " + function_name)
+
+    def download_matrix_result(
+        self,
+        token: str,
+        result_url: str,
+        result_file: Optional[Union[str, BinaryIO]] = None,
+        chunk_size: int = 65536,
+    ) -> Union[RoutingMatrixResponse, str, BinaryIO]:
+        """Downloads the result of an async matrix calculation as a stream, gzip
+        compressed results are decompressed on the fly. Memory use is bounded by
+        `chunk_size` plus the arrays of the parsed matrix.
+        Args:
+          token (str):
+            Bearer token required for async calls.
+          result_url (str):
+            Url the status of the completed calculation redirected to.
+          result_file (Optional[Union[str, BinaryIO]]):
+            Path or binary file object the JSON result is written to instead
+            of being parsed.
+          chunk_size (int):
+            Bytes read at a time.
+        Returns:
+          RoutingMatrixResponse holding the travelTimes, distances and errorCodes
+          of its matrix as arrays, see `RoutingMatrixResponse.get_travel_times`,
+          or `result_file` once the result was written to it.
+        Raises:
+          HEREError: If the result could not be downloaded or parsed.
+        """
+
+        headers = {"Authorization": str.format("Bearer {0}", token)}
+        with self._request(
+            "GET", result_url, headers=headers, stream=True, service="matrix"
+        ) as response:
+            if response.status_code != requests.codes.OK:
+                raise self._get_matrix_result_error(
+                    response.status_code, response.content
+                )
+            chunks = response.iter_content(chunk_size=chunk_size)
+            if result_file is None:
+                return self._parse_matrix_result(chunks)
+            if isinstance(result_file, str):
+                with open(result_file, "wb") as f:
+                    self._write_matrix_result(chunks, f)
+            else:
+                self._write_matrix_result(chunks, result_file)
+        return result_file
+
+    @staticmethod
+    def _parse_matrix_result(chunks: Iterable[bytes]) -> RoutingMatrixResponse:
+        decompressor = Decompressor()
+        parser = MatrixResultParser()
+        for chunk in chunks:
+            parser.feed(decompressor.decompress(chunk))
+        parser.feed(decompressor.flush())
+        return RoutingMatrixResponse.new_from_jsondict(parser.close())
+
+    @staticmethod
+    def _write_matrix_result(chunks: Iterable[bytes], f: BinaryIO):
+        decompressor = Decompressor()
+        for chunk in chunks:
+            f.write(decompressor.decompress(chunk))
+        f.write(decompressor.flush())
+
+    def _get_matrix_result_error(self, status_code: int, content: bytes) -> HEREError:
+        """Build the error for a result which could not be downloaded, result
+        storages may answer without a JSON body."""
+
+        try:
+            return self._get_async_matrix_error(
+                self._json_decoder(content), "download_matrix_result"
+            )
+        except (ValueError, AttributeError):
+            return HEREError(
+                str.format(
+                    "Error occurred on download_matrix_result: status {0}", status_code
                 )
+            )
 
-    def __download_file(self, fileurl: str):
-        filename = os.path.basename(fileurl)
-        with requests.get(fileurl, stream=True) as r:
-            r.raise_for_status()
-            with open(filename, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
-        print("{} file saved!".format(filename))
-        return filename
-
-    def __is_correct_response(self, response):
+    @staticmethod
+    def _get_matrix_result_url(response) -> Optional[str]:
+        """Returns the url of the result if the status of a completed calculation
+        redirected to it."""
+        if response.status_code in (301, 302, 303, 307, 308):
+            return response.headers.get("Location")
+        return None
+
+    def _is_correct_response(self, response):
         status_code = response.status_code
-        json_data = response.json()
+        json_data = self._decode_json(response)
         if json_data.get("matrix") is not None:
             return json_data
         elif json_data.get("status") is not None:
-            print(
-                "Matrix {} calculation {}".format(
-                    json_data["matrixId"], json_data["status"]
-                )
-            )
             return False
         elif json_data.get("error") is not None and json_data.get("error_description"):
             raise HEREError(
-                "Error occurred on __is_correct_response: "
+                "Error occurred on _is_correct_response: "
                 + json_data["error"]
                 + ", description: "
                 + json_data["error_description"]
             )
         elif json_data.get("title") is not None and json_data.get("status"):
             raise HEREError(
-                "Error occurred on __is_correct_response: "
+                "Error occurred on _is_correct_response: "
                 + json_data["title"]
                 + ", status: "
                 + json_data["status"]
             )
 
+    def _check_async_matrix_status(
+        self, response: Union[requests.Response, DownloadedMatrixResult]
+    ) -> Optional[Union[RoutingMatrixResponse, str, BinaryIO]]:
+        """Returns the matrix once the calculation completed, None while it is running.
+        Downloaded results, or the files they were written to, are returned as they are."""
+
+        if isinstance(response, DownloadedMatrixResult):
+            return response.result
+        return self._parse_async_matrix_status(response)
+
+    def _parse_async_matrix_status(
+        self, response: requests.Response
+    ) -> Optional[RoutingMatrixResponse]:
+        """Returns the matrix held by a status response, None while the
+        calculation is running."""
+
+        json_data = self._is_correct_response(response)
+        if json_data:
+            return RoutingMatrixResponse.new_from_jsondict(json_data)
+        return None
+
+    def _create_matrix_job(
+        self,
+        response: requests.Response,
+        request_status: Callable,
+        poll_step: float,
+        max_poll_step: float,
+    ) -> Job:
+        """Build the job handle of a matrix calculation from the response of its submission."""
+
+        if response.status_code != requests.codes.ACCEPTED:
+            raise self._get_async_matrix_error(
+                self._decode_json(response), "submit_async_matrix"
+            )
+        json_data = self._decode_json(response)
+        return Job(
+            json_data["matrixId"],
+            functools.partial(request_status, json_data["statusUrl"]),
+            self._check_async_matrix_status,
+            step=poll_step,
+            max_step=max_poll_step,
+        )
+
+    def submit_async_matrix(
+        self,
+        token: str,
+        origins: Union[List[float], str],
+        destinations: Union[List[float], str],
+        poll_step: float = 1.0,
+        max_poll_step: float = 30.0,
+        poller: Optional[polling.Poller] = None,
+        result_file: Optional[Union[str, BinaryIO]] = None,
+        **kwargs
+    ) -> Job:
+        """Submits an async matrix calculation and returns without waiting for it.
+        Args:
+          token (str):
+            Bearer token required for async calls.
+          origins (List):
+            List of lists of coordinates [lat,long] of start waypoints.
+            or list of string with the location names.
+          destinations (List):
+            List of lists of coordinates [lat,long] of destination waypoints.
+            or list of string with the location names.
+          poll_step (float):
+            Seconds between the first status requests of the job.
+          max_poll_step (float):
+            Maximum seconds between two status requests of the job.
+          poller (Optional[Poller]):
+            Poller the job is added to, so it is polled in the background
+            together with other jobs.
+          result_file (Optional[Union[str, BinaryIO]]):
+            Path or binary file object the result is written to,
+            see `download_matrix_result`.
+          **kwargs:
+            Matrix options of `async_matrix`, e.g. `matrix_type`.
+        Returns:
+          Job resolving to a RoutingMatrixResponse, or to `result_file` once the
+          result was written to it. The result is streamed from the result url
+          the status redirects to, see `download_matrix_result`.
+        Raises:
+          HEREError: If the service did not accept the calculation.
+        """
+
+        request_body = self._prepare_matrix_request_body(
+            origins=origins, destinations=destinations, **kwargs
+        )
+        url = Utils.build_url(self.URL_CALCULATE_MATRIX, extra_params={})
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": str.format("Bearer {0}", token),
+        }
+        response = self._request(
+            "POST", url, headers=headers, json=request_body, service="matrix"
+        )
+        status_headers = {"Authorization": str.format("Bearer {0}", token)}
+
+        def request_status(status_url):
+            status_response = self._request(
+                "GET",
+                status_url,
+                headers=status_headers,
+                service="matrix",
+                allow_redirects=False,
+            )
+            result_url = self._get_matrix_result_url(status_response)
+            if result_url is None:
+                return status_response
+            return DownloadedMatrixResult(
+                self.download_matrix_result(token, result_url, result_file)
+            )
+
+        job = self._create_matrix_job(
+            response, request_status, poll_step, max_poll_step
+        )
+        if poller is not None:
+            poller.add(job)
+        return job
+
     def async_matrix(
         self,
         token: str,
@@ -726,8 +1180,13 @@ class RoutingApi(HEREApi):
         avoid: Optional[Avoid] = None,
         truck: Optional[Truck] = None,
         matrix_attributes: Optional[List[MatrixSummaryAttribute]] = None,
+        poll_step: float = 1.0,
+        max_poll_step: float = 30.0,
+        result_file: Optional[Union[str, BinaryIO]] = None,
     ) -> Optional[RoutingMatrixResponse]:
         """Async request a matrix of route summaries between M starts and N destinations.
+        Blocks until the calculation completed, use `submit_async_matrix` to get a
+        job handle instead.
         Args:
           token (str):
             Bearer token required for async calls. This is the only working solution for now.
@@ -761,17 +1220,26 @@ class RoutingApi(HEREApi):
             Different truck options to use during route calculation when transportMode = truck.
           matrix_attributes (List):
             List of MatrixSummaryAttribute enums.
+          poll_step (float):
+            Seconds between the first status requests, grows up to `max_poll_step`.
+          max_poll_step (float):
+            Maximum seconds between two status requests.
+          result_file (Optional[Union[str, BinaryIO]]):
+            Path or binary file object the result is written to instead of
+            being parsed.
         Returns:
-          RoutingMatrixResponse.
+          RoutingMatrixResponse, or `result_file` once the result was written to it.
         Raises:
           HEREError: If an error is received from the server.
         """
 
-        query_params = {}
-
-        request_body = self.__prepare_matrix_request_body(
-            origins=origins,
-            destinations=destinations,
+        job = self.submit_async_matrix(
+            token,
+            origins,
+            destinations,
+            poll_step=poll_step,
+            max_poll_step=max_poll_step,
+            result_file=result_file,
             matrix_type=matrix_type,
             center=center,
             radius=radius,
@@ -783,72 +1251,55 @@ class RoutingApi(HEREApi):
             truck=truck,
             matrix_attributes=matrix_attributes,
         )
+        return job.wait()
 
-        url = Utils.build_url(self.URL_CALCULATE_MATRIX, extra_params=query_params)
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": str.format("Bearer {0}", token),
-        }
-        json_data = json.dumps(request_body)
-        response = requests.post(
-            url, json=request_body, headers=headers, timeout=self._timeout
-        )
-        if response.status_code == requests.codes.ACCEPTED:
-            json_data = response.json()
-            print(
-                "Matrix {} calculation {}".format(
-                    json_data["matrixId"], json_data["status"]
-                )
+    @staticmethod
+    def _get_async_matrix_error(json_data, function_name):
+        """Build the error for a matrix calculation the service did not accept."""
+
+        if (
+            json_data.get("error") is not None
+            and json_data.get("error_description") is not None
+        ):
+            return HEREError(
+                "Error occurred on async_matrix: "
+                + json_data["error"]
+                + ", description: "
+                + json_data["error_description"]
             )
-            poll_url = json_data["statusUrl"]
-            headers = {"Authorization": str.format("Bearer {0}", token)}
-            print("Polling matrix calculation started!")
-            result = polling.poll(
-                lambda: requests.get(poll_url, headers=headers),
-                check_success=self.__is_correct_response,
-                step=5,
-                poll_forever=True,
+        elif json_data.get("title") is not None and json_data.get("cause") is not None:
+            return HEREError(
+                "Error occurred on async_matrix: "
+                + json_data["title"]
+                + ", cause: "
+                + json_data["cause"]
             )
-            print("Polling matrix calculation completed!")
-            poll_data = result.json()
-            return RoutingMatrixResponse.new_from_jsondict(poll_data)
         else:
-            json_data = response.json()
-            if (
-                json_data.get("error") is not None
-                and json_data.get("error_description") is not None
-            ):
-                raise HEREError(
-                    "Error occurred on async_matrix: "
-                    + json_data["error"]
-                    + ", description: "
-                    + json_data["error_description"]
-                )
-            elif (
-                json_data.get("title") is not None
-                and json_data.get("cause") is not None
-            ):
-                raise HEREError(
-                    "Error occurred on async_matrix: "
-                    + json_data["title"]
-                    + ", cause: "
-                    + json_data["cause"]
-                )
-            else:
-                raise HEREError(
-                    "Error occurred on async_matrix " + sys._getframe(1).f_code.co_name
-                )
+            return HEREError("Error occurred on async_matrix " + function_name)
 
     def _get_coordinates_for_location_name(self, location_name: str) -> List[float]:
-        """Use the Geocoder API to resolve a location name to a set of coordinates."""
-
-        geocoder_api = GeocoderApi(self._api_key)
+        """Use the Geocoder API to resolve a location name to a set of coordinates.
+        Coordinates are looked up in the geocoding cache first."""
+
+        coordinates = self._geocoding_cache.get(location_name)
+        if coordinates is not None:
+            return coordinates
+        if self._geocoder_api is None:
+            self._geocoder_api = GeocoderApi(
+                self._api_key, self._timeout, **self._get_transport_options()
+            )
         try:
-            geocoder_response = geocoder_api.free_form(location_name)
-            coordinates = geocoder_response.items[0]["position"]
-            return [coordinates["lat"], coordinates["lng"]]
+            geocoder_response = self._geocoder_api.free_form(location_name)
         except HEREError as here_error:
             raise WaypointNotFoundError(here_error.message)
+        if not geocoder_response.items:
+            raise WaypointNotFoundError(
+                str.format("No location found for {0}", location_name)
+            )
+        position = geocoder_response.items[0]["position"]
+        coordinates = [position["lat"], position["lng"]]
+        self._geocoding_cache.set(location_name, coordinates)
+        return coordinates
 
     @staticmethod
     def _convert_datetime_to_isoformat(datetime_object):
@@ -950,8 +1401,12 @@ class WaypointNotFoundError(HEREError):
 
     This error indicates that one of the requested waypoints
     (start/end or via point) could not be found in the routing network.
+    When several location names could not be geocoded, `errors` maps
+    each of them to its error.
     """
 
+    errors = {}
+
 
 class NoRouteFoundError(HEREError):
 
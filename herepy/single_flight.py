@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight(object):
+    """Coalesces identical calls in flight at the same time.
+
+    The first caller of a key runs the call, callers arriving with the same key
+    before it returned wait for it and receive the same result object, or the
+    same exception. Nothing is kept once the call returned, so a later call runs
+    again. A group can be shared by several wrapper instances, threads and event
+    loops, coroutines only wait for calls started on their own loop.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Returns the result of `function`, or of the call of `key` already in flight.
+        Args:
+          key (Hashable):
+            Identifies identical calls.
+          function (Callable):
+            Called without arguments if no call of `key` is in flight.
+        Returns:
+          Result of the call.
+        """
+
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+        if not leader:
+            return future.result()
+        try:
+            result = function()
+        except BaseException as exception:
+            future.set_exception(exception)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def do_async(
+        self, key: Hashable, function: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Returns the result of the coroutine `function`, or of the call of `key`
+        already in flight on the running event loop. Cancelling a caller does not
+        cancel the call other callers wait for.
+        Args:
+          key (Hashable):
+            Identifies identical calls.
+          function (Callable):
+            Coroutine function called without arguments if no call of `key`
+            is in flight.
+        Returns:
+          Result of the call.
+        """
+
+        key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            task = self._calls.get(key)
+            if task is None:
+                task = asyncio.ensure_future(function())
+                self._calls[key] = task
+                task.add_done_callback(lambda _: self._forget(key))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable):
+        with self._lock:
+            self._calls.pop(key, None)
@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Mapping, Optional, Tuple
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+class TileCacheEntry(object):
+    """Tile found in a `DiskTileCache`, with the ETag to revalidate it once stale."""
+
+    def __init__(self, content: bytes, etag: Optional[str], expires_at: float):
+        """Returns a TileCacheEntry instance.
+        Args:
+          content (bytes):
+            Tile as bytes.
+          etag (Optional[str]):
+            ETag header the tile was served with.
+          expires_at (float):
+            `time.time()` after which the tile must be revalidated.
+        """
+
+        self.content = content
+        self.etag = etag
+        self.expires_at = expires_at
+
+    def is_fresh(self) -> bool:
+        """Returns whether the tile can be used without asking the server."""
+        return time.time() < self.expires_at
+
+
+class DiskTileCache(object):
+    """Cache of downloaded tiles in a directory, bounded by the bytes of the tiles
+    it keeps, evicting the least recently used tile first.
+
+    Tiles are keyed by their request parameters, e.g. scheme, zoom, column, row
+    and format. Their content is stored once per SHA-256 digest, so identical
+    tiles like empty sea tiles share one file. Fresh tiles are served without a
+    request, stale ones are revalidated with their ETag, see `HEREApi` wrappers
+    taking a `tile_cache`. A directory can be shared by several processes.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl: float = 24 * 60 * 60,
+    ):
+        """Returns a DiskTileCache instance.
+        Args:
+          directory (str):
+            Directory of the cache, created if missing.
+          max_bytes (int):
+            Maximum number of bytes of tile content kept.
+          ttl (float):
+            Seconds a tile stays fresh when its response has no
+            `Cache-Control: max-age`.
+        """
+
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(directory, "blobs"), exist_ok=True)
+        self._connection = sqlite3.connect(
+            os.path.join(directory, "index.sqlite"), check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS tiles (key TEXT PRIMARY KEY, "
+                "digest TEXT, etag TEXT, expires_at REAL, accessed_at REAL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS tiles_accessed_at ON tiles (accessed_at)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS tiles_digest ON tiles (digest)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS blobs "
+                "(digest TEXT PRIMARY KEY, size INTEGER)"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM tiles").fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """Returns the number of bytes of tile content kept."""
+        with self._lock:
+            return self._get_size()
+
+    def _get_size(self) -> int:
+        return self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM blobs"
+        ).fetchone()[0]
+
+    @staticmethod
+    def _get_key(key: Tuple) -> str:
+        return json.dumps(key, default=str, separators=(",", ":"))
+
+    def _get_path(self, digest: str) -> str:
+        return os.path.join(self._directory, "blobs", digest[:2], digest)
+
+    def get(self, key: Tuple) -> Optional[TileCacheEntry]:
+        """Returns the tile cached for `key`, fresh or not, None if it is missing."""
+        key = self._get_key(key)
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT digest, etag, expires_at FROM tiles WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            digest, etag, expires_at = row
+            try:
+                with open(self._get_path(digest), "rb") as f:
+                    content = f.read()
+            except FileNotFoundError:
+                self._connection.execute("DELETE FROM tiles WHERE key = ?", (key,))
+                self._delete_unused_blob(digest)
+                return None
+            self._connection.execute(
+                "UPDATE tiles SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return TileCacheEntry(content, etag, expires_at)
+
+    def set(self, key: Tuple, content: bytes, headers: Mapping[str, str]):
+        """Caches a downloaded tile.
+        Args:
+          key (Tuple):
+            Request parameters identifying the tile.
+          content (bytes):
+            Tile as bytes.
+          headers (Mapping[str, str]):
+            Headers of the response, for its `ETag` and `Cache-Control`.
+        """
+
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._get_path(digest)
+        now = time.time()
+        key = self._get_key(key)
+        with self._lock, self._connection:
+            if not os.path.exists(path):
+                self._write_blob(path, content)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO blobs VALUES (?, ?)", (digest, len(content))
+            )
+            row = self._connection.execute(
+                "SELECT digest FROM tiles WHERE key = ?", (key,)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    digest,
+                    headers.get("ETag"),
+                    now + self._get_ttl(headers),
+                    now,
+                ),
+            )
+            # The content the tile replaces is dropped unless other tiles share it.
+            if row is not None and row[0] != digest:
+                self._delete_unused_blob(row[0])
+            self._evict()
+
+    def refresh(self, key: Tuple, headers: Mapping[str, str]):
+        """Marks a cached tile fresh again after the server answered its
+        revalidation with 304 Not Modified."""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE tiles SET etag = COALESCE(?, etag), expires_at = ?, "
+                "accessed_at = ? WHERE key = ?",
+                (
+                    headers.get("ETag"),
+                    now + self._get_ttl(headers),
+                    now,
+                    self._get_key(key),
+                ),
+            )
+
+    def _get_ttl(self, headers: Mapping[str, str]) -> float:
+        match = _MAX_AGE.search(headers.get("Cache-Control") or "")
+        return self._ttl if match is None else int(match.group(1))
+
+    def _write_blob(self, path: str, content: bytes):
+        # Written aside and renamed, so readers never see a partial tile.
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                f.write(content)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def _evict(self):
+        size = self._get_size()
+        while size > self._max_bytes:
+            row = self._connection.execute(
+                "SELECT key, digest FROM tiles ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                # Only content no tile refers to is left, e.g. in directories
+                # written by older versions.
+                for (digest,) in self._connection.execute(
+                    "SELECT digest FROM blobs WHERE digest NOT IN "
+                    "(SELECT digest FROM tiles)"
+                ).fetchall():
+                    self._delete_unused_blob(digest)
+                break
+            key, digest = row
+            self._connection.execute("DELETE FROM tiles WHERE key = ?", (key,))
+            size -= self._delete_unused_blob(digest)
+
+    def _delete_unused_blob(self, digest: str) -> int:
+        if self._connection.execute(
+            "SELECT 1 FROM tiles WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone():
+            return 0
+        row = self._connection.execute(
+            "SELECT size FROM blobs WHERE digest = ?", (digest,)
+        ).fetchone()
+        self._connection.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        try:
+            os.remove(self._get_path(digest))
+        except FileNotFoundError:
+            pass
+        return 0 if row is None else row[0]
+
+    def clear(self):
+        """Removes every tile."""
+        with self._lock, self._connection:
+            for (digest,) in self._connection.execute(
+                "SELECT digest FROM blobs"
+            ).fetchall():
+                try:
+                    os.remove(self._get_path(digest))
+                except FileNotFoundError:
+                    pass
+            self._connection.execute("DELETE FROM tiles")
+            self._connection.execute("DELETE FROM blobs")
+
+    def close(self):
+        """Closes the index database connection."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import requests
+
+from herepy.error import HEREError
+from herepy.flexible_polyline import FlexiblePolyline
+from herepy.here_enum import PolylineThirdDimension
+from herepy.mercator_projection import MercatorProjection
+from herepy.models import RoutingResponseV8
+
+Route = Union[RoutingResponseV8, str, Iterable[Sequence[float]]]
+"""A route response, an encoded flexible polyline or a list of points."""
+
+
+def get_route_paths(route: Route) -> List[List[Tuple[float, float]]]:
+    """Returns the latitude and longitude of the points of a route.
+    Args:
+      route (Route):
+        `RoutingResponseV8` of a route request made with `return_fields`
+        including the polyline, whose sections of every route are taken, an
+        encoded flexible polyline, or points starting with latitude and longitude.
+    Returns:
+      List of paths, one per section of a route response.
+    """
+
+    if isinstance(route, RoutingResponseV8):
+        polylines = [
+            section["polyline"]
+            for response_route in route.routes or []
+            for section in response_route["sections"]
+            if section.get("polyline")
+        ]
+    elif isinstance(route, str):
+        polylines = [route]
+    else:
+        return [[(point[0], point[1]) for point in route]]
+    paths = []
+    for polyline in polylines:
+        _, third_dimension, _ = FlexiblePolyline.get_header(polyline)
+        dimensions = 2 if third_dimension == PolylineThirdDimension.absent else 3
+        values = FlexiblePolyline.decode(polyline, use_numpy=False)
+        paths.append(list(zip(values[0::dimensions], values[1::dimensions])))
+    return paths
+
+
+def get_tiles_along_route(
+    route: Route, zooms: Iterable[int], buffer: float = 250.0
+) -> Iterator[Tuple[int, int, int]]:
+    """Enumerates the tiles within `buffer` meters of a route at the given zoom
+    levels, zoom by zoom in the order the route reaches them, each tile once.
+    See `MercatorProjection.get_tiles_along_path`.
+    Args:
+      route (Route):
+        Route, see `get_route_paths`.
+      zooms (Iterable[int]):
+        Zoom levels of the tiles.
+      buffer (float):
+        Distance from the route in meters.
+    Returns:
+      Iterator of zoom, column and row of every tile.
+    """
+
+    paths = get_route_paths(route)
+    for zoom in zooms:
+        tiles = {}
+        for path in paths:
+            for column, row in MercatorProjection.get_tiles_along_path(
+                path, zoom, buffer
+            ):
+                tiles[(column, row)] = None
+        for column, row in tiles:
+            yield zoom, column, row
+
+
+def skip_stored(
+    tiles: Iterable[Tuple[int, int, int]], tile_store: Optional[Any]
+) -> Iterator[Tuple[int, int, int]]:
+    """Leaves out the tiles a tile store already holds."""
+    for tile in tiles:
+        if tile_store is None or tile not in tile_store:
+            yield tile
+
+
+def download_tiles(
+    tiles: Iterable[Tuple[int, int, int]],
+    get_tile: Callable[[int, int, int, int], Optional[bytes]],
+    max_workers: int = 8,
+) -> Iterator[Tuple[int, int, int, Union[bytes, HEREError]]]:
+    """Downloads tiles on a bounded pool of worker threads, keeping at most twice
+    `max_workers` tiles queued so huge tile sets are never held in memory.
+    Args:
+      tiles (Iterable[Tuple[int, int, int]]):
+        Zoom, column and row of the tiles.
+      get_tile (Callable[[int, int, int, int], Optional[bytes]]):
+        Downloads a tile given its index in `tiles`, zoom, column and row.
+      max_workers (int):
+        Maximum number of tiles downloaded at the same time.
+    Returns:
+      Iterator of zoom, column, row and the tile as bytes, or the HEREError
+      raised for that tile, in the order the tiles arrive.
+    """
+
+    def fetch(index, zoom, column, row):
+        try:
+            tile = get_tile(index, zoom, column, row)
+        except HEREError as here_error:
+            tile = here_error
+        except requests.RequestException as exception:
+            tile = HEREError(str(exception))
+        return zoom, column, row, tile
+
+    pending = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for index, (zoom, column, row) in enumerate(tiles):
+                if len(pending) >= max_workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+                pending.add(executor.submit(fetch, index, zoom, column, row))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            # Downloads not started yet are dropped if iteration stops early.
+            for future in pending:
+                future.cancel()
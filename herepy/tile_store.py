@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+
+import sqlite3
+import threading
+from typing import Dict, Optional, Tuple
+
+
+class MBTilesStore(object):
+    """Tile store persisted in an MBTiles file, a SQLite database readable by
+    most map tools, keeping millions of tiles in a single file.
+
+    Tiles are addressed by zoom, column and row of the XYZ scheme used by the
+    wrappers and stored with the flipped TMS row MBTiles requires. Writes are
+    buffered and committed `batch_size` tiles at a time, the database runs in
+    WAL mode so tiles can be read while a seeding job writes. An MBTiles file
+    holds one tileset, use one store per layer, scheme, size and format.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 256,
+        metadata: Optional[Dict[str, str]] = None,
+    ):
+        """Returns a MBTilesStore instance.
+        Args:
+          path (str):
+            Path of the MBTiles file, created if missing.
+          batch_size (int):
+            Number of tiles written per transaction.
+          metadata (Optional[Dict[str, str]]):
+            Rows of the metadata table to set, e.g. `{"name": "berlin",
+            "format": "png"}`.
+        """
+
+        self._batch_size = batch_size
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS tiles (zoom_level INTEGER, "
+                "tile_column INTEGER, tile_row INTEGER, tile_data BLOB)"
+            )
+            self._connection.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS tile_index "
+                "ON tiles (zoom_level, tile_column, tile_row)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata (name TEXT, value TEXT)"
+            )
+            self._connection.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS metadata_index ON metadata (name)"
+            )
+        if metadata:
+            self.set_metadata(metadata)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        self.flush()
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM tiles").fetchone()[0]
+
+    def __contains__(self, tile: Tuple[int, int, int]) -> bool:
+        zoom, column, row = tile
+        with self._lock:
+            if tile in self._pending:
+                return True
+            return (
+                self._connection.execute(
+                    "SELECT 1 FROM tiles WHERE zoom_level = ? AND tile_column = ? "
+                    "AND tile_row = ?",
+                    (zoom, column, self._flip(zoom, row)),
+                ).fetchone()
+                is not None
+            )
+
+    @staticmethod
+    def _flip(zoom: int, row: int) -> int:
+        """Converts a XYZ row to a TMS row and back."""
+        return (1 << zoom) - 1 - row
+
+    def get(self, zoom: int, column: int, row: int) -> Optional[bytes]:
+        """Returns the tile at zoom, column and row, None if it is not stored."""
+        with self._lock:
+            data = self._pending.get((zoom, column, row))
+            if data is not None:
+                return data
+            result = self._connection.execute(
+                "SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? "
+                "AND tile_row = ?",
+                (zoom, column, self._flip(zoom, row)),
+            ).fetchone()
+        return None if result is None else bytes(result[0])
+
+    def put(self, zoom: int, column: int, row: int, data: bytes):
+        """Stores the tile at zoom, column and row, replacing a stored one.
+        It is written with the next batch, see `flush`."""
+        with self._lock:
+            self._pending[(zoom, column, row)] = data
+            if len(self._pending) >= self._batch_size:
+                self._write_pending()
+
+    def flush(self):
+        """Writes the tiles not written yet."""
+        with self._lock:
+            self._write_pending()
+
+    def _write_pending(self):
+        if not self._pending:
+            return
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?)",
+                [
+                    (zoom, column, self._flip(zoom, row), sqlite3.Binary(data))
+                    for (zoom, column, row), data in self._pending.items()
+                ],
+            )
+        self._pending.clear()
+
+    def get_metadata(self) -> Dict[str, str]:
+        """Returns the rows of the metadata table."""
+        with self._lock:
+            return dict(
+                self._connection.execute("SELECT name, value FROM metadata").fetchall()
+            )
+
+    def set_metadata(self, metadata: Dict[str, str]):
+        """Sets rows of the metadata table."""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO metadata VALUES (?, ?)",
+                [(name, str(value)) for name, value in metadata.items()],
+            )
+
+    def close(self):
+        """Writes the pending tiles and closes the database connection."""
+        with self._lock:
+            self._write_pending()
+            self._connection.close()
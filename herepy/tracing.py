@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+
+import contextlib
+import functools
+import inspect
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from herepy.utils import Utils
+
+try:
+    from opentelemetry import propagate, trace
+except ImportError:  # pragma: no cover
+    propagate = None
+    trace = None
+
+TRACER_NAME = "herepy"
+"""Name of the OpenTelemetry tracer creating the spans of the wrappers."""
+
+
+def is_enabled() -> bool:
+    """Returns whether spans are emitted, i.e. OpenTelemetry is installed.
+    Spans are only exported once the application configured a tracer provider."""
+    return trace is not None
+
+
+def _get_tracer() -> Any:
+    return trace.get_tracer(TRACER_NAME)
+
+
+def start_span(name: str, attributes: Optional[Dict[str, Any]] = None):
+    """Returns a context manager running its block in a new child span of the
+    current one, yielding the span, or None if OpenTelemetry is not installed."""
+    if trace is None:
+        return contextlib.nullcontext()
+    return _get_tracer().start_as_current_span(name, attributes=attributes)
+
+
+def start_http_span(method: str, url: str, service: Optional[str], attempt: int):
+    """Returns a context manager running one HTTP call in a client span."""
+    if trace is None:
+        return contextlib.nullcontext()
+    attributes = {
+        "http.request.method": method,
+        "url.full": Utils.redact_url(url),
+        "server.address": urlparse(url).hostname or "",
+        "herepy.service": service or "",
+    }
+    if attempt > 1:
+        attributes["http.request.resend_count"] = attempt - 1
+    return _get_tracer().start_as_current_span(
+        method, kind=trace.SpanKind.CLIENT, attributes=attributes
+    )
+
+
+def inject(headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """Returns the headers of a request with the W3C trace context of the current
+    span added, `headers` itself if OpenTelemetry is not installed."""
+    if propagate is None:
+        return headers
+    headers = dict(headers or {})
+    propagate.inject(headers)
+    return headers
+
+
+def set_http_response(span: Any, response: Any):
+    """Records the status, size and timings of a response on its client span."""
+    if span is None or not span.is_recording():
+        return
+    span.set_attribute("http.response.status_code", response.status_code)
+    if response.status_code >= 400:
+        span.set_attribute("error.type", str(response.status_code))
+        span.set_status(trace.StatusCode.ERROR)
+    content_length = response.headers.get("Content-Length")
+    if content_length:
+        span.set_attribute("http.response.body.size", int(content_length))
+    for phase, seconds in (getattr(response, "timings", None) or {}).items():
+        span.set_attribute("herepy.timing." + phase, seconds)
+
+
+def set_http_error(span: Any, error: BaseException):
+    """Records an exception a call failed with, which may still be retried."""
+    if span is None or not span.is_recording():
+        return
+    span.record_exception(error)
+    span.set_attribute("error.type", type(error).__qualname__)
+    span.set_status(trace.StatusCode.ERROR, str(error))
+
+
+def trace_method(function: Callable, name: str) -> Callable:
+    """Wraps a wrapper method so every call runs in a span named `name`.
+    Spans of methods returning a coroutine, like the methods the async clients
+    inherit, end once it was awaited. Generators are left as they are."""
+    if trace is None or getattr(function, "_herepy_traced", False):
+        return function
+    if inspect.isgeneratorfunction(function) or inspect.isasyncgenfunction(function):
+        return function
+
+    if inspect.iscoroutinefunction(function):
+
+        @functools.wraps(function)
+        async def coroutine_wrapper(self, *args, **kwargs):
+            with start_span(name, {"herepy.service": self.SERVICE or ""}):
+                return await function(self, *args, **kwargs)
+
+        coroutine_wrapper._herepy_traced = True
+        return coroutine_wrapper
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        span = _get_tracer().start_span(
+            name, attributes={"herepy.service": self.SERVICE or ""}
+        )
+        try:
+            with trace.use_span(span):
+                result = function(self, *args, **kwargs)
+        except BaseException:
+            span.end()
+            raise
+        if inspect.iscoroutine(result):
+            return _end_when_awaited(span, result)
+        span.end()
+        return result
+
+    wrapper._herepy_traced = True
+    return wrapper
+
+
+async def _end_when_awaited(span: Any, coroutine: Any) -> Any:
+    with trace.use_span(span, end_on_exit=True):
+        return await coroutine
+
+
+def trace_methods(cls: type):
+    """Wraps the public methods a wrapper class defines with `trace_method`."""
+    if trace is None:
+        return
+    for name, value in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.isfunction(value):
+            setattr(cls, name, trace_method(value, value.__qualname__))
@@ -1,12 +1,8 @@
 #!/usr/bin/env python
 
-import json
-import sys
 from enum import Enum
 from typing import List, Optional
 
-import requests
-
 from herepy.error import HEREError, InvalidRequestError, UnauthorizedError
 from herepy.here_api import HEREApi
 from herepy.here_enum import (FlowProximityAdditionalAttributes,
@@ -19,22 +15,30 @@ from herepy.utils import Utils
 class TrafficApi(HEREApi):
     """A python interface into the HERE Traffic API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "traffic"
+
+    def __init__(self, api_key: str = None, timeout: int = None, **kwargs):
         """Returns a TrafficApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(TrafficApi, self).__init__(api_key, timeout)
+        super(TrafficApi, self).__init__(api_key, timeout, **kwargs)
         self._base_url = "https://traffic.ls.hereapi.com/traffic/6.1/"
 
-    def __get(self, url, data):
+    def __get(self, url, data, function_name):
         url = Utils.build_url(url, extra_params=data)
-        response = requests.get(url, timeout=self._timeout)
-        json_data = json.loads(response._content.decode("utf8"))
+        return self._send(
+            "GET", url, lambda response: self.__parse_response(response, function_name)
+        )
+
+    def __parse_response(self, response, function_name):
+        json_data = self._decode_json(response)
         if json_data.get("TRAFFIC_ITEMS") != None:
             return TrafficIncidentResponse.new_from_jsondict(
                 json_data,
@@ -61,17 +65,15 @@ class TrafficApi(HEREApi):
                 json_data, param_defaults={"Response": None}
             )
         else:
-            error = self.__get_error_from_response(json_data)
+            error = self.__get_error_from_response(json_data, function_name)
             raise error
 
-    def __get_error_from_response(self, json_data):
+    def __get_error_from_response(self, json_data, function_name):
         if "error" in json_data:
             if json_data["error"] == "Unauthorized":
                 return UnauthorizedError(json_data["error_description"])
         error_type = json_data.get("Type")
-        error_message = json_data.get(
-            "Message", "Error occurred on " + sys._getframe(1).f_code.co_name
-        )
+        error_message = json_data.get("Message", "Error occurred on " + function_name)
         if error_type == "Invalid Request":
             return InvalidRequestError(error_message)
         else:
@@ -130,7 +132,9 @@ class TrafficApi(HEREApi):
             "apiKey": self._api_key,
             "criticality": self.__prepare_str_values(enums=criticality),
         }
-        return self.__get(self._base_url + "incidents.json", data)
+        return self.__get(
+            self._base_url + "incidents.json", data, "incidents_in_bounding_box"
+        )
 
     def incidents_in_corridor(
         self, points: List[List[float]], width: int
@@ -150,7 +154,9 @@ class TrafficApi(HEREApi):
             "corridor": self.__prepare_corridor_value(points=points, width=width),
             "apiKey": self._api_key,
         }
-        return self.__get(self._base_url + "incidents.json", data)
+        return self.__get(
+            self._base_url + "incidents.json", data, "incidents_in_corridor"
+        )
 
     def incidents_via_proximity(
         self,
@@ -181,7 +187,9 @@ class TrafficApi(HEREApi):
             ),
             "apiKey": self._api_key,
         }
-        return self.__get(self._base_url + "incidents.json", data)
+        return self.__get(
+            self._base_url + "incidents.json", data, "incidents_via_proximity"
+        )
 
     def flow_using_quadkey(self, quadkey: str) -> Optional[TrafficFlowResponse]:
         """Request traffic flow information using a quadkey.
@@ -197,7 +205,7 @@ class TrafficApi(HEREApi):
             "quadkey": quadkey,
             "apiKey": self._api_key,
         }
-        return self.__get(self._base_url + "flow.json", data)
+        return self.__get(self._base_url + "flow.json", data, "flow_using_quadkey")
 
     def flow_within_boundingbox(
         self,
@@ -229,7 +237,7 @@ class TrafficApi(HEREApi):
             "apiKey": self._api_key,
             "responseattributes": response_attributes,
         }
-        return self.__get(self._base_url + "flow.json", data)
+        return self.__get(self._base_url + "flow.json", data, "flow_within_boundingbox")
 
     def flow_using_proximity(
         self, latitude: float, longitude: float, distance: int
@@ -256,7 +264,7 @@ class TrafficApi(HEREApi):
             ),
             "apiKey": self._api_key,
         }
-        return self.__get(self._base_url + "flow.json", data)
+        return self.__get(self._base_url + "flow.json", data, "flow_using_proximity")
 
     def flow_using_proximity_returning_additional_attributes(
         self,
@@ -290,7 +298,11 @@ class TrafficApi(HEREApi):
             "responseattibutes": self.__prepare_str_values(enums=attributes),
             "apiKey": self._api_key,
         }
-        return self.__get(self._base_url + "flow.json", data)
+        return self.__get(
+            self._base_url + "flow.json",
+            data,
+            "flow_using_proximity_returning_additional_attributes",
+        )
 
     def flow_with_minimum_jam_factor(
         self, top_left: List[float], bottom_right: List[float], min_jam_factor: int = 7
@@ -319,7 +331,9 @@ class TrafficApi(HEREApi):
             "minjamfactor": str.format("{0}", min_jam_factor),
             "apiKey": self._api_key,
         }
-        return self.__get(self._base_url + "flow.json", data)
+        return self.__get(
+            self._base_url + "flow.json", data, "flow_with_minimum_jam_factor"
+        )
 
     def flow_in_corridor(
         self, points: List[List[float]], width: int
@@ -339,7 +353,7 @@ class TrafficApi(HEREApi):
             "corridor": self.__prepare_corridor_value(points=points, width=width),
             "apiKey": self._api_key,
         }
-        return self.__get(self._base_url + "flow.json", data)
+        return self.__get(self._base_url + "flow.json", data, "flow_in_corridor")
 
     def flow_availability_data(self) -> Optional[TrafficFlowAvailabilityResponse]:
         """Flow availability requests allow you to see what traffic flow coverage exists in the current Traffic API.
@@ -351,7 +365,9 @@ class TrafficApi(HEREApi):
         data = {
             "apiKey": self._api_key,
         }
-        return self.__get(self._base_url + "flowavailability.json", data)
+        return self.__get(
+            self._base_url + "flowavailability.json", data, "flow_availability_data"
+        )
 
     def additional_attributes(
         self, quadkey: str, attributes: [FlowProximityAdditionalAttributes]
@@ -372,4 +388,4 @@ class TrafficApi(HEREApi):
             "responseattibutes": self.__prepare_str_values(enums=attributes),
             "apiKey": self._api_key,
         }
-        return self.__get(self._base_url + "flow.json", data)
+        return self.__get(self._base_url + "flow.json", data, "additional_attributes")
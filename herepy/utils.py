@@ -1,15 +1,24 @@
 #!/usr/bin/env python
 
 import base64
+import json
 import zlib
-from urllib.parse import urlencode, urlparse, urlunparse
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 from herepy.error import HEREError
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
 
 class Utils(object):
     """Helper class for main api classes"""
 
+    CREDENTIAL_PARAMETERS = ("apikey", "app_id", "app_code")
+
     @staticmethod
     def encode_parameters(parameters):
         """Return a string in key=value&key=value form.
@@ -64,6 +73,77 @@ class Utils(object):
         # Return the rebuilt URL
         return urlunparse((scheme, netloc, path, params, query, fragment))
 
+    @staticmethod
+    def get_cache_key(method, url, body=None):
+        """Builds the key identifying a request in a response cache.
+        Credentials are removed and query parameters sorted, so the same request
+        made with different API keys or parameter order shares one entry.
+        Args:
+          method (str):
+            HTTP method.
+          url (str):
+            url built by `build_url`.
+          body (dict):
+            JSON body of the request.
+        Returns:
+          A string key"""
+
+        (scheme, netloc, path, params, query, fragment) = urlparse(url)
+        query = urlencode(
+            sorted(
+                (key, value)
+                for key, value in parse_qsl(query, keep_blank_values=True)
+                if key.lower() not in Utils.CREDENTIAL_PARAMETERS
+            )
+        )
+        key = (
+            method.upper() + " " + urlunparse((scheme, netloc, path, params, query, ""))
+        )
+        if body is not None:
+            key += " " + json.dumps(body, sort_keys=True, separators=(",", ":"))
+        return key
+
+    @staticmethod
+    def redact_url(url):
+        """Replaces the credentials in the query of a url, so it can be logged.
+        Args:
+          url (str):
+            url built by `build_url`.
+        Returns:
+          The url with the values of credential parameters replaced by REDACTED"""
+
+        (scheme, netloc, path, params, query, fragment) = urlparse(url)
+        if not query:
+            return url
+        query = urlencode(
+            [
+                (
+                    key,
+                    "REDACTED" if key.lower() in Utils.CREDENTIAL_PARAMETERS else value,
+                )
+                for key, value in parse_qsl(query, keep_blank_values=True)
+            ]
+        )
+        return urlunparse((scheme, netloc, path, params, query, fragment))
+
+    @staticmethod
+    def use_numpy(use_numpy: Optional[bool]) -> bool:
+        """Resolves the `use_numpy` argument of array accessors.
+        Args:
+          use_numpy (Optional[bool]):
+            Whether NumPy arrays are requested, None for NumPy if installed.
+        Returns:
+          True if NumPy arrays are to be returned.
+        Raises:
+          HEREError: If NumPy arrays are requested but NumPy is not installed.
+        """
+
+        if use_numpy is None:
+            return numpy is not None
+        if use_numpy and numpy is None:
+            raise HEREError("NumPy is required for use_numpy=True.")
+        return use_numpy
+
     @staticmethod
     def get_zipped_base64(content):
         content_bytes = content.encode("utf-8")
@@ -1,33 +1,57 @@
 #!/usr/bin/env python
 
-import json
-import sys
-from typing import Dict, Optional
+import functools
+import logging
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 import requests
 
-from herepy import MercatorProjection, VectorMapTileLayer
+from herepy import MercatorProjection, VectorMapTileLayer, tile_prefetch
 from herepy.error import HEREError, InvalidRequestError, UnauthorizedError
 from herepy.here_api import HEREApi
 from herepy.utils import Utils
 
+logger = logging.getLogger(__name__)
+
 
 class VectorTileApi(HEREApi):
     """A python interface into the HERE Vector Tile API"""
 
-    def __init__(self, api_key: str = None, timeout: int = None):
+    SERVICE = "tiles"
+
+    def __init__(
+        self,
+        api_key: str = None,
+        timeout: int = None,
+        tile_store: Optional[Any] = None,
+        tile_cache: Optional[Any] = None,
+        **kwargs
+    ):
         """Returns a VectorTileApi instance.
         Args:
           api_key (str):
             API key taken from HERE Developer Portal.
           timeout (int):
             Timeout limit for requests.
+          tile_store (Optional[Any]):
+            Store every downloaded tile is written to and which tiles are served
+            from without a request once stored, e.g.
+            `herepy.tile_store.MBTilesStore`. Tiles are addressed by zoom, column
+            and row only, so a store must be used with one layer and format.
+          tile_cache (Optional[Any]):
+            Cache of downloaded tiles keyed by all their parameters, e.g.
+            `herepy.tile_cache.DiskTileCache`. Fresh tiles are served without a
+            request, stale ones are revalidated with their ETag.
+          **kwargs:
+            Transport options forwarded to HEREApi, e.g. `session`.
         """
 
-        super(VectorTileApi, self).__init__(api_key, timeout)
+        super(VectorTileApi, self).__init__(api_key, timeout, **kwargs)
+        self._tile_store = tile_store
+        self._tile_cache = tile_cache
         self._base_url = "https://vector.hereapi.com/v2/vectortiles/"
 
-    def __get_error_from_response(self, json_data):
+    def __get_error_from_response(self, json_data, function_name):
         if "error" in json_data:
             error_description = json_data["error_description"]
             if json_data["error"] == "Unauthorized":
@@ -35,9 +59,7 @@ class VectorTileApi(HEREApi):
         error_type = json_data.get("Type")
         error_message = json_data.get(
             "Message",
-            error_description
-            + ", error occurred on "
-            + sys._getframe(1).f_code.co_name,
+            error_description + ", error occurred on " + function_name,
         )
         if error_type == "Invalid Request":
             return InvalidRequestError(error_message)
@@ -83,6 +105,66 @@ class VectorTileApi(HEREApi):
         column, row = MercatorProjection.get_column_row(
             latitude=latitude, longitude=longitude, zoom=zoom
         )
+        return self.get_vectortile_by_tile(
+            column,
+            row,
+            zoom,
+            layer=layer,
+            projection=projection,
+            tile_format=tile_format,
+            query_parameters=query_parameters,
+            headers=headers,
+        )
+
+    def get_vectortile_by_tile(
+        self,
+        column: int,
+        row: int,
+        zoom: int,
+        layer: VectorMapTileLayer = VectorMapTileLayer.base,
+        projection: str = "mc",
+        tile_format: str = "omv",
+        query_parameters: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+    ) -> Optional[bytes]:
+        """Retrieves the protocol buffer encoded binary tile at given column and row.
+        Args:
+          column (int):
+            Column of the tile, see `MercatorProjection.get_column_row`.
+          row (int):
+            Row of the tile.
+          zoom (int):
+            Specifies the tile Zoom level. Accepted values range from 0-17.
+          The other arguments are the ones of `get_vectortile`.
+        Returns:
+          Vector tile as bytes.
+        Raises:
+          HEREError
+        """
+
+        if self._tile_store is not None:
+            tile = self._tile_store.get(zoom, column, row)
+            if tile is not None:
+                return self._resolved(tile)
+        tile_key = cached = None
+        if self._tile_cache is not None:
+            tile_key = (
+                "vectortile",
+                str(layer),
+                projection,
+                zoom,
+                column,
+                row,
+                tile_format,
+                sorted((query_parameters or {}).items()),
+            )
+            cached = self._tile_cache.get(tile_key)
+            if cached is not None and cached.is_fresh():
+                return self._resolved(
+                    self._store_tile(zoom, column, row, cached.content)
+                )
+            if cached is not None and cached.etag:
+                headers = dict(headers or {}, **{"If-None-Match": cached.etag})
         url = str.format(
             self._base_url + "{}/{}/{}/{}/{}/{}",
             layer.__str__(),
@@ -92,20 +174,100 @@ class VectorTileApi(HEREApi):
             row,
             tile_format,
         )
-        if query_parameters:
-            query_parameters.update({"apiKey": self._api_key})
-        else:
-            query_parameters = {"apiKey": self._api_key}
+        query_parameters = dict(query_parameters or {}, apiKey=self._api_key)
         url = Utils.build_url(url, extra_params=query_parameters)
-        response = requests.get(
-            url, headers=headers, timeout=self._timeout, stream=True
+        return self._send(
+            "GET",
+            url,
+            lambda response: self._store_tile(
+                zoom, column, row, self._parse_tile(response, tile_key, cached)
+            ),
+            headers=headers,
+            stream=True,
         )
+
+    def get_vectortiles_along_route(
+        self,
+        route: tile_prefetch.Route,
+        zooms: Iterable[int],
+        buffer: float = 250.0,
+        max_workers: int = 8,
+        skip_stored: bool = False,
+        **kwargs
+    ) -> Iterator[Tuple[int, int, int, Union[bytes, HEREError]]]:
+        """Downloads every vector tile within a distance of a route at the given
+        zoom levels, concurrently on a bounded pool of worker threads, to warm
+        the tile store or tile cache of this instance before the route is
+        travelled.
+        Args:
+          route (tile_prefetch.Route):
+            `RoutingResponseV8` with polylines, an encoded flexible polyline or
+            a list of points, see `herepy.tile_prefetch.get_route_paths`.
+          zooms (Iterable[int]):
+            Zoom levels of the tiles.
+          buffer (float):
+            Distance from the route in meters.
+          max_workers (int):
+            Maximum number of tiles downloaded at the same time.
+          skip_stored (bool):
+            Whether tiles already in the tile store are left out instead of
+            being read from it.
+          **kwargs:
+            `get_vectortile_by_tile` arguments shared by every tile, e.g. `layer`.
+        Returns:
+          Iterator of zoom, column, row and the vector tile as bytes, or the
+          HEREError raised for that tile, in the order the tiles arrive.
+        """
+
+        tiles = tile_prefetch.get_tiles_along_route(route, zooms, buffer)
+        if skip_stored:
+            tiles = tile_prefetch.skip_stored(tiles, self._tile_store)
+        yield from tile_prefetch.download_tiles(
+            tiles, functools.partial(self._get_indexed_tile, **kwargs), max_workers
+        )
+
+    def _get_indexed_tile(
+        self, index: int, zoom: int, column: int, row: int, **kwargs
+    ) -> Optional[bytes]:
+        return self.get_vectortile_by_tile(column, row, zoom, **kwargs)
+
+    def _parse_tile(self, response, tile_key, cached):
+        if (
+            response.status_code == requests.codes.not_modified
+            and cached is not None
+            and cached.etag
+        ):
+            # Only answers to a revalidation of the cached tile are accepted.
+            self._tile_cache.refresh(tile_key, response.headers)
+            return cached.content
+        tile = self.__parse_response(response, "get_vectortile")
+        if not response.ok or response.status_code == requests.codes.not_modified:
+            # Bodies of other answers, e.g. the HTML page of a gateway error or
+            # an unexpected revalidation, are no tiles and must neither be
+            # written to the tile store nor to the tile cache.
+            raise HEREError(
+                str.format(
+                    "Error occurred on get_vectortile: status {0}", response.status_code
+                )
+            )
+        if tile_key is not None and tile and response.status_code == requests.codes.OK:
+            self._tile_cache.set(tile_key, tile, response.headers)
+        return tile
+
+    def _store_tile(
+        self, zoom: int, column: int, row: int, tile: Optional[bytes]
+    ) -> Optional[bytes]:
+        if self._tile_store is not None and tile:
+            self._tile_store.put(zoom, column, row, tile)
+        return tile
+
+    def __parse_response(self, response, function_name):
         if isinstance(response.content, bytes):
             try:
-                json_data = json.loads(response.content.decode("utf8"))
+                json_data = self._decode_json(response)
                 if "error" in json_data:
-                    error = self.__get_error_from_response(json_data)
+                    error = self.__get_error_from_response(json_data, function_name)
                     raise error
-            except UnicodeDecodeError as err:
-                print("Vector tile downloaded")
+            except ValueError:
+                logger.debug("Vector tile downloaded")
         return response.content
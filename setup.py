@@ -49,6 +49,12 @@ setup(
     platforms=["Any"],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "async": ["aiohttp>=3.8,<4"],
+        "numpy": ["numpy"],
+        "orjson": ["orjson"],
+        "opentelemetry": ["opentelemetry-api"],
+    },
     keywords="here api, here technologies, here python api clients, rest api clients",
     classifiers=[
         "Intended Audience :: Developers",
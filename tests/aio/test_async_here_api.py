@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from herepy import GeocoderResponse, HEREError, MapTileApi
+from herepy.aio import (
+    AsyncGeocoderApi,
+    AsyncHEREApi,
+    AsyncMapTileApi,
+    AsyncPublicTransitApi,
+    AsyncResponse,
+    AsyncRoutingApi,
+)
+from herepy.cache import LRUCache
+from herepy.instrumentation import Instrumentation
+from herepy.rate_limit import RateLimiter
+from herepy.retry import RetryPolicy
+from herepy.single_flight import SingleFlight
+
+
+def response_from_file(path, status_code=200):
+    with open(path, "rb") as f:
+        return AsyncResponse(status_code, {}, f.read(), "https://here.com")
+
+
+class FakeClientResponse(object):
+    def __init__(self, status, headers=None, content=b"{}"):
+        self.status = status
+        self.headers = headers or {}
+        self.url = "https://here.com"
+        self._content = content
+        self.released = False
+
+    async def read(self):
+        return self._content
+
+    def release(self):
+        self.released = True
+
+
+class FakeClientSession(object):
+    closed = False
+
+    def __init__(self, responses, delay=0):
+        self._responses = list(responses)
+        self._delay = delay
+        self.calls = 0
+
+    async def request(self, method, url, **kwargs):
+        self.calls += 1
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return self._responses.pop(0)
+
+
+class AsyncHEREApiTest(unittest.IsolatedAsyncioTestCase):
+    def test_initiation(self):
+        api = AsyncGeocoderApi(api_key="api_key", timeout=5)
+        self.assertIsInstance(api, AsyncHEREApi)
+        self.assertEqual(api._api_key, "api_key")
+        self.assertEqual(api._timeout, 5)
+        self.assertEqual(api._base_url, "https://geocode.search.hereapi.com/v1/geocode")
+        self.assertIsNone(api.session)
+
+    def test_no_requests_session(self):
+        with patch("herepy.here_api.HEREApi.shared_session") as shared_session:
+            api = AsyncRoutingApi(api_key="api_key")
+        shared_session.assert_not_called()
+        self.assertIsNone(api._session)
+
+    def test_response_json(self):
+        response = AsyncResponse(200, {}, b'{"items": []}', "https://here.com")
+        self.assertTrue(response.ok)
+        self.assertEqual(response.json(), {"items": []})
+        self.assertFalse(AsyncResponse(404, {}, b"", "https://here.com").ok)
+
+    async def test_free_form_returns_awaitable(self):
+        api = AsyncGeocoderApi(api_key="api_key")
+        with patch.object(
+            AsyncHEREApi,
+            "_request",
+            AsyncMock(return_value=response_from_file("testdata/models/geocoder.json")),
+        ) as mock_request:
+            response = await api.free_form("200 S Mathilda Sunnyvale CA")
+        self.assertIsInstance(response, GeocoderResponse)
+        method, url = mock_request.call_args[0]
+        self.assertEqual(method, "GET")
+        self.assertIn("q=200+S+Mathilda+Sunnyvale+CA", url)
+
+    async def test_response_cache(self):
+        api = AsyncGeocoderApi(api_key="api_key", cache=LRUCache())
+        with patch.object(
+            AsyncHEREApi,
+            "_request",
+            AsyncMock(return_value=response_from_file("testdata/models/geocoder.json")),
+        ) as mock_request:
+            first = await api.free_form("200 S Mathilda Sunnyvale CA")
+            second = await api.free_form("200 S Mathilda Sunnyvale CA")
+        self.assertEqual(first.as_dict(), second.as_dict())
+        self.assertEqual(mock_request.call_count, 1)
+
+    async def test_free_form_raises_parsed_error(self):
+        api = AsyncGeocoderApi(api_key="api_key")
+        with patch.object(
+            AsyncHEREApi,
+            "_request",
+            AsyncMock(
+                return_value=response_from_file("testdata/models/geocoder_error.json")
+            ),
+        ):
+            with self.assertRaises(HEREError):
+                await api.free_form("200 S Mathilda Sunnyvale CA")
+
+    async def test_public_transit_calculate_route_adds_short_route(self):
+        api = AsyncPublicTransitApi(api_key="api_key")
+        with patch.object(
+            AsyncHEREApi,
+            "_request",
+            AsyncMock(
+                return_value=response_from_file(
+                    "testdata/models/public_transit_api_calculate_route_time.json"
+                )
+            ),
+        ):
+            response = await api.calculate_route(
+                [41.9773, -87.9019], [41.8961, -87.6552], "2017-11-30T12:00:00"
+            )
+        connections = response.Res["Connections"]["Connection"]
+        self.assertIn("short_route", connections[0])
+
+    async def test_map_tile_returns_bytes(self):
+        with open("testdata/tiles/berlin.png", "rb") as f:
+            response = FakeClientResponse(200, content=f.read())
+        api = AsyncMapTileApi(api_key="api_key", session=FakeClientSession([response]))
+        self.assertIsInstance(api, MapTileApi)
+        tile = await api.get_maptile(latitude=52.525439, longitude=13.38727, zoom=12)
+        self.assertTrue(tile.startswith(b"\x89PNG"))
+        self.assertTrue(response.released)
+
+    async def test_map_tiles_in_bbox(self):
+        api = AsyncMapTileApi(api_key="api_key")
+        servers = []
+
+        async def get_maptile_by_tile(column, row, zoom, server=None, **kwargs):
+            servers.append(server)
+            if column == 137:
+                raise HEREError("Tile failed.")
+            return b"tile"
+
+        with patch.object(api, "get_maptile_by_tile", get_maptile_by_tile):
+            tiles = [
+                tile
+                async for tile in api.get_maptiles_in_bbox(
+                    [52.6, 13.2], [52.55, 14.2], [8], max_concurrency=1
+                )
+            ]
+        self.assertEqual([tile[:3] for tile in tiles], [(8, 137, 83), (8, 138, 83)])
+        self.assertIsInstance(tiles[0][3], HEREError)
+        self.assertEqual(tiles[1][3], b"tile")
+        self.assertEqual(servers, [1, 2])
+
+    async def test_retry_policy(self):
+        session = FakeClientSession(
+            [
+                FakeClientResponse(503),
+                FakeClientResponse(429, {"Retry-After": "0"}),
+                FakeClientResponse(200),
+            ]
+        )
+        api = AsyncHEREApi(
+            api_key="api_key",
+            session=session,
+            retry_policy=RetryPolicy(backoff_factor=0.01),
+        )
+        with patch("herepy.aio.here_api.asyncio.sleep", AsyncMock()) as sleep:
+            response = await api._request("GET", "https://here.com")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.attempts, 3)
+        self.assertEqual(session.calls, 3)
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(sleep.call_args[0][0], 0)
+
+    async def test_request_is_sent_once_without_retry_policy(self):
+        session = FakeClientSession([FakeClientResponse(503)])
+        api = AsyncHEREApi(api_key="api_key", session=session)
+        response = await api._request("GET", "https://here.com")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.attempts, 1)
+
+    async def test_instrumentation(self):
+        session = FakeClientSession(
+            [FakeClientResponse(503), FakeClientResponse(200, content=b"[]")]
+        )
+        events = []
+        api = AsyncGeocoderApi(
+            api_key="api_key",
+            session=session,
+            retry_policy=RetryPolicy(backoff_factor=0),
+            instrumentation=Instrumentation(after=[events.append]),
+        )
+        await api._request("GET", "https://here.com/v1?apiKey=api_key")
+        self.assertEqual([event.status_code for event in events], [503, 200])
+        self.assertEqual([event.attempt for event in events], [1, 2])
+        self.assertEqual(events[1].service, "geocoding")
+        self.assertEqual(events[1].url, "https://here.com/v1?apiKey=REDACTED")
+        self.assertEqual(events[1].bytes_received, 2)
+        self.assertIn("ttfb", events[1].timings)
+        self.assertIn("total", events[1].timings)
+
+    async def test_rate_limiter(self):
+        session = FakeClientSession([FakeClientResponse(200)])
+        limiter = RateLimiter({"geocoding": 10})
+        api = AsyncGeocoderApi(api_key="api_key", session=session, rate_limiter=limiter)
+        with patch.object(limiter, "acquire_async", AsyncMock()) as acquire_async:
+            await api._request("GET", "https://here.com")
+        acquire_async.assert_awaited_once_with("geocoding")
+
+    @patch("herepy.map_tile_api.randrange", Mock(return_value=1))
+    async def test_single_flight(self):
+        with open("testdata/tiles/berlin.png", "rb") as f:
+            session = FakeClientSession(
+                [FakeClientResponse(200, content=f.read())], 0.01
+            )
+        api = AsyncMapTileApi(
+            api_key="api_key", session=session, single_flight=SingleFlight()
+        )
+        tiles = await asyncio.gather(
+            *[
+                api.get_maptile(latitude=52.525439, longitude=13.38727, zoom=12)
+                for _ in range(4)
+            ]
+        )
+        self.assertEqual(session.calls, 1)
+        self.assertTrue(tiles[0].startswith(b"\x89PNG"))
+        self.assertTrue(all(tile is tiles[0] for tile in tiles))
@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+
+import gzip
+import json as json_module
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import herepy
+from herepy.aio import AsyncHEREApi, AsyncResponse, AsyncRoutingApi
+
+
+def response_from_file(path, status_code=200):
+    with open(path, "rb") as f:
+        return AsyncResponse(status_code, {}, f.read(), "https://here.com")
+
+
+class FakeStreamReader(object):
+    def __init__(self, content):
+        self._content = content
+
+    async def iter_chunked(self, chunk_size):
+        for i in range(0, len(self._content), chunk_size):
+            yield self._content[i : i + chunk_size]
+
+
+class FakeStreamResponse(object):
+    def __init__(self, status, content, headers=None, url="https://com.com/result"):
+        self.status = status
+        self.headers = headers or {}
+        self.url = url
+        self.content = FakeStreamReader(content)
+        self._body = content
+        self.released = False
+
+    async def read(self):
+        return self._body
+
+    def release(self):
+        self.released = True
+
+
+class FakeStreamSession(object):
+    closed = False
+
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self.requests = []
+
+    async def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        return self._responses.pop(0)
+
+
+class AsyncRoutingApiTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self._api = AsyncRoutingApi("api_key")
+
+    async def test_route_v8_with_coordinates(self):
+        with patch.object(
+            AsyncHEREApi,
+            "_request",
+            AsyncMock(
+                return_value=response_from_file(
+                    "testdata/models/routing_v8_response.json"
+                )
+            ),
+        ) as mock_request:
+            response = await self._api.route_v8(
+                transport_mode=herepy.RoutingTransportMode.car,
+                origin=[41.9798, -87.8801],
+                destination=[41.9043, -87.9216],
+            )
+        self.assertIsInstance(response, herepy.RoutingResponseV8)
+        self.assertEqual(mock_request.call_count, 1)
+
+    async def test_route_v8_error(self):
+        with patch.object(
+            AsyncHEREApi,
+            "_request",
+            AsyncMock(
+                return_value=response_from_file(
+                    "testdata/models/routing_v8_error_access_denied.json", 403
+                )
+            ),
+        ):
+            with self.assertRaises(herepy.AccessDeniedError):
+                await self._api.route_v8(
+                    transport_mode=herepy.RoutingTransportMode.car,
+                    origin=[41.9798, -87.8801],
+                    destination=[41.9043, -87.9216],
+                )
+
+    async def test_route_v8_batch_keeps_order_and_errors(self):
+        success_response = response_from_file(
+            "testdata/models/routing_v8_response.json"
+        )
+        error_response = response_from_file(
+            "testdata/models/routing_v8_error_access_denied.json", 403
+        )
+
+        async def request(method, url, headers=None, json=None, **kwargs):
+            if "origin=0.0" in url:
+                return error_response
+            if "origin=1.0" in url:
+                return AsyncResponse(502, {}, b"<html>Bad Gateway</html>", url)
+            return success_response
+
+        with patch.object(
+            AsyncHEREApi, "_request", AsyncMock(side_effect=request)
+        ) as mock_request:
+            results = await self._api.route_v8_batch(
+                [
+                    {"origin": [41.9798, -87.8801], "destination": [41.9043, -87.9216]},
+                    {"origin": [0.0, 0.0], "destination": [41.9043, -87.9216]},
+                    {"origin": [41.9043, -87.9216], "destination": [41.9798, -87.8801]},
+                    {"origin": [1.0, 1.0], "destination": [41.9043, -87.9216]},
+                ],
+                max_concurrency=2,
+                transport_mode=herepy.RoutingTransportMode.car,
+            )
+        self.assertEqual(len(results), 4)
+        self.assertIsInstance(results[0], herepy.RoutingResponseV8)
+        self.assertIsInstance(results[1], herepy.AccessDeniedError)
+        self.assertIsInstance(results[2], herepy.RoutingResponseV8)
+        self.assertIsInstance(results[3], herepy.HEREError)
+        self.assertEqual(mock_request.call_count, 4)
+
+    async def test_sync_matrix_geocodes_each_name_once(self):
+        geocoder_response = response_from_file("testdata/models/geocoder.json")
+        matrix_response = response_from_file(
+            "testdata/models/routing_matrix_multiple_destinations.json"
+        )
+
+        async def request(method, url, headers=None, json=None, **kwargs):
+            if method == "POST":
+                return matrix_response
+            return geocoder_response
+
+        with patch.object(
+            AsyncHEREApi, "_request", AsyncMock(side_effect=request)
+        ) as mock_request:
+            response = await self._api.sync_matrix(
+                origins=["Seattle", [9.933231, -84.076831], "Seattle"],
+                destinations=["Kentucky", "Seattle"],
+            )
+        self.assertIsInstance(response, herepy.RoutingMatrixResponse)
+        methods = [call[0][0] for call in mock_request.call_args_list]
+        self.assertEqual(methods.count("GET"), 2)
+        self.assertEqual(methods.count("POST"), 1)
+
+    async def test_geocoding_shares_transport_options(self):
+        with open("testdata/models/geocoder.json", "rb") as f:
+            session = FakeStreamSession(
+                FakeStreamResponse(200, f.read(), url="https://here.com")
+            )
+        events = []
+        limiter = herepy.RateLimiter({"geocoding": 100})
+        api = AsyncRoutingApi(
+            "api_key",
+            session=session,
+            rate_limiter=limiter,
+            instrumentation=herepy.Instrumentation(after=[events.append]),
+        )
+        with patch.object(limiter, "acquire_async", AsyncMock()) as acquire_async:
+            await api._get_coordinates_for_location_name("Seattle")
+        acquire_async.assert_awaited_once_with("geocoding")
+        self.assertEqual([event.service for event in events], ["geocoding"])
+        self.assertIs(api._geocoder_api.session, session)
+
+    async def test_location_name_errors_are_reported_together(self):
+        async def geocode(location_name):
+            if location_name.startswith("Nowhere"):
+                raise herepy.WaypointNotFoundError("not found " + location_name)
+            return [1.0, 2.0]
+
+        self._api._get_coordinates_for_location_name = geocode
+        with self.assertRaises(herepy.WaypointNotFoundError) as context:
+            await self._api._resolve_matrix_waypoints(
+                ["Nowhere 1", "Berlin"], ["Nowhere 2", [1.0, 2.0]]
+            )
+        self.assertEqual(sorted(context.exception.errors), ["Nowhere 1", "Nowhere 2"])
+
+    async def test_sync_matrix_tiled(self):
+        async def request(method, url, headers=None, json=None, **kwargs):
+            travel_times = [
+                int(origin["lat"]) * 100 + int(destination["lat"])
+                for origin in json["origins"]
+                for destination in json["destinations"]
+            ]
+            matrix = {
+                "numOrigins": len(json["origins"]),
+                "numDestinations": len(json["destinations"]),
+                "travelTimes": travel_times,
+            }
+            content = json_module.dumps({"matrix": matrix}).encode("utf8")
+            return AsyncResponse(200, {}, content, url)
+
+        with patch.object(
+            AsyncHEREApi, "_request", AsyncMock(side_effect=request)
+        ) as mock_request:
+            response = await self._api.sync_matrix(
+                origins=[[lat, 0.0] for lat in range(3)],
+                destinations=[[lat, 0.0] for lat in range(4)],
+                max_destinations_per_request=3,
+            )
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(
+            response.matrix["travelTimes"],
+            [
+                origin * 100 + destination
+                for origin in range(3)
+                for destination in range(4)
+            ],
+        )
+
+    async def test_async_matrix_polls_without_blocking(self):
+        responses = [
+            response_from_file(
+                "testdata/models/routing_async_matrix_calculation.json", 202
+            ),
+            response_from_file(
+                "testdata/models/routing_async_matrix_calculation.json", 200
+            ),
+            response_from_file("testdata/models/routing_async_matrix_completed.json"),
+        ]
+        with patch.object(
+            AsyncHEREApi, "_request", AsyncMock(side_effect=responses)
+        ) as mock_request:
+            response = await self._api.async_matrix(
+                token="token",
+                origins=[[9.933231, -84.076831]],
+                destinations=[[9.934574, -84.065544]],
+                poll_step=0,
+                matrix_type=herepy.MatrixRoutingType.circle,
+                center=[9.933300, -84.066891],
+                radius=10000,
+            )
+        self.assertIsInstance(response, herepy.RoutingMatrixResponse)
+        self.assertEqual(mock_request.call_count, 3)
+
+    async def test_async_matrix_streams_result(self):
+        body = json_module.dumps(
+            {
+                "matrixId": "matrixId",
+                "matrix": {
+                    "numOrigins": 1,
+                    "numDestinations": 2,
+                    "travelTimes": [290, None],
+                    "errorCodes": [0, 3],
+                },
+            }
+        ).encode()
+        with open("testdata/models/routing_async_matrix_calculation.json", "rb") as f:
+            calculation = f.read()
+        result = FakeStreamResponse(200, gzip.compress(body))
+        session = FakeStreamSession(
+            FakeStreamResponse(202, calculation),
+            FakeStreamResponse(303, b"", {"Location": "https://com.com/result"}),
+            result,
+        )
+        api = AsyncRoutingApi("api_key", session=session)
+        response = await api.async_matrix(
+            token="token",
+            origins=[[9.933231, -84.076831]],
+            destinations=[[9.934574, -84.065544], [9.933231, -84.076831]],
+            poll_step=0,
+        )
+        self.assertFalse(session.requests[1][2]["allow_redirects"])
+        self.assertEqual(
+            [url for _, url, _ in session.requests][2], "https://com.com/result"
+        )
+        self.assertEqual(
+            session.requests[2][2]["headers"]["Authorization"], "Bearer token"
+        )
+        self.assertTrue(result.released)
+        self.assertEqual(list(response.get_travel_times(use_numpy=False)), [290, 0])
+        self.assertEqual(list(response.get_error_codes(use_numpy=False)), [0, 3])
+
+    async def test_download_matrix_result_retries(self):
+        result = FakeStreamResponse(200, gzip.compress(b'{"matrix": {}}'))
+        unavailable = FakeStreamResponse(503, b"")
+        session = FakeStreamSession(unavailable, result)
+        api = AsyncRoutingApi(
+            "api_key",
+            session=session,
+            retry_policy=herepy.RetryPolicy(backoff_factor=0),
+        )
+        response = await api.download_matrix_result("token", "https://com.com/result")
+        self.assertIsInstance(response, herepy.RoutingMatrixResponse)
+        self.assertEqual(len(session.requests), 2)
+        self.assertTrue(unavailable.released)
+        self.assertTrue(result.released)
+
+    async def test_download_matrix_result_error(self):
+        error = FakeStreamResponse(403, b"<Error/>")
+        session = FakeStreamSession(error)
+        api = AsyncRoutingApi("api_key", session=session)
+        with self.assertRaises(herepy.HEREError):
+            await api.download_matrix_result("token", "https://com.com/result")
+        self.assertTrue(error.released)
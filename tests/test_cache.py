@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+import os
+import tempfile
+import time
+import unittest
+
+from herepy.cache import LRUCache, SQLiteCache
+
+
+class LRUCacheTest(unittest.TestCase):
+    def test_get_and_set(self):
+        cache = LRUCache()
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.get("key", "default"), "default")
+        cache.set("key", [1, 2])
+        self.assertEqual(cache.get("key"), [1, 2])
+        self.assertIn("key", cache)
+        self.assertEqual(len(cache), 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_ttl(self):
+        cache = LRUCache(ttl=0.01)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=60)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(len(cache), 1)
+
+    def test_delete_and_clear(self):
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.delete("a")
+        cache.delete("missing")
+        self.assertNotIn("a", cache)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class SQLiteCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, "cache.sqlite")
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_get_and_set(self):
+        cache = SQLiteCache(self._path)
+        self.assertIsNone(cache.get("key"))
+        cache.set("key", {"content": b"bytes", "status_code": 200})
+        self.assertEqual(cache.get("key"), {"content": b"bytes", "status_code": 200})
+        self.assertIn("key", cache)
+        cache.close()
+        cache = SQLiteCache(self._path)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get("key")["content"], b"bytes")
+        cache.close()
+
+    def test_evicts_least_recently_used(self):
+        cache = SQLiteCache(self._path, maxsize=2)
+        cache.set("a", 1)
+        time.sleep(0.01)
+        cache.set("b", 2)
+        time.sleep(0.01)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        cache.close()
+
+    def test_ttl_delete_and_clear(self):
+        cache = SQLiteCache(self._path, ttl=0.01)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=60)
+        cache.set("c", 3, ttl=60)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("a"))
+        cache.delete("b")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        cache.close()
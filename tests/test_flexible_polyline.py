@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+import json
+import unittest
+from array import array
+
+import herepy
+from herepy.flexible_polyline import FlexiblePolyline, numpy
+from herepy.here_enum import PolylineThirdDimension
+
+COORDINATES = [
+    (50.1022829, 8.6982122),
+    (50.1020076, 8.6956695),
+    (50.1006313, 8.6914960),
+    (50.0987800, 8.6875156),
+]
+ENCODED = "BFoz5xJ67i1B1B7PzIhaxL7Y"
+ENCODED_3D = "BlBoz5xJ67i1BU1B7PUzIhaUxL7YU"
+DECODED = [50.10228, 8.69821, 50.10201, 8.69567, 50.10063, 8.6915, 50.09878, 8.68752]
+
+
+class FlexiblePolylineTest(unittest.TestCase):
+    def test_encode(self):
+        self.assertEqual(FlexiblePolyline.encode(COORDINATES), ENCODED)
+        self.assertEqual(
+            FlexiblePolyline.encode(
+                [point + (10 * (i + 1),) for i, point in enumerate(COORDINATES)],
+                third_dim=PolylineThirdDimension.altitude,
+            ),
+            ENCODED_3D,
+        )
+
+    def test_encode_invalid_precision(self):
+        with self.assertRaises(herepy.HEREError):
+            FlexiblePolyline.encode(COORDINATES, precision=16)
+
+    def test_get_header(self):
+        self.assertEqual(
+            FlexiblePolyline.get_header(ENCODED), (5, PolylineThirdDimension.absent, 0)
+        )
+        self.assertEqual(
+            FlexiblePolyline.get_header(ENCODED_3D),
+            (5, PolylineThirdDimension.altitude, 0),
+        )
+
+    def test_decode_array(self):
+        decoded = FlexiblePolyline.decode(ENCODED, use_numpy=False)
+        self.assertIsInstance(decoded, array)
+        self.assertEqual(list(decoded), DECODED)
+
+    def test_decode_array_third_dimension(self):
+        decoded = FlexiblePolyline.decode(ENCODED_3D, use_numpy=False)
+        self.assertEqual(list(decoded[2::3]), [10, 20, 30, 40])
+        self.assertEqual(list(decoded[0::3]), DECODED[0::2])
+
+    def test_round_trip_precision(self):
+        coordinates = [(-33.8688197, 151.2092955, -12.5), (-33.8611, 151.21, 3.25)]
+        encoded = FlexiblePolyline.encode(
+            coordinates,
+            precision=7,
+            third_dim=PolylineThirdDimension.elevation,
+            third_dim_precision=2,
+        )
+        decoded = FlexiblePolyline.decode(encoded, use_numpy=False)
+        self.assertEqual(
+            list(decoded), [value for point in coordinates for value in point]
+        )
+
+    def test_decode_invalid(self):
+        for encoded in [
+            "",
+            "BF!a",
+            "BFoz5xJ67i1B1B7PzIhaxL7",
+            "CFoz5xJ67i1B",
+            "BFoz5xJ",
+        ]:
+            with self.assertRaises(herepy.HEREError):
+                FlexiblePolyline.decode(encoded, use_numpy=False)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_decode_numpy(self):
+        decoded = FlexiblePolyline.decode(ENCODED, use_numpy=True)
+        self.assertEqual(decoded.shape, (4, 2))
+        self.assertEqual(decoded.ravel().tolist(), DECODED)
+        decoded = FlexiblePolyline.decode(ENCODED_3D, use_numpy=True)
+        self.assertEqual(decoded[:, 2].tolist(), [10, 20, 30, 40])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_decode_many_numpy_matches_array(self):
+        encoded_polylines = [ENCODED, "BFoz5xJ67i1B", ENCODED, ENCODED_3D]
+        numpy_decoded = FlexiblePolyline.decode_many(encoded_polylines, use_numpy=True)
+        array_decoded = FlexiblePolyline.decode_many(encoded_polylines, use_numpy=False)
+        for numpy_polyline, array_polyline in zip(numpy_decoded, array_decoded):
+            self.assertEqual(numpy_polyline.ravel().tolist(), list(array_polyline))
+        same_header = FlexiblePolyline.decode_many(encoded_polylines[:3], True)
+        self.assertEqual(
+            [polyline.shape for polyline in same_header], [(4, 2), (1, 2), (4, 2)]
+        )
+        self.assertEqual(same_header[2].ravel().tolist(), DECODED)
+
+    def test_decode_routes(self):
+        with open("testdata/models/routing_v8_response.json", "r") as f:
+            response = herepy.RoutingResponseV8.new_from_jsondict(json.load(f))
+        decoded = response.decode_polylines(use_numpy=False)
+        self.assertEqual(len(decoded), len(response.routes))
+        first_section = response.routes[0]["sections"][0]
+        location = first_section["departure"]["place"]["location"]
+        self.assertEqual(list(decoded[0][0][:2]), [location["lat"], location["lng"]])
+        self.assertEqual(
+            FlexiblePolyline.encode(
+                zip(decoded[0][0][0::2], decoded[0][0][1::2]), precision=6
+            ),
+            first_section["polyline"],
+        )
+        self.assertEqual(
+            FlexiblePolyline.decode_routes([{"sections": [{"id": "a"}]}]), [[None]]
+        )
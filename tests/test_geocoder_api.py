@@ -49,6 +49,18 @@ class GeocoderApiTest(unittest.TestCase):
         with self.assertRaises(herepy.HEREError):
             self._api.free_form("")
 
+    @responses.activate
+    def test_freeform_error_names_function(self):
+        responses.add(
+            responses.GET,
+            "https://geocode.search.hereapi.com/v1/geocode",
+            "<html>Bad Gateway</html>",
+            status=502,
+        )
+        with self.assertRaises(herepy.HEREError) as context:
+            self._api.free_form("200 S Mathilda Sunnyvale CA")
+        self.assertIn("free_form", str(context.exception))
+
     @responses.activate
     def test_address_withboundingbox_whensucceed(self):
         with open("testdata/models/geocoder.json", "r") as f:
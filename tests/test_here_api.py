@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+
+import unittest
+from unittest.mock import patch
+
+import requests
+import responses
+
+import herepy
+from herepy.cache import LRUCache
+from herepy.here_api import HEREApi
+from herepy.retry import RetryPolicy
+
+
+class HEREApiTest(unittest.TestCase):
+    def test_initiation_uses_shared_session(self):
+        api = HEREApi(api_key="api_key")
+        other = herepy.GeocoderApi(api_key="api_key")
+        self.assertIsInstance(api.session, requests.Session)
+        self.assertIs(api.session, HEREApi.shared_session())
+        self.assertIs(api.session, other.session)
+        self.assertEqual(api._timeout, 20)
+
+    def test_initiation_with_session(self):
+        session = HEREApi.create_session(pool_connections=2, pool_maxsize=4)
+        routing_api = herepy.RoutingApi(api_key="api_key", session=session)
+        geocoder_api = herepy.GeocoderApi(api_key="api_key", session=session)
+        self.assertIs(routing_api.session, session)
+        self.assertIs(geocoder_api.session, session)
+        adapter = session.get_adapter("https://router.hereapi.com")
+        self.assertEqual(adapter._pool_maxsize, 4)
+
+    def test_create_session_with_adapters(self):
+        custom_adapter = requests.adapters.HTTPAdapter(pool_maxsize=1)
+        session = HEREApi.create_session(
+            adapters={"https://router.hereapi.com": custom_adapter}
+        )
+        self.assertIs(
+            session.get_adapter("https://router.hereapi.com/v8/routes"),
+            custom_adapter,
+        )
+        self.assertIsNot(
+            session.get_adapter("https://geocode.search.hereapi.com"),
+            custom_adapter,
+        )
+
+    @responses.activate
+    def test_request_goes_through_session(self):
+        responses.add(responses.GET, "https://router.hereapi.com/v8/routes", "{}")
+        session = HEREApi.create_session()
+        api = HEREApi(api_key="api_key", timeout=5, session=session)
+        response = api._request("GET", "https://router.hereapi.com/v8/routes")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_location_name_geocoding_shares_session(self):
+        with open("testdata/models/geocoder.json", "r") as f:
+            responses.add(
+                responses.GET,
+                "https://geocode.search.hereapi.com/v1/geocode",
+                f.read(),
+                status=200,
+            )
+        session = HEREApi.create_session()
+        api = herepy.RoutingApi(api_key="api_key", session=session)
+        original_request = session.request
+        calls = []
+
+        def request(*args, **kwargs):
+            calls.append(args)
+            return original_request(*args, **kwargs)
+
+        session.request = request
+        coordinates = api._get_coordinates_for_location_name("Seattle")
+        self.assertEqual(len(coordinates), 2)
+        self.assertEqual(len(calls), 1)
+
+    @responses.activate
+    def test_response_cache(self):
+        with open("testdata/models/geocoder.json", "r") as f:
+            geocoder = responses.add(
+                responses.GET,
+                "https://geocode.search.hereapi.com/v1/geocode",
+                f.read(),
+                status=200,
+            )
+        cache = LRUCache()
+        api = herepy.GeocoderApi(api_key="api_key", cache=cache)
+        other = herepy.GeocoderApi(api_key="other_key", cache=cache)
+        response = api.free_form("Berlin")
+        self.assertEqual(other.free_form("Berlin").as_dict(), response.as_dict())
+        self.assertIsInstance(api.free_form("Berlin"), herepy.GeocoderResponse)
+        self.assertEqual(geocoder.call_count, 1)
+        api.free_form("Rome")
+        self.assertEqual(geocoder.call_count, 2)
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn("api_key", list(cache._entries)[0])
+
+    @responses.activate
+    def test_response_cache_ttls(self):
+        responses.add(
+            responses.GET,
+            "https://geocode.search.hereapi.com/v1/geocode",
+            '{"error": "Unauthorized", "error_description": "Invalid key"}',
+            status=401,
+        )
+        cache = LRUCache()
+        api = herepy.GeocoderApi(api_key="api_key", cache=cache)
+        self.assertEqual(api._cache_ttls["geocoding"], 7 * 24 * 60 * 60)
+        with self.assertRaises(herepy.HEREError):
+            api.free_form("Berlin")
+        self.assertEqual(len(cache), 0)
+
+        api = herepy.GeocoderApi(
+            api_key="api_key", cache=cache, cache_ttls={"geocoding": 0}
+        )
+        self.assertEqual(
+            api._get_cache_entry("GET", "https://here.com", None, "geocoding"),
+            (None, None, None),
+        )
+        key, ttl, cached = api._get_cache_entry(
+            "GET", "https://here.com", None, "traffic"
+        )
+        self.assertEqual(ttl, 30)
+        self.assertIsNone(cached)
+        self.assertEqual(
+            api._get_cache_entry("GET", "https://here.com", None, "routing"),
+            (None, None, None),
+        )
+        api = herepy.RoutingApi("api_key", cache=cache, cache_ttls={"routing": 60})
+        key, ttl, cached = api._get_cache_entry(
+            "GET", "https://here.com", None, "routing"
+        )
+        self.assertEqual(ttl, 60)
+
+    @responses.activate
+    def test_request_is_sent_once_without_retry_policy(self):
+        responses.add(responses.GET, "https://router.hereapi.com/v8/routes", status=503)
+        api = HEREApi(api_key="api_key", session=HEREApi.create_session())
+        response = api._request("GET", "https://router.hereapi.com/v8/routes")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.attempts, 1)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    @patch("herepy.here_api.time.sleep")
+    def test_retry_policy(self, sleep):
+        url = "https://router.hereapi.com/v8/routes"
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, status=429, headers={"Retry-After": "2"})
+        responses.add(responses.GET, url, "{}", status=200)
+        api = HEREApi(
+            api_key="api_key",
+            session=HEREApi.create_session(),
+            retry_policy=RetryPolicy(max_attempts=5),
+        )
+        response = api._request("GET", url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.attempts, 3)
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(sleep.call_count, 2)
+        self.assertEqual(sleep.call_args[0][0], 2)
+
+    @responses.activate
+    @patch("herepy.here_api.time.sleep")
+    def test_retry_policy_gives_up(self, sleep):
+        url = "https://router.hereapi.com/v8/routes"
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.POST, url, status=503)
+        api = HEREApi(
+            api_key="api_key",
+            session=HEREApi.create_session(),
+            retry_policy=RetryPolicy(max_attempts=3),
+        )
+        response = api._request("GET", url)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.attempts, 3)
+        response = api._request("POST", url, json={})
+        self.assertEqual(response.attempts, 1)
+        self.assertEqual(len(responses.calls), 4)
+
+    @responses.activate
+    @patch("herepy.here_api.time.sleep")
+    def test_retry_policy_connection_error(self, sleep):
+        url = "https://router.hereapi.com/v8/routes"
+        responses.add(responses.GET, url, body=requests.ConnectionError("reset"))
+        responses.add(responses.GET, url, "{}", status=200)
+        api = HEREApi(
+            api_key="api_key",
+            session=HEREApi.create_session(),
+            retry_policy=RetryPolicy(),
+        )
+        self.assertEqual(api._request("GET", url).attempts, 2)
+        responses.reset()
+        responses.add(responses.GET, url, body=requests.ConnectionError("reset"))
+        with self.assertRaises(requests.ConnectionError):
+            api._request("GET", url)
+        self.assertEqual(len(responses.calls), 3)
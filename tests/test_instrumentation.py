@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+
+import http.server
+import threading
+import unittest
+from unittest.mock import patch
+
+import requests
+import responses
+
+import herepy
+from herepy.cache import LRUCache
+from herepy.here_api import HEREApi
+from herepy.instrumentation import Instrumentation, InstrumentedHTTPAdapter
+from herepy.retry import RetryPolicy
+from herepy.utils import Utils
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = b'{"items": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self):
+        self.before = []
+        self.after = []
+        self.instrumentation = Instrumentation(
+            before=[self.before.append], after=[self.after.append]
+        )
+
+    def test_redact_url(self):
+        self.assertEqual(
+            Utils.redact_url("https://here.com/v1?q=Berlin&apiKey=secret"),
+            "https://here.com/v1?q=Berlin&apiKey=REDACTED",
+        )
+        self.assertEqual(Utils.redact_url("https://here.com/v1"), "https://here.com/v1")
+
+    def test_create_session_is_instrumented(self):
+        session = HEREApi.create_session()
+        self.assertIsInstance(session.get_adapter("https://"), InstrumentedHTTPAdapter)
+
+    @responses.activate
+    def test_events(self):
+        with open("testdata/models/geocoder.json", "rb") as f:
+            body = f.read()
+        responses.add(
+            responses.GET, "https://geocode.search.hereapi.com/v1/geocode", body
+        )
+        api = herepy.GeocoderApi(
+            api_key="api_key",
+            session=HEREApi.create_session(),
+            cache=LRUCache(),
+            instrumentation=self.instrumentation,
+        )
+        self.assertIs(api.instrumentation, self.instrumentation)
+        api.free_form("Berlin")
+        api.free_form("Berlin")
+        self.assertEqual(len(self.before), 2)
+        self.assertEqual(self.before, self.after)
+        miss, hit = self.after
+        self.assertEqual(miss.service, "geocoding")
+        self.assertEqual(miss.method, "GET")
+        self.assertIn("apiKey=REDACTED", miss.url)
+        self.assertNotIn("api_key", miss.url)
+        self.assertEqual(miss.status_code, 200)
+        self.assertEqual(miss.bytes_sent, 0)
+        self.assertEqual(miss.bytes_received, len(body))
+        self.assertEqual(miss.attempt, 1)
+        self.assertEqual(miss.cache_status, "miss")
+        self.assertIsNone(miss.error)
+        self.assertIn("ttfb", miss.timings)
+        self.assertGreaterEqual(miss.timings["total"], miss.timings["ttfb"])
+        self.assertEqual(hit.cache_status, "hit")
+        self.assertEqual(hit.attempt, 0)
+        self.assertEqual(hit.bytes_received, len(body))
+
+    @responses.activate
+    @patch("herepy.here_api.time.sleep")
+    def test_retries(self, sleep):
+        url = "https://router.hereapi.com/v8/routes"
+        responses.add(responses.GET, url, body=requests.ConnectionError("reset"))
+        responses.add(responses.GET, url, status=503)
+        responses.add(responses.GET, url, "{}", status=200)
+        api = HEREApi(
+            api_key="api_key",
+            session=HEREApi.create_session(),
+            retry_policy=RetryPolicy(),
+            instrumentation=self.instrumentation,
+        )
+        api._request("GET", url, service="routing")
+        self.assertEqual([event.attempt for event in self.after], [1, 2, 3])
+        self.assertEqual([event.retries for event in self.after], [0, 1, 2])
+        self.assertIsInstance(self.after[0].error, requests.ConnectionError)
+        self.assertIsNone(self.after[0].status_code)
+        self.assertEqual([event.status_code for event in self.after[1:]], [503, 200])
+        self.assertIsNone(self.after[0].cache_status)
+
+    @responses.activate
+    def test_failing_hook(self):
+        url = "https://router.hereapi.com/v8/routes"
+        responses.add(responses.GET, url, "{}", status=200)
+
+        @self.instrumentation.on_after
+        def fail(event):
+            raise ValueError("broken")
+
+        api = HEREApi(
+            api_key="api_key",
+            session=HEREApi.create_session(),
+            instrumentation=self.instrumentation,
+        )
+        with self.assertWarns(RuntimeWarning):
+            response = api._request("GET", url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.after), 1)
+
+    def test_connection_timings(self):
+        server = http.server.HTTPServer(("localhost", 0), _Handler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        session = HEREApi.create_session()
+        self.addCleanup(session.close)
+        url = "http://localhost:{0}/v8/matrix".format(server.server_port)
+        api = HEREApi(
+            api_key="api_key", session=session, instrumentation=self.instrumentation
+        )
+        api._request("POST", url, json={"origins": []})
+        api._request("POST", url, json={"origins": []})
+        first, second = self.after
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.bytes_sent, len(b'{"origins": []}'))
+        self.assertEqual(first.bytes_received, len(b'{"items": []}'))
+        for phase in ("dns", "connect", "ttfb", "total"):
+            self.assertGreaterEqual(first.timings[phase], 0)
+        self.assertNotIn("tls", first.timings)
+        # The second call reuses the connection of the first.
+        self.assertNotIn("dns", second.timings)
+        self.assertIn("ttfb", second.timings)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+import asyncio
+import unittest
+from concurrent.futures import CancelledError, TimeoutError
+
+from herepy.error import HEREError
+from herepy.jobs import Job
+
+
+def check_status(response):
+    if response == "failed":
+        raise HEREError("failed")
+    if response == "running":
+        return None
+    return response
+
+
+class JobTest(unittest.TestCase):
+    def _job(self, statuses, step=0):
+        statuses = iter(statuses)
+        return Job("job_id", lambda: next(statuses), check_status, step=step)
+
+    def test_status(self):
+        job = self._job(["running", "result"])
+        self.assertEqual(job._get_status(), Job.PENDING)
+        self.assertEqual(job.status(), Job.RUNNING)
+        self.assertFalse(job.done())
+        self.assertEqual(job.status(), Job.COMPLETED)
+        self.assertTrue(job.done())
+        self.assertEqual(job.status(), Job.COMPLETED)
+
+    def test_wait(self):
+        job = self._job(["running", "running", "result"])
+        self.assertEqual(job.wait(), "result")
+        self.assertEqual(job.wait(), "result")
+
+    def test_wait_failed(self):
+        job = self._job(["running", "failed"])
+        with self.assertRaises(HEREError):
+            job.wait()
+        self.assertEqual(job.status(), Job.FAILED)
+
+    def test_wait_timeout(self):
+        job = Job("job_id", lambda: "running", check_status, step=0.01)
+        with self.assertRaises(TimeoutError):
+            job.wait(timeout=0.05)
+        self.assertEqual(job.status(), Job.RUNNING)
+
+    def test_backoff(self):
+        job = Job("job_id", lambda: "running", check_status, step=1, max_step=3)
+        self.assertEqual([job._next_step() for _ in range(5)], [1, 1.5, 2.25, 3, 3])
+
+    def test_cancel(self):
+        job = self._job(["running", "result"])
+        job.poll()
+        callbacks = []
+        job.add_done_callback(callbacks.append)
+        self.assertTrue(job.cancel())
+        self.assertEqual(job.status(), Job.CANCELLED)
+        self.assertEqual(callbacks, [job])
+        with self.assertRaises(CancelledError):
+            job.wait()
+
+    def test_cancel_completed(self):
+        job = self._job(["result"])
+        job.wait()
+        self.assertFalse(job.cancel())
+        self.assertEqual(job.status(), Job.COMPLETED)
+
+    def test_await(self):
+        job = self._job(["running", "result"])
+        self.assertEqual(asyncio.run(self._await(job)), "result")
+
+    def test_await_coroutine_status(self):
+        statuses = iter(["running", "running", "result"])
+
+        async def request_status():
+            return next(statuses)
+
+        job = Job("job_id", request_status, check_status, step=0)
+        self.assertEqual(asyncio.run(self._await(job)), "result")
+
+    def test_async_job(self):
+        statuses = iter(["running", "running", "result"])
+
+        async def request_status():
+            return next(statuses)
+
+        async def drive(job):
+            with self.assertRaises(HEREError):
+                job.poll()
+            with self.assertRaises(HEREError):
+                job.status()
+            with self.assertRaises(HEREError):
+                job.wait()
+            self.assertEqual(await job.status_async(), Job.RUNNING)
+            with self.assertRaises(TimeoutError):
+                await job.wait_async(timeout=0)
+            return await job.wait_async()
+
+        job = Job("job_id", request_status, check_status, step=0)
+        self.assertEqual(asyncio.run(drive(job)), "result")
+        self.assertEqual(job.status(), Job.COMPLETED)
+
+    def test_status_async_of_sync_job(self):
+        job = self._job(["running", "failed"])
+
+        async def drive():
+            self.assertEqual(await job.status_async(), Job.RUNNING)
+            self.assertEqual(await job.status_async(), Job.FAILED)
+            with self.assertRaises(HEREError):
+                await job.wait_async()
+
+        asyncio.run(drive())
+
+    @staticmethod
+    async def _await(job):
+        return await job
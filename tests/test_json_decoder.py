@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+
+import importlib.util
+import json
+import unittest
+
+from herepy import HEREError
+from herepy.here_api import HEREApi
+from herepy.json_decoder import DECODERS, get_json_decoder
+
+
+class JsonDecoderTest(unittest.TestCase):
+    def test_default_decoder(self):
+        loads = get_json_decoder()
+        self.assertEqual(loads(b'{"a": [1, 2.5, "\\u00e9"]}'), {"a": [1, 2.5, "é"]})
+        with self.assertRaises(ValueError):
+            loads(b"\\x89PNG")
+
+    def test_decoder_by_name(self):
+        self.assertIs(get_json_decoder("json"), json.loads)
+        for name in DECODERS:
+            if name == "json" or importlib.util.find_spec(name) is not None:
+                self.assertEqual(get_json_decoder(name)(b'{"a": 1}'), {"a": 1})
+            else:
+                with self.assertRaises(HEREError):
+                    get_json_decoder(name)
+        with self.assertRaises(HEREError):
+            get_json_decoder("yaml")
+
+    def test_api_json_decoder(self):
+        self.assertIs(
+            HEREApi(api_key="api_key", json_decoder="json")._json_decoder, json.loads
+        )
+        calls = []
+
+        def loads(data):
+            calls.append(data)
+            return json.loads(data)
+
+        api = HEREApi(api_key="api_key", json_decoder=loads)
+        response = type("Response", (object,), {"content": b'{"items": []}'})
+        self.assertEqual(api._decode_json(response), {"items": []})
+        self.assertEqual(calls, [b'{"items": []}'])
@@ -23,7 +23,7 @@ class MapImageApiTest(unittest.TestCase):
             self._api._base_url, "https://image.maps.ls.hereapi.com/mia/1.6/mapview"
         )
 
-    @patch("herepy.map_image_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_mapimage_with_boundingbox(self, mock_get):
         with open("testdata/images/new-delhi-uncertainty.jpg", "rb") as f:
             mock_get.return_value = Mock(ok=True)
@@ -37,7 +37,7 @@ class MapImageApiTest(unittest.TestCase):
         self.assertIsNotNone(map_image)
         self.assertTrue(isinstance(map_image, bytes))
 
-    @patch("herepy.map_image_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_mapimage_with_coordinates(self, mock_get):
         with open("testdata/images/new-delhi-uncertainty.jpg", "rb") as f:
             mock_get.return_value = Mock(ok=True)
@@ -50,7 +50,7 @@ class MapImageApiTest(unittest.TestCase):
         self.assertIsNotNone(map_image)
         self.assertTrue(isinstance(map_image, bytes))
 
-    @patch("herepy.map_image_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_mapimage_when_fails(self, mock_get):
         mock_get.return_value = Mock(ok=True)
         mock_get.return_value.content = None
@@ -60,7 +60,7 @@ class MapImageApiTest(unittest.TestCase):
         )
         self.assertIsNone(map_image)
 
-    @patch("herepy.map_image_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_mapimage_hybrid_daylight_succeed(self, mock_get):
         with open("testdata/images/new-delhi-uncertainty.jpg", "rb") as f:
             mock_get.return_value = Mock(ok=True)
@@ -72,7 +72,7 @@ class MapImageApiTest(unittest.TestCase):
         self.assertIsNotNone(map_image)
         self.assertTrue(isinstance(map_image, bytes))
 
-    @patch("herepy.map_image_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_mapimage_nodot_succeed(self, mock_get):
         with open("testdata/images/new-delhi-uncertainty.jpg", "rb") as f:
             mock_get.return_value = Mock(ok=True)
@@ -84,7 +84,7 @@ class MapImageApiTest(unittest.TestCase):
         self.assertIsNotNone(map_image)
         self.assertTrue(isinstance(map_image, bytes))
 
-    @patch("herepy.map_image_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_mapimage_city_name(self, mock_get):
         with open("testdata/images/new-delhi-uncertainty.jpg", "rb") as f:
             mock_get.return_value = Mock(ok=True)
@@ -100,7 +100,7 @@ class MapImageApiTest(unittest.TestCase):
         self.assertIsNotNone(map_image)
         self.assertTrue(isinstance(map_image, bytes))
 
-    @patch("herepy.map_image_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_mapimage_country_name(self, mock_get):
         with open("testdata/images/new-delhi-uncertainty.jpg", "rb") as f:
             mock_get.return_value = Mock(ok=True)
@@ -112,7 +112,7 @@ class MapImageApiTest(unittest.TestCase):
         self.assertIsNotNone(map_image)
         self.assertTrue(isinstance(map_image, bytes))
 
-    @patch("herepy.map_image_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_mapimage_country_name_and_center(self, mock_get):
         with open("testdata/images/new-delhi-uncertainty.jpg", "rb") as f:
             mock_get.return_value = Mock(ok=True)
@@ -127,7 +127,7 @@ class MapImageApiTest(unittest.TestCase):
         self.assertIsNotNone(map_image)
         self.assertTrue(isinstance(map_image, bytes))
 
-    @patch("herepy.map_image_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_mapimage_encoded_geo_coordinate(self, mock_get):
         with open("testdata/images/new-delhi-uncertainty.jpg", "rb") as f:
             mock_get.return_value = Mock(ok=True)
@@ -139,7 +139,7 @@ class MapImageApiTest(unittest.TestCase):
         self.assertIsNotNone(map_image)
         self.assertTrue(isinstance(map_image, bytes))
 
-    @patch("herepy.map_image_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_mapimage_label_languages(self, mock_get):
         with open("testdata/images/new-delhi-uncertainty.jpg", "rb") as f:
             mock_get.return_value = Mock(ok=True)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+import gzip
+import json
+import unittest
+from array import array
+
+from herepy import HEREError
+from herepy.matrix_result import Decompressor, MatrixResultParser
+
+
+class MatrixResultParserTest(unittest.TestCase):
+    DOCUMENT = {
+        "matrixId": "matrixId",
+        "matrix": {
+            "numOrigins": 3,
+            "numDestinations": 4,
+            "travelTimes": [0, 12, 123456, None, 7, 0, 99, 1000, 5, 6, 7, 8],
+            "distances": [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11],
+            "errorCodes": [0, 0, 0, 3, 0, 0, 0, 0, 0, 0, 0, 1],
+        },
+        "regionDefinition": {"type": "world"},
+    }
+
+    def _parse(self, body, chunk_size):
+        parser = MatrixResultParser()
+        for i in range(0, len(body), chunk_size):
+            parser.feed(body[i : i + chunk_size])
+        return parser.close()
+
+    def test_parse_in_chunks(self):
+        body = json.dumps(self.DOCUMENT, indent=2).encode()
+        for chunk_size in (1, 2, 3, 7, 64, len(body)):
+            data = self._parse(body, chunk_size)
+            self.assertEqual(data["matrixId"], "matrixId")
+            self.assertEqual(data["regionDefinition"], {"type": "world"})
+            matrix = data["matrix"]
+            self.assertEqual(matrix["numOrigins"], 3)
+            self.assertEqual(matrix["travelTimes"].typecode, "i")
+            self.assertEqual(
+                list(matrix["travelTimes"]),
+                [0, 12, 123456, 0, 7, 0, 99, 1000, 5, 6, 7, 8],
+            )
+            self.assertEqual(matrix["distances"], array("i", range(12)))
+            self.assertEqual(matrix["errorCodes"].typecode, "b")
+            self.assertEqual(matrix["errorCodes"][3], 3)
+
+    def test_parse_empty_lists(self):
+        body = b'{"matrix": {"numOrigins": 0, "travelTimes": []}}'
+        data = self._parse(body, 5)
+        self.assertEqual(data["matrix"]["travelTimes"], array("i"))
+
+    def test_incomplete(self):
+        body = json.dumps(self.DOCUMENT).encode()
+        parser = MatrixResultParser()
+        parser.feed(body[: body.index(b"123456")])
+        with self.assertRaises(HEREError):
+            parser.close()
+        parser = MatrixResultParser()
+        parser.feed(body[:-1])
+        with self.assertRaises(HEREError):
+            parser.close()
+
+    def test_invalid(self):
+        parser = MatrixResultParser()
+        with self.assertRaises(HEREError):
+            parser.feed(b'{"matrix": {"travelTimes": [1, "a"]}}')
+        parser = MatrixResultParser()
+        parser.feed(b'{"error": "failed"}')
+        with self.assertRaises(HEREError):
+            parser.close()
+
+
+class DecompressorTest(unittest.TestCase):
+    def test_gzip(self):
+        body = json.dumps(MatrixResultParserTest.DOCUMENT).encode()
+        compressed = gzip.compress(body)
+        decompressor = Decompressor()
+        data = b"".join(
+            decompressor.decompress(compressed[i : i + 10])
+            for i in range(0, len(compressed), 10)
+        )
+        self.assertEqual(data + decompressor.flush(), body)
+
+    def test_passthrough(self):
+        decompressor = Decompressor()
+        self.assertEqual(decompressor.decompress(b"{}"), b"{}")
+        self.assertEqual(decompressor.flush(), b"")
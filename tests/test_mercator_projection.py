@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 
+import random
 import unittest
 
-from herepy import MercatorProjection
+from herepy import HEREError, MercatorProjection
+from herepy.mercator_projection import numpy
 
 
 class MercatorProjectionTest(unittest.TestCase):
@@ -12,3 +14,111 @@ class MercatorProjectionTest(unittest.TestCase):
         )
         self.assertEqual(column, 2200)
         self.assertEqual(row, 1343)
+
+    def test_get_tiles_in_bbox(self):
+        tiles = list(
+            MercatorProjection.get_tiles_in_bbox([52.6, 13.2], [52.4, 13.6], zoom=12)
+        )
+        self.assertEqual(len(tiles), 5 * 5)
+        self.assertEqual(tiles[0], (2198, 1341))
+        self.assertEqual(tiles[-1], (2202, 1345))
+        self.assertIn((2200, 1343), tiles)
+
+    def test_get_tiles_in_bbox_of_the_world(self):
+        tiles = list(MercatorProjection.get_tiles_in_bbox([90, -180], [-90, 180], 1))
+        self.assertEqual(tiles, [(0, 0), (1, 0), (0, 1), (1, 1)])
+
+    def test_get_tiles_in_bbox_across_the_antimeridian(self):
+        tiles = list(MercatorProjection.get_tiles_in_bbox([52.6, 179], [52.4, -179], 3))
+        self.assertEqual(tiles, [(7, 2), (0, 2)])
+
+    def test_get_columns_rows(self):
+        rng = random.Random(0)
+        points = [(rng.uniform(-85, 85), rng.uniform(-180, 180)) for _ in range(500)]
+        latitudes, longitudes = zip(*points)
+        expected = [
+            MercatorProjection.get_column_row(latitude, longitude, 14)
+            for latitude, longitude in points
+        ]
+        columns, rows = MercatorProjection.get_columns_rows(
+            latitudes, longitudes, 14, use_numpy=False
+        )
+        self.assertEqual(list(zip(columns, rows)), expected)
+
+    def test_get_columns_rows_clamps_to_the_grid(self):
+        columns, rows = MercatorProjection.get_columns_rows(
+            [90, -90], [180, -180], 2, use_numpy=False
+        )
+        self.assertEqual(list(columns), [3, 0])
+        self.assertEqual(list(rows), [0, 3])
+        with self.assertRaises(HEREError):
+            MercatorProjection.get_columns_rows([0, 1], [0], 2)
+
+    def test_get_pixels_in_tiles(self):
+        columns, rows, pixel_xs, pixel_ys = MercatorProjection.get_pixels_in_tiles(
+            [52.525439], [13.38727], 12, tile_size=512, use_numpy=False
+        )
+        self.assertEqual((columns[0], rows[0]), (2200, 1343))
+        self.assertEqual((pixel_xs[0], pixel_ys[0]), (162, 103))
+
+    def test_get_tile_bounds(self):
+        north, west, south, east = MercatorProjection.get_tile_bounds(
+            [0, 1], [0, 1], 1, use_numpy=False
+        )
+        self.assertAlmostEqual(north[0], MercatorProjection.MAX_LATITUDE)
+        self.assertEqual((west[0], south[0], east[0]), (-180, 0, 0))
+        self.assertEqual((north[1], west[1], east[1]), (0, 0, 180))
+        self.assertAlmostEqual(south[1], -MercatorProjection.MAX_LATITUDE)
+        self.assertEqual(
+            MercatorProjection.get_column_row(
+                (north[1] + south[1]) / 2, (west[1] + east[1]) / 2, 1
+            ),
+            (1, 1),
+        )
+
+    def test_quadkeys(self):
+        quadkeys = MercatorProjection.get_quadkeys(
+            [2200, 3], [1343, 5], 12, use_numpy=False
+        )
+        self.assertEqual(quadkeys, ["120210233222", "000000000213"])
+        columns, rows, zooms = MercatorProjection.get_tiles_from_quadkeys(
+            quadkeys + ["213"], use_numpy=False
+        )
+        self.assertEqual(list(columns), [2200, 3, 3])
+        self.assertEqual(list(rows), [1343, 5, 5])
+        self.assertEqual(list(zooms), [12, 12, 3])
+        with self.assertRaises(HEREError):
+            MercatorProjection.get_tiles_from_quadkeys(["124"], use_numpy=False)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_matches_pure_python(self):
+        rng = random.Random(0)
+        latitudes = [rng.uniform(-89, 89) for _ in range(1000)] + [90, -90]
+        longitudes = [rng.uniform(-180, 180) for _ in range(1000)] + [180, -180]
+        for zoom in (1, 12, 20):
+            pixels = MercatorProjection.get_pixels_in_tiles(
+                latitudes, longitudes, zoom, use_numpy=True
+            )
+            expected = MercatorProjection.get_pixels_in_tiles(
+                latitudes, longitudes, zoom, use_numpy=False
+            )
+            for values, expected_values in zip(pixels, expected):
+                self.assertEqual(values.tolist(), list(expected_values))
+            columns, rows = pixels[:2]
+            bounds = MercatorProjection.get_tile_bounds(columns, rows, zoom)
+            expected = MercatorProjection.get_tile_bounds(
+                columns, rows, zoom, use_numpy=False
+            )
+            for values, expected_values in zip(bounds, expected):
+                numpy.testing.assert_allclose(values, expected_values)
+            quadkeys = MercatorProjection.get_quadkeys(columns, rows, zoom)
+            self.assertEqual(
+                quadkeys.tolist(),
+                MercatorProjection.get_quadkeys(columns, rows, zoom, use_numpy=False),
+            )
+            decoded = MercatorProjection.get_tiles_from_quadkeys(quadkeys)
+            self.assertEqual(decoded[0].tolist(), columns.tolist())
+            self.assertEqual(decoded[1].tolist(), rows.tolist())
+            self.assertEqual(set(decoded[2].tolist()), {zoom})
+        with self.assertRaises(HEREError):
+            MercatorProjection.get_tiles_from_quadkeys(["12", "4"])
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 
 import json
+import math
+import pickle
 import re
 import unittest
 
@@ -42,6 +44,44 @@ class ModelsTest(unittest.TestCase):
     with open("testdata/models/isoline_routing_distance_response.json", "rb") as f:
         ISOLINE_ROUTING_DISTANCE_JSON = json.loads(f.read().decode("utf8"))
 
+    ROUTE_V8_JSON = {
+        "routes": [
+            {
+                "id": "route",
+                "sections": [
+                    {
+                        "id": "first",
+                        "type": "vehicle",
+                        "summary": {
+                            "duration": 100,
+                            "length": 1000,
+                            "baseDuration": 80,
+                            "tolls": {"total": {"value": 2.5, "currency": "EUR"}},
+                        },
+                        "actions": [
+                            {"action": "depart", "duration": 40, "offset": 0},
+                            {"action": "turn", "direction": "left", "offset": 2},
+                        ],
+                        "spans": [
+                            {"offset": 0, "length": 400, "speedLimit": 13.9},
+                            {
+                                "offset": 2,
+                                "length": 600,
+                                "dynamicSpeedInfo": {"trafficSpeed": 10.5},
+                            },
+                        ],
+                    },
+                    {
+                        "id": "second",
+                        "type": "vehicle",
+                        "travelSummary": {"duration": 50, "length": 300},
+                        "spans": [{"offset": 0, "length": 300, "speedLimit": 8.3}],
+                    },
+                ],
+            }
+        ]
+    }
+
     def test_geocoder_response(self):
         geocoderResponse = herepy.GeocoderResponse.new_from_jsondict(
             self.GEOCODER_SAMPLE_JSON
@@ -175,3 +215,153 @@ class ModelsTest(unittest.TestCase):
         self.assertIsNotNone(isolineRoutingDistanceResponse.as_dict())
         self.assertIsNotNone(isolineRoutingDistanceResponse.as_dict()["departure"])
         self.assertTrue(len(isolineRoutingDistanceResponse.as_dict()["isolines"]) > 0)
+
+    def test_model_wraps_json_dict(self):
+        routingResponse = herepy.RoutingResponseV8.new_from_jsondict(
+            self.ROUTING_SAMPLE_JSON
+        )
+        self.assertIs(routingResponse._json, self.ROUTING_SAMPLE_JSON)
+        self.assertFalse(hasattr(routingResponse, "__dict__"))
+        self.assertIs(routingResponse.routes, self.ROUTING_SAMPLE_JSON.get("routes"))
+        with self.assertRaises(AttributeError):
+            routingResponse.unknown
+
+    def test_model_assigned_attributes(self):
+        routingResponse = herepy.RoutingResponse.new_from_jsondict(
+            self.ROUTING_SAMPLE_JSON
+        )
+        self.assertIsNone(routingResponse.route_short)
+        routingResponse.route_short = "A; B"
+        self.assertEqual(routingResponse.route_short, "A; B")
+        self.assertEqual(routingResponse.as_dict()["route_short"], "A; B")
+        self.assertNotIn("route_short", self.ROUTING_SAMPLE_JSON)
+        routingResponse.route_short = herepy.GeocoderResponse(items=[1])
+        self.assertEqual(routingResponse.as_dict()["route_short"], {"items": [1]})
+
+    def test_model_mutable_defaults(self):
+        first = herepy.RmeResponse.new_from_jsondict({})
+        second = herepy.RmeResponse.new_from_jsondict({})
+        first.Warnings.append("warning")
+        self.assertEqual(first.Warnings, ["warning"])
+        self.assertEqual(second.Warnings, [])
+        self.assertEqual(herepy.RmeResponse.param_defaults["Warnings"], [])
+
+    def test_model_param_defaults(self):
+        trafficFlowResponse = herepy.TrafficFlowResponse.new_from_jsondict(
+            {"RWS": [], "UNITS": "metric"}, param_defaults={"UNITS": None}
+        )
+        self.assertEqual(trafficFlowResponse.UNITS, "metric")
+        self.assertEqual(trafficFlowResponse.as_dict(), {"RWS": [], "UNITS": "metric"})
+        self.assertNotIn("UNITS", herepy.TrafficFlowResponse.param_defaults)
+        destinationWeatherResponse = herepy.DestinationWeatherResponse(
+            {"observations": None}, observations={"location": []}
+        )
+        self.assertEqual(destinationWeatherResponse.observations, {"location": []})
+
+    def test_model_pickle(self):
+        geocoderResponse = herepy.GeocoderResponse.new_from_jsondict(
+            self.GEOCODER_SAMPLE_JSON
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(geocoderResponse)), geocoderResponse)
+
+    def test_route_v8_typed_routes(self):
+        response = herepy.RoutingResponseV8.new_from_jsondict(self.ROUTE_V8_JSON)
+        routes = response.get_routes()
+        self.assertEqual(len(routes), 1)
+        route = routes[0]
+        self.assertIsInstance(route, herepy.Route)
+        self.assertEqual(route.id, "route")
+        self.assertEqual(route.duration, 150)
+        self.assertEqual(route.length, 1300)
+        self.assertEqual(route.base_duration, 80)
+        self.assertEqual(route.toll_total, 2.5)
+        first, second = route.get_sections()
+        self.assertIsInstance(first, herepy.Section)
+        self.assertEqual(first.duration, 100)
+        self.assertEqual(first.base_duration, 80)
+        self.assertIsNone(first.typical_duration)
+        self.assertEqual(second.length, 300)
+        self.assertIsNone(second.toll_total)
+        actions = first.get_actions()
+        self.assertIsInstance(actions[0], herepy.Action)
+        self.assertEqual([action.action for action in actions], ["depart", "turn"])
+        self.assertEqual(actions[1].direction, "left")
+        self.assertEqual(second.get_actions(), [])
+
+    def test_route_v8_span_columns(self):
+        response = herepy.RoutingResponseV8.new_from_jsondict(self.ROUTE_V8_JSON)
+        spans = response.get_spans()
+        self.assertEqual(len(spans), 3)
+        self.assertEqual(list(spans.section_indices), [0, 0, 1])
+        self.assertEqual(list(spans.offsets), [0, 2, 0])
+        lengths = spans.column("length", use_numpy=False)
+        self.assertEqual(list(lengths), [400, 600, 300])
+        self.assertIs(spans.column("length", use_numpy=False), lengths)
+        speed_limits = spans.column("speedLimit", use_numpy=False)
+        self.assertEqual(speed_limits[0], 13.9)
+        self.assertTrue(math.isnan(speed_limits[1]))
+        traffic_speeds = spans.column(
+            "dynamicSpeedInfo.trafficSpeed", default=0, use_numpy=False
+        )
+        self.assertEqual(list(traffic_speeds), [0, 10.5, 0])
+        self.assertEqual(spans.column("length").sum(), 1300)
+        with self.assertRaises(ValueError):
+            spans.column("length")[0] = 0
+        self.assertEqual(spans.column("length").sum(), 1300)
+        self.assertEqual(spans[1].length, 600)
+        self.assertIsInstance(spans[1], herepy.Span)
+        self.assertEqual([span.offset for span in spans[1:]], [2, 0])
+        with self.assertRaises(herepy.HEREError):
+            spans.column("speedLimit", typecode="i")
+        section_spans = response.get_routes()[0].get_sections()[1].get_spans()
+        self.assertEqual(list(section_spans.section_indices), [0])
+
+    def test_route_v8_sample_response(self):
+        with open("testdata/models/routing_v8_response.json", "rb") as f:
+            response = herepy.RoutingResponseV8.new_from_jsondict(json.load(f))
+        section = response.get_routes()[0].get_sections()[0]
+        self.assertEqual(section.transport, {"mode": "car"})
+        self.assertEqual(len(section.decode_polyline(use_numpy=False)) % 2, 0)
+        self.assertEqual(list(section.get_spans().offsets), [0, 43])
+
+    def test_routing_matrix_arrays(self):
+        response = herepy.RoutingMatrixResponse.new_from_jsondict(
+            {
+                "matrix": {
+                    "numOrigins": 2,
+                    "numDestinations": 3,
+                    "travelTimes": [0, 10, 20, 30, None, 50],
+                    "distances": [0, 100, 200, 300, 0, 500],
+                    "errorCodes": [0, 0, 0, 0, 3, 0],
+                }
+            }
+        )
+        self.assertEqual(response.shape, (2, 3))
+        travel_times = response.get_travel_times()
+        self.assertEqual(travel_times.shape, (2, 3))
+        self.assertEqual(travel_times.dtype.itemsize, 4)
+        self.assertEqual(travel_times[1, 2], 50)
+        self.assertEqual(travel_times[1, 1], 0)
+        self.assertFalse(travel_times.flags.writeable)
+        with self.assertRaises(ValueError):
+            travel_times[0, 0] = 1
+        self.assertEqual(response.get_distances()[0].tolist(), [0, 100, 200])
+        mask = response.get_error_mask()
+        self.assertEqual(mask.tolist(), [[False] * 3, [False, True, False]])
+        self.assertEqual(response.get_error_codes()[1, 1], 3)
+        flat = response.get_travel_times(use_numpy=False)
+        self.assertEqual(flat.typecode, "i")
+        self.assertEqual(flat[1 * 3 + 2], 50)
+        self.assertEqual(
+            list(response.get_error_mask(use_numpy=False)), [0] * 4 + [1, 0]
+        )
+
+    def test_routing_matrix_arrays_without_errors(self):
+        with open("testdata/models/routing_async_matrix_completed.json", "rb") as f:
+            response = herepy.RoutingMatrixResponse.new_from_jsondict(json.load(f))
+        self.assertEqual(response.get_travel_times().tolist(), [[290]])
+        self.assertFalse(response.get_error_mask().any())
+        self.assertEqual(list(response.get_distances(use_numpy=False)), [0])
+        response.matrix["travelTimes"].append(1)
+        with self.assertRaises(herepy.HEREError):
+            response.get_travel_times()
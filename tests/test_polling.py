@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+import threading
+import unittest
+from concurrent.futures import CancelledError, TimeoutError
+
+import requests
+
+from herepy.error import HEREError
+from herepy.jobs import Job
+from herepy.polling import Poller, step_jitter
+
+
+def check_status(response):
+    if response == "failed":
+        raise HEREError("failed")
+    if response == "running":
+        return None
+    return response
+
+
+class PollerTest(unittest.TestCase):
+    def setUp(self):
+        self._poller = Poller()
+
+    def tearDown(self):
+        self._poller.close()
+
+    def test_step_jitter(self):
+        steps = [step_jitter(10, 0.2) for _ in range(100)]
+        self.assertTrue(all(8 <= step <= 12 for step in steps))
+
+    def test_polls_many_jobs_on_one_thread(self):
+        threads = set()
+
+        def job(index):
+            statuses = iter(["running"] * (index % 3) + [index])
+
+            def request_status():
+                threads.add(threading.current_thread().name)
+                return next(statuses)
+
+            return Job(index, request_status, check_status, step=0.001)
+
+        jobs = [self._poller.add(job(index)) for index in range(50)]
+        self.assertEqual([job.wait(timeout=5) for job in jobs], list(range(50)))
+        self.assertEqual(threads, {"herepy-poller"})
+        self.assertEqual(len(self._poller), 0)
+        self.assertEqual(jobs[0].status(), Job.COMPLETED)
+
+    def test_failed_job(self):
+        job = self._poller.add(Job("id", lambda: "failed", check_status, step=0))
+        with self.assertRaises(HEREError):
+            job.wait(timeout=5)
+        self.assertEqual(job.status(), Job.FAILED)
+
+    def test_deadline(self):
+        job = self._poller.add(
+            Job("id", lambda: "running", check_status, step=0.01), timeout=0.05
+        )
+        with self.assertRaises(TimeoutError):
+            job.wait(timeout=5)
+        self.assertEqual(job.status(), Job.FAILED)
+
+    def test_transport_errors_are_retried(self):
+        statuses = iter([requests.ConnectionError(), "running", "result"])
+
+        def request_status():
+            status = next(statuses)
+            if isinstance(status, Exception):
+                raise status
+            return status
+
+        job = self._poller.add(Job("id", request_status, check_status, step=0))
+        self.assertEqual(job.wait(timeout=5), "result")
+
+    def test_close_cancels_jobs(self):
+        job = self._poller.add(Job("id", lambda: "running", check_status, step=10))
+        self._poller.close()
+        with self.assertRaises(CancelledError):
+            job.wait(timeout=5)
+        with self.assertRaises(HEREError):
+            self._poller.add(Job("id", lambda: "running", check_status))
+
+    def test_rejects_coroutine_jobs(self):
+        async def request_status():
+            return "result"
+
+        with self.assertRaises(HEREError):
+            self._poller.add(Job("id", request_status, check_status))
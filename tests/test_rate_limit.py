@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import responses
+
+import herepy
+from herepy.here_api import HEREApi
+from herepy.rate_limit import RateLimiter, TokenBucket
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.01)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, delta=0.01)
+
+    def test_refills_up_to_burst(self):
+        bucket = TokenBucket(rate=1000, burst=1)
+        bucket.reserve()
+        time.sleep(0.01)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertGreater(bucket.reserve(), 0)
+
+    def test_default_burst(self):
+        self.assertEqual(TokenBucket(rate=5).burst, 5)
+        self.assertEqual(TokenBucket(rate=0.5).burst, 1)
+
+    def test_shared_across_threads(self):
+        bucket = TokenBucket(rate=200, burst=1)
+        started_at = time.monotonic()
+        threads = [
+            threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertGreaterEqual(time.monotonic() - started_at, 19 / 200.0)
+
+    def test_acquire_async(self):
+        bucket = TokenBucket(rate=10, burst=1)
+
+        async def acquire():
+            with patch("herepy.rate_limit.asyncio.sleep", AsyncMock()) as sleep:
+                self.assertEqual(await bucket.acquire_async(), 0)
+                self.assertGreater(await bucket.acquire_async(), 0)
+            return sleep.call_count
+
+        self.assertEqual(asyncio.run(acquire()), 1)
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_buckets_per_service(self):
+        limiter = RateLimiter({"routing": 10, "geocoding": 5})
+        self.assertEqual(limiter.get_bucket("routing").rate, 10)
+        self.assertIs(limiter.get_bucket("routing"), limiter.get_bucket("routing"))
+        self.assertEqual(limiter.get_bucket("geocoding").rate, 5)
+        self.assertIsNone(limiter.get_bucket("tiles"))
+        self.assertEqual(limiter.acquire("tiles"), 0)
+        self.assertEqual(RateLimiter({}, default_rate=3).get_bucket("tiles").rate, 3)
+
+    def test_bursts(self):
+        limiter = RateLimiter({"matrix": 1}, bursts={"matrix": 4})
+        self.assertEqual(limiter.get_bucket("matrix").burst, 4)
+
+    def test_shared_per_key(self):
+        limiter = RateLimiter.shared("rate_limit_test_key", {"routing": 10})
+        self.assertIs(RateLimiter.shared("rate_limit_test_key"), limiter)
+        self.assertIsNot(RateLimiter.shared("rate_limit_other_key"), limiter)
+
+    @responses.activate
+    def test_consulted_per_service(self):
+        with open("testdata/models/geocoder.json", "r") as f:
+            responses.add(
+                responses.GET,
+                "https://geocode.search.hereapi.com/v1/geocode",
+                f.read(),
+                status=200,
+            )
+        limiter = RateLimiter({"geocoding": 1000})
+        api = herepy.GeocoderApi(
+            api_key="api_key", session=HEREApi.create_session(), rate_limiter=limiter
+        )
+        with patch.object(limiter, "acquire", wraps=limiter.acquire) as acquire:
+            api.free_form("200 S Mathilda Sunnyvale CA")
+        acquire.assert_called_once_with("geocoding")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+import email.utils
+import time
+import unittest
+
+from herepy.retry import RetryPolicy
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def test_retries_idempotent_methods_only(self):
+        policy = RetryPolicy()
+        self.assertIsNotNone(policy.get_retry_delay("GET", 1, 0, 503))
+        self.assertIsNotNone(policy.get_retry_delay("get", 1, 0))
+        self.assertIsNone(policy.get_retry_delay("POST", 1, 0, 503))
+        self.assertIsNotNone(
+            RetryPolicy(methods=["GET", "POST"]).get_retry_delay("POST", 1, 0, 503)
+        )
+
+    def test_retries_listed_status_codes_only(self):
+        policy = RetryPolicy()
+        for status_code in (429, 500, 502, 503, 504):
+            self.assertIsNotNone(policy.get_retry_delay("GET", 1, 0, status_code))
+        for status_code in (200, 400, 401, 404):
+            self.assertIsNone(policy.get_retry_delay("GET", 1, 0, status_code))
+
+    def test_stops_after_max_attempts(self):
+        policy = RetryPolicy(max_attempts=3)
+        self.assertIsNotNone(policy.get_retry_delay("GET", 2, 0, 503))
+        self.assertIsNone(policy.get_retry_delay("GET", 3, 0, 503))
+
+    def test_exponential_backoff_with_jitter(self):
+        policy = RetryPolicy(max_attempts=10, backoff_factor=1, max_backoff=5)
+        for _ in range(100):
+            self.assertLessEqual(policy.get_backoff(1), 1)
+            self.assertLessEqual(policy.get_backoff(2), 2)
+            self.assertLessEqual(policy.get_backoff(8), 5)
+        delays = set(policy.get_backoff(3) for _ in range(20))
+        self.assertGreater(len(delays), 1)
+
+    def test_retry_after(self):
+        policy = RetryPolicy(max_elapsed=None)
+        self.assertEqual(
+            policy.get_retry_delay("GET", 1, 0, 429, {"Retry-After": "7"}), 7
+        )
+        date = email.utils.formatdate(time.time() + 30, usegmt=True)
+        delay = policy.get_retry_delay("GET", 1, 0, 503, {"Retry-After": date})
+        self.assertAlmostEqual(delay, 30, delta=2)
+        self.assertIsNone(RetryPolicy.parse_retry_after("soon"))
+        self.assertLessEqual(
+            RetryPolicy(respect_retry_after=False).get_retry_delay(
+                "GET", 1, 0, 429, {"Retry-After": "7"}
+            ),
+            0.5,
+        )
+
+    def test_stops_after_max_elapsed(self):
+        policy = RetryPolicy(max_elapsed=10)
+        self.assertIsNotNone(policy.get_retry_delay("GET", 1, 5, 429))
+        self.assertIsNone(policy.get_retry_delay("GET", 1, 11, 429))
+        self.assertIsNone(
+            policy.get_retry_delay("GET", 1, 5, 429, {"Retry-After": "6"})
+        )
@@ -2,7 +2,13 @@
 
 import codecs
 import datetime
+import gzip
+import io
+import json
+import threading
 import unittest
+from array import array
+
 import pytest
 
 import responses
@@ -786,6 +792,81 @@ class RoutingApiTest(unittest.TestCase):
         self.assertTrue(response)
         self.assertIsInstance(response, herepy.RoutingMatrixResponse)
 
+    @responses.activate
+    def test_sync_matrix_geocodes_each_name_once(self):
+        with codecs.open(
+            "testdata/models/routing_matrix_multiple_starts.json",
+            mode="r",
+            encoding="utf-8",
+        ) as f:
+            server_response = f.read()
+        responses.add(
+            responses.POST,
+            "https://matrix.router.hereapi.com/v8/matrix",
+            server_response,
+            status=200,
+        )
+        with open("testdata/models/geocoder.json", "r") as f:
+            geocoder_response = f.read()
+        geocoder = responses.add(
+            responses.GET,
+            "https://geocode.search.hereapi.com/v1/geocode",
+            geocoder_response,
+            status=200,
+        )
+        self._api.sync_matrix(
+            origins=["Seattle", "Kentucky", "Seattle", [9.934574, -84.065544]],
+            destinations=["Kentucky", "Seattle"],
+        )
+        self.assertEqual(geocoder.call_count, 2)
+        request_body = json.loads(responses.calls[-1].request.body)
+        self.assertEqual(request_body["origins"][0], request_body["origins"][2])
+        self.assertEqual(
+            request_body["origins"][3], {"lat": 9.934574, "lng": -84.065544}
+        )
+        self._api.sync_matrix(origins=["Seattle"], destinations=["Kentucky"])
+        self.assertEqual(geocoder.call_count, 2)
+
+    @responses.activate
+    def test_geocoding_shares_transport_options(self):
+        with open("testdata/models/geocoder.json", "r") as f:
+            responses.add(
+                responses.GET,
+                "https://geocode.search.hereapi.com/v1/geocode",
+                f.read(),
+                status=200,
+            )
+        events = []
+        options = dict(
+            retry_policy=herepy.RetryPolicy(),
+            rate_limiter=herepy.RateLimiter({"geocoding": 100}),
+            single_flight=herepy.SingleFlight(),
+            json_decoder=json.loads,
+            instrumentation=herepy.Instrumentation(after=[events.append]),
+        )
+        api = herepy.RoutingApi("api_key", **options)
+        api._get_coordinates_for_location_name("Seattle")
+        self.assertEqual([event.service for event in events], ["geocoding"])
+        geocoder_api = api._geocoder_api
+        self.assertIs(geocoder_api.session, api.session)
+        self.assertIs(geocoder_api._retry_policy, options["retry_policy"])
+        self.assertIs(geocoder_api._rate_limiter, options["rate_limiter"])
+        self.assertIs(geocoder_api._single_flight, options["single_flight"])
+        self.assertIs(geocoder_api._json_decoder, json.loads)
+
+    def test_geocoding_cache_is_pluggable(self):
+        class Cache(object):
+            def get(self, key):
+                return {"Seattle": [47.6, -122.3]}.get(key)
+
+            def set(self, key, value):
+                raise AssertionError("cached coordinates must not be stored")
+
+        api = herepy.RoutingApi("api_key", geocoding_cache=Cache())
+        self.assertEqual(
+            api._get_coordinates_for_location_name("Seattle"), [47.6, -122.3]
+        )
+
     @responses.activate
     def test_sync_matrix_multiple_destinations(self):
         with codecs.open(
@@ -842,6 +923,50 @@ class RoutingApiTest(unittest.TestCase):
         self.assertTrue(response)
         self.assertIsInstance(response, herepy.RoutingMatrixResponse)
 
+    @responses.activate
+    def test_sync_matrix_tiled(self):
+        def callback(request):
+            body = json.loads(request.body)
+            travel_times = [
+                int(origin["lat"]) * 100 + int(destination["lat"])
+                for origin in body["origins"]
+                for destination in body["destinations"]
+            ]
+            matrix = {
+                "numOrigins": len(body["origins"]),
+                "numDestinations": len(body["destinations"]),
+                "travelTimes": travel_times,
+                "errorCodes": [0] * len(travel_times),
+            }
+            return (200, {}, json.dumps({"matrixId": "id", "matrix": matrix}))
+
+        responses.add_callback(
+            responses.POST,
+            "https://matrix.router.hereapi.com/v8/matrix",
+            callback=callback,
+        )
+        origins = [[lat, 0.0] for lat in range(5)]
+        destinations = [[lat, 0.0] for lat in range(3)]
+        response = self._api.sync_matrix(
+            origins=origins,
+            destinations=destinations,
+            max_origins_per_request=2,
+            max_destinations_per_request=2,
+        )
+        self.assertIsInstance(response, herepy.RoutingMatrixResponse)
+        self.assertEqual(len(responses.calls), 6)
+        self.assertEqual(response.matrix["numOrigins"], 5)
+        self.assertEqual(response.matrix["numDestinations"], 3)
+        self.assertEqual(
+            response.matrix["travelTimes"],
+            [
+                origin * 100 + destination
+                for origin in range(5)
+                for destination in range(3)
+            ],
+        )
+        self.assertEqual(response.matrix["errorCodes"], [0] * 15)
+
     @responses.activate
     def test_sync_matrix_bad_request(self):
         with codecs.open(
@@ -866,6 +991,27 @@ class RoutingApiTest(unittest.TestCase):
                 routing_mode=herepy.MatrixRoutingMode.fast,
             )
 
+    @responses.activate
+    def test_sync_matrix_error_names_function(self):
+        responses.add(
+            responses.POST,
+            "https://matrix.router.hereapi.com/v8/matrix",
+            "{}",
+            status=500,
+        )
+        with self.assertRaises(herepy.HEREError) as context:
+            self._api.sync_matrix(
+                origins=[[9.933231, -84.076831]],
+                destinations=[[9.934574, -84.065544]],
+                matrix_type=herepy.MatrixRoutingType.circle,
+                center=[9.933300, -84.066891],
+                radius=10000,
+                routing_mode=herepy.MatrixRoutingMode.fast,
+            )
+        self.assertEqual(
+            str(context.exception), "Error occurred on routing_api sync_matrix"
+        )
+
     @responses.activate
     def test_async_matrix_whensucceed(self):
         with open(
@@ -924,6 +1070,178 @@ class RoutingApiTest(unittest.TestCase):
         self.assertTrue(response)
         self.assertIsInstance(response, herepy.RoutingMatrixResponse)
 
+    @responses.activate
+    def test_submit_async_matrix(self):
+        with open(
+            "testdata/models/routing_async_matrix_calculation.json",
+            mode="r",
+            encoding="utf-8",
+        ) as f:
+            calculation_response = f.read()
+        responses.add(
+            responses.POST,
+            "https://matrix.router.hereapi.com/v8/matrix",
+            calculation_response,
+            status=202,
+        )
+        responses.add(
+            responses.GET, "https://com.com/status", calculation_response, status=200
+        )
+        with open(
+            "testdata/models/routing_async_matrix_completed.json",
+            mode="r",
+            encoding="utf-8",
+        ) as f:
+            responses.add(
+                responses.GET, "https://com.com/status", f.read(), status=200
+            )
+        job = self._api.submit_async_matrix(
+            token="token",
+            origins=[[9.933231, -84.076831]],
+            destinations=[[9.934574, -84.065544]],
+            poll_step=0,
+        )
+        self.assertEqual(job.id, "matrixId")
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(job.status(), herepy.Job.RUNNING)
+        response = job.wait(timeout=5)
+        self.assertIsInstance(response, herepy.RoutingMatrixResponse)
+        self.assertEqual(job.status(), herepy.Job.COMPLETED)
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(
+            responses.calls[1].request.headers["Authorization"], "Bearer token"
+        )
+
+    @responses.activate
+    def test_submit_async_matrix_with_poller(self):
+        with open(
+            "testdata/models/routing_async_matrix_calculation.json",
+            mode="r",
+            encoding="utf-8",
+        ) as f:
+            calculation_response = f.read()
+        responses.add(
+            responses.POST,
+            "https://matrix.router.hereapi.com/v8/matrix",
+            calculation_response,
+            status=202,
+        )
+        with open(
+            "testdata/models/routing_async_matrix_completed.json",
+            mode="r",
+            encoding="utf-8",
+        ) as f:
+            responses.add(
+                responses.GET, "https://com.com/status", f.read(), status=200
+            )
+        with herepy.Poller() as poller:
+            jobs = [
+                self._api.submit_async_matrix(
+                    token="token",
+                    origins=[[9.933231, -84.076831]],
+                    destinations=[[9.934574, -84.065544]],
+                    poller=poller,
+                )
+                for _ in range(3)
+            ]
+            for job in jobs:
+                response = job.wait(timeout=5)
+                self.assertIsInstance(response, herepy.RoutingMatrixResponse)
+        self.assertEqual(len(responses.calls), 6)
+
+    def _add_async_matrix_result(self, body):
+        with open(
+            "testdata/models/routing_async_matrix_calculation.json",
+            mode="r",
+            encoding="utf-8",
+        ) as f:
+            responses.add(
+                responses.POST,
+                "https://matrix.router.hereapi.com/v8/matrix",
+                f.read(),
+                status=202,
+            )
+        responses.add(
+            responses.GET,
+            "https://com.com/status",
+            status=303,
+            headers={"Location": "https://com.com/result"},
+        )
+        responses.add(
+            responses.GET,
+            "https://com.com/result",
+            gzip.compress(body),
+            status=200,
+            content_type="application/octet-stream",
+        )
+
+    @responses.activate
+    def test_async_matrix_streams_result(self):
+        matrix = {
+            "numOrigins": 2,
+            "numDestinations": 2,
+            "travelTimes": [0, 290, 310, None],
+            "distances": [0, 1200, 1300, 0],
+            "errorCodes": [0, 0, 0, 3],
+        }
+        body = json.dumps({"matrixId": "matrixId", "matrix": matrix}).encode()
+        self._add_async_matrix_result(body)
+        response = self._api.async_matrix(
+            token="token",
+            origins=[[9.933231, -84.076831], [9.934574, -84.065544]],
+            destinations=[[9.933231, -84.076831], [9.934574, -84.065544]],
+            poll_step=0,
+        )
+        self.assertIsInstance(response, herepy.RoutingMatrixResponse)
+        self.assertIsInstance(response.matrix["travelTimes"], array)
+        self.assertEqual(
+            list(response.get_travel_times(use_numpy=False)), [0, 290, 310, 0]
+        )
+        self.assertEqual(list(response.get_error_codes(use_numpy=False)), [0, 0, 0, 3])
+        self.assertEqual(len(responses.calls), 3)
+        self.assertEqual(
+            responses.calls[2].request.headers["Authorization"], "Bearer token"
+        )
+        self.assertEqual(
+            json.loads(response.as_json_string())["matrix"]["distances"],
+            [0, 1200, 1300, 0],
+        )
+
+    @responses.activate
+    def test_async_matrix_writes_result_file(self):
+        with open(
+            "testdata/models/routing_async_matrix_completed.json", mode="rb"
+        ) as f:
+            body = f.read()
+        self._add_async_matrix_result(body)
+        result_file = io.BytesIO()
+        response = self._api.async_matrix(
+            token="token",
+            origins=[[9.933231, -84.076831]],
+            destinations=[[9.934574, -84.065544]],
+            poll_step=0,
+            result_file=result_file,
+        )
+        self.assertIs(response, result_file)
+        self.assertEqual(result_file.getvalue(), body)
+
+    def test_check_async_matrix_status_of_downloaded_result(self):
+        result = herepy.routing_api.DownloadedMatrixResult("result.json")
+        self.assertEqual(self._api._check_async_matrix_status(result), "result.json")
+
+    @responses.activate
+    def test_download_matrix_result_error(self):
+        responses.add(
+            responses.GET,
+            "https://com.com/result",
+            json.dumps(
+                {"error": "Unauthorized", "error_description": "Token expired"}
+            ),
+            status=401,
+        )
+        with self.assertRaises(herepy.HEREError):
+            self._api.download_matrix_result("token", "https://com.com/result")
+
     @responses.activate
     def test_departure_as_datetime(self):
         with codecs.open(
@@ -1274,3 +1592,87 @@ class RoutingApiTest(unittest.TestCase):
         )
         original_request = resp.calls[0].request
         self.assertEqual(original_request.headers.get("X-BIP"), "BOP")
+
+    @responses.activate
+    def test_route_v8_batch_keeps_order_and_errors(self):
+        with codecs.open(
+            "testdata/models/routing_v8_response.json", mode="r", encoding="utf-8"
+        ) as f:
+            success_body = f.read()
+        with codecs.open(
+            "testdata/models/routing_v8_error_access_denied.json",
+            mode="r",
+            encoding="utf-8",
+        ) as f:
+            error_body = f.read()
+
+        def callback(request):
+            if "origin=0.0%2C0.0" in request.url or "origin=0.0,0.0" in request.url:
+                return (403, {}, error_body)
+            if "origin=1.0%2C1.0" in request.url or "origin=1.0,1.0" in request.url:
+                return (502, {}, "<html>Bad Gateway</html>")
+            return (200, {}, success_body)
+
+        responses.add_callback(
+            responses.GET, "https://router.hereapi.com/v8/routes", callback=callback
+        )
+        route_specs = [
+            {"origin": [41.9798, -87.8801], "destination": [41.9043, -87.9216]},
+            {"origin": [0.0, 0.0], "destination": [41.9043, -87.9216]},
+            {"origin": [41.9043, -87.9216], "destination": [41.9798, -87.8801]},
+            {"origin": [1.0, 1.0], "destination": [41.9043, -87.9216]},
+        ]
+        results = self._api.route_v8_batch(
+            route_specs,
+            max_workers=2,
+            transport_mode=herepy.RoutingTransportMode.car,
+        )
+        self.assertEqual(len(results), 4)
+        self.assertIsInstance(results[0], herepy.RoutingResponseV8)
+        self.assertIsInstance(results[1], herepy.AccessDeniedError)
+        self.assertIsInstance(results[2], herepy.RoutingResponseV8)
+        self.assertIsInstance(results[3], herepy.HEREError)
+        self.assertEqual(len(responses.calls), 4)
+
+    def test_location_names_are_geocoded_concurrently(self):
+        started = []
+        release = threading.Event()
+
+        def geocode(location_name):
+            started.append(location_name)
+            if len(started) == 3:
+                release.set()
+            if not release.wait(timeout=5):
+                raise herepy.HEREError("names were geocoded one at a time")
+            return [len(location_name), 0.0]
+
+        api = herepy.RoutingApi("api_key", geocoding_workers=4)
+        api._get_coordinates_for_location_name = geocode
+        request_body = api._prepare_matrix_request_body(
+            origins=["Berlin", "Rome", [1.0, 2.0]],
+            destinations=["Seattle", "Rome"],
+        )
+        self.assertEqual(sorted(started), ["Berlin", "Rome", "Seattle"])
+        self.assertEqual(
+            request_body["origins"],
+            [{"lat": 6, "lng": 0.0}, {"lat": 4, "lng": 0.0}, {"lat": 1.0, "lng": 2.0}],
+        )
+        self.assertEqual(
+            request_body["destinations"],
+            [{"lat": 7, "lng": 0.0}, {"lat": 4, "lng": 0.0}],
+        )
+
+    def test_location_name_errors_are_reported_together(self):
+        def geocode(location_name):
+            if location_name.startswith("Nowhere"):
+                raise herepy.WaypointNotFoundError("not found " + location_name)
+            return [1.0, 2.0]
+
+        api = herepy.RoutingApi("api_key")
+        api._get_coordinates_for_location_name = geocode
+        with self.assertRaises(herepy.WaypointNotFoundError) as context:
+            api._prepare_matrix_request_body(
+                origins=["Nowhere 1", "Berlin"], destinations=["Nowhere 2"]
+            )
+        self.assertEqual(sorted(context.exception.errors), ["Nowhere 1", "Nowhere 2"])
+        self.assertIn("not found Nowhere 2", context.exception.message)
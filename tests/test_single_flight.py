@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from herepy import HEREError, MapTileApi
+from herepy.single_flight import SingleFlight
+
+
+class SingleFlightTest(unittest.TestCase):
+    def test_concurrent_calls_share_result(self):
+        group = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def function():
+            calls.append(1)
+            release.wait(5)
+            return object()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(group.do, "key", function) for _ in range(8)]
+            time.sleep(0.1)
+            release.set()
+            results = [future.result() for future in futures]
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(len(group), 0)
+
+    def test_sequential_calls_run_again(self):
+        group = SingleFlight()
+        self.assertEqual(group.do("key", lambda: 1), 1)
+        self.assertEqual(group.do("key", lambda: 2), 2)
+        self.assertEqual(group.do("other", lambda: 3), 3)
+
+    def test_exception_is_shared(self):
+        group = SingleFlight()
+        release = threading.Event()
+
+        def function():
+            release.wait(5)
+            raise HEREError("failed")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(group.do, "key", function) for _ in range(4)]
+            time.sleep(0.1)
+            release.set()
+            for future in futures:
+                with self.assertRaises(HEREError):
+                    future.result()
+        self.assertEqual(len(group), 0)
+
+    def test_do_async(self):
+        group = SingleFlight()
+        calls = []
+
+        async def function():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return object()
+
+        async def run():
+            return await asyncio.gather(
+                *[group.do_async("key", function) for _ in range(8)]
+            )
+
+        results = asyncio.run(run())
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(len(group), 0)
+
+    @patch("herepy.map_tile_api.randrange", Mock(return_value=1))
+    @patch("herepy.here_api.requests.Session.request")
+    def test_map_tile_requests_are_coalesced(self, mock_request):
+        with open("testdata/tiles/berlin.png", "rb") as f:
+            content = f.read()
+
+        def request(*args, **kwargs):
+            time.sleep(0.1)
+            return Mock(ok=True, status_code=200, content=content)
+
+        mock_request.side_effect = request
+        api = MapTileApi(api_key="api_key", single_flight=SingleFlight())
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tiles = list(
+                executor.map(
+                    lambda _: api.get_maptile(
+                        latitude=52.525439, longitude=13.38727, zoom=12
+                    ),
+                    range(8),
+                )
+            )
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertTrue(all(tile is tiles[0] for tile in tiles))
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import responses
+
+import herepy
+from herepy.aio import AsyncMapTileApi
+from herepy.tile_cache import DiskTileCache
+
+
+class FakeClientResponse(object):
+    def __init__(self, url, content, headers=None):
+        self.status = 200
+        self.headers = headers or {}
+        self.url = url
+        self._content = content
+
+    async def read(self):
+        return self._content
+
+    def release(self):
+        pass
+
+
+class FakeClientSession(object):
+    closed = False
+
+    def __init__(self, content, headers=None):
+        self._content = content
+        self._headers = headers
+        self.requests = []
+
+    async def request(self, method, url, headers=None, **kwargs):
+        self.requests.append((url, headers))
+        return FakeClientResponse(url, self._content, self._headers)
+
+
+class DiskTileCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._directory)
+
+    def _create_cache(self, **kwargs):
+        cache = DiskTileCache(self._directory, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def _count_blobs(self):
+        return sum(
+            len(files)
+            for _, _, files in os.walk(os.path.join(self._directory, "blobs"))
+        )
+
+    def test_set_and_get(self):
+        cache = self._create_cache()
+        self.assertIsNone(cache.get(("maptile", 12, 2200, 1343)))
+        cache.set(("maptile", 12, 2200, 1343), b"tile", {"ETag": '"v1"'})
+        entry = cache.get(("maptile", 12, 2200, 1343))
+        self.assertEqual(entry.content, b"tile")
+        self.assertEqual(entry.etag, '"v1"')
+        self.assertTrue(entry.is_fresh())
+        self.assertIsNone(cache.get(("maptile", 12, 2200, 1344)))
+
+    def test_identical_tiles_share_content(self):
+        cache = self._create_cache()
+        cache.set(("maptile", 12, 0, 0), b"sea", {})
+        cache.set(("maptile", 12, 0, 1), b"sea", {})
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 3)
+        self.assertEqual(self._count_blobs(), 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = self._create_cache(max_bytes=8)
+        with patch("herepy.tile_cache.time.time") as now:
+            now.return_value = 1000.0
+            cache.set(("maptile", 1), b"aaaa", {})
+            now.return_value = 1001.0
+            cache.set(("maptile", 2), b"bbbb", {})
+            now.return_value = 1002.0
+            cache.get(("maptile", 1))
+            now.return_value = 1003.0
+            cache.set(("maptile", 3), b"cccc", {})
+        self.assertIsNotNone(cache.get(("maptile", 1)))
+        self.assertIsNone(cache.get(("maptile", 2)))
+        self.assertIsNotNone(cache.get(("maptile", 3)))
+        self.assertEqual(cache.size, 8)
+        self.assertEqual(self._count_blobs(), 2)
+
+    def test_overwriting_a_tile_releases_its_content(self):
+        cache = self._create_cache(max_bytes=250)
+        for version in range(20):
+            cache.set(("maptile", 1), bytes([version]) * 100, {})
+        self.assertEqual(cache.get(("maptile", 1)).content, bytes([19]) * 100)
+        self.assertEqual(cache.size, 100)
+        self.assertEqual(self._count_blobs(), 1)
+        cache.set(("maptile", 2), b"b" * 100, {})
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 200)
+
+    def test_expiry_and_refresh(self):
+        cache = self._create_cache(ttl=60)
+        with patch("herepy.tile_cache.time.time") as now:
+            now.return_value = 1000.0
+            cache.set(("maptile", 1), b"tile", {"Cache-Control": "public, max-age=10"})
+            cache.set(("maptile", 2), b"tile", {})
+            now.return_value = 1030.0
+            self.assertFalse(cache.get(("maptile", 1)).is_fresh())
+            self.assertTrue(cache.get(("maptile", 2)).is_fresh())
+            cache.refresh(("maptile", 1), {"ETag": '"v2"'})
+            entry = cache.get(("maptile", 1))
+            self.assertTrue(entry.is_fresh())
+            self.assertEqual(entry.etag, '"v2"')
+
+    def test_persists(self):
+        self._create_cache().set(("maptile", 1), b"tile", {})
+        self.assertEqual(self._create_cache().get(("maptile", 1)).content, b"tile")
+
+    def test_clear(self):
+        cache = self._create_cache()
+        cache.set(("maptile", 1), b"tile", {})
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(self._count_blobs(), 0)
+
+
+class TileCacheWrappersTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self._cache = DiskTileCache(directory)
+        self.addCleanup(self._cache.close)
+
+    @responses.activate
+    def test_revalidates_stale_tiles(self):
+        url = "https://vector.hereapi.com/v2/vectortiles/base/mc/12/2200/1343/omv"
+        responses.add(
+            responses.GET,
+            url,
+            b"\x1a\x05water",
+            headers={"ETag": '"v1"', "Cache-Control": "max-age=60"},
+        )
+        responses.add(responses.GET, url, status=304, headers={"ETag": '"v1"'})
+        api = herepy.VectorTileApi(api_key="api_key", tile_cache=self._cache)
+        with patch("herepy.tile_cache.time.time") as now:
+            now.return_value = 1000.0
+            self.assertEqual(
+                api.get_vectortile_by_tile(2200, 1343, 12), b"\x1a\x05water"
+            )
+            self.assertEqual(
+                api.get_vectortile_by_tile(2200, 1343, 12), b"\x1a\x05water"
+            )
+            self.assertEqual(len(responses.calls), 1)
+            now.return_value = 1100.0
+            self.assertEqual(
+                api.get_vectortile_by_tile(2200, 1343, 12), b"\x1a\x05water"
+            )
+            self.assertEqual(len(responses.calls), 2)
+            self.assertEqual(
+                responses.calls[1].request.headers["If-None-Match"], '"v1"'
+            )
+            self.assertEqual(
+                api.get_vectortile_by_tile(2200, 1343, 12), b"\x1a\x05water"
+            )
+            self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_errors_are_not_cached(self):
+        url = "https://vector.hereapi.com/v2/vectortiles/base/mc/12/2200/1343/omv"
+        responses.add(responses.GET, url, b"<html>Bad Gateway</html>", status=502)
+        responses.add(responses.GET, url, status=304)
+        responses.add(responses.GET, url, b"\x1a\x05water")
+        api = herepy.VectorTileApi(api_key="api_key", tile_cache=self._cache)
+        for _ in range(2):
+            with self.assertRaises(herepy.HEREError):
+                api.get_vectortile_by_tile(2200, 1343, 12)
+            self.assertEqual(len(self._cache), 0)
+        self.assertEqual(api.get_vectortile_by_tile(2200, 1343, 12), b"\x1a\x05water")
+        self.assertEqual(len(self._cache), 1)
+
+    @responses.activate
+    def test_only_revalidations_accept_not_modified(self):
+        url = "https://vector.hereapi.com/v2/vectortiles/base/mc/12/2200/1343/omv"
+        responses.add(responses.GET, url, b"\x1a\x05water")
+        responses.add(responses.GET, url, status=304)
+        api = herepy.VectorTileApi(api_key="api_key", tile_cache=self._cache)
+        with patch("herepy.tile_cache.time.time") as now:
+            now.return_value = 1000.0
+            api.get_vectortile_by_tile(2200, 1343, 12)
+            now.return_value = 1000.0 + 2 * 24 * 60 * 60
+            with self.assertRaises(herepy.HEREError):
+                api.get_vectortile_by_tile(2200, 1343, 12)
+            self.assertNotIn("If-None-Match", responses.calls[1].request.headers)
+
+    @responses.activate
+    def test_tile_parameters_are_part_of_the_key(self):
+        with open("testdata/tiles/berlin.png", "rb") as f:
+            tile = f.read()
+        for scheme in ("normal.day", "normal.night"):
+            responses.add(
+                responses.GET,
+                str.format(
+                    "https://1.base.maps.ls.hereapi.com/maptile/2.1/alabeltile/"
+                    "newest/{0}/12/2200/1343/256/png8",
+                    scheme,
+                ),
+                tile,
+            )
+        api = herepy.MapTileApi(api_key="api_key", tile_cache=self._cache)
+        for scheme in ("normal.day", "normal.night", "normal.day"):
+            api.get_maptile_by_tile(2200, 1343, 12, scheme=scheme, server=1)
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(len(self._cache), 2)
+
+    async def test_async_fresh_tiles_are_served(self):
+        session = FakeClientSession(b"tile", {"ETag": '"v1"'})
+        api = AsyncMapTileApi(
+            api_key="api_key", session=session, tile_cache=self._cache
+        )
+        self.assertEqual(await api.get_maptile_by_tile(2200, 1343, 12), b"tile")
+        self.assertEqual(await api.get_maptile_by_tile(2200, 1343, 12), b"tile")
+        self.assertEqual(len(session.requests), 1)
+        self.assertIsNone(session.requests[0][1].get("If-None-Match"))
+        self.assertEqual(len(self._cache), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
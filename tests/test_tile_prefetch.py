@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+import json
+import math
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+import responses
+
+import herepy
+from herepy import MercatorProjection, tile_prefetch
+from herepy.aio import AsyncVectorTileApi
+from herepy.flexible_polyline import FlexiblePolyline
+from herepy.here_enum import PolylineThirdDimension
+from herepy.tile_store import MBTilesStore
+
+
+class FakeClientResponse(object):
+    def __init__(self, url, content, headers=None):
+        self.status = 200
+        self.headers = headers or {}
+        self.url = url
+        self._content = content
+
+    async def read(self):
+        return self._content
+
+    def release(self):
+        pass
+
+
+class FakeClientSession(object):
+    closed = False
+
+    def __init__(self, content, headers=None):
+        self._content = content
+        self._headers = headers
+        self.requests = []
+
+    async def request(self, method, url, headers=None, **kwargs):
+        self.requests.append((url, headers))
+        return FakeClientResponse(url, self._content, self._headers)
+
+
+class TilePrefetchTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        with open("testdata/models/routing_v8_response.json", "r") as f:
+            self._route = herepy.RoutingResponseV8.new_from_jsondict(json.load(f))
+
+    def _sample(self, path, buffer):
+        """Yields points along the path and around it closer than `buffer`."""
+        meters_per_degree = MercatorProjection.EARTH_CIRCUMFERENCE / 360
+        for (lat0, lng0), (lat1, lng1) in zip(path, path[1:]):
+            for step in range(20):
+                latitude = lat0 + (lat1 - lat0) * step / 20
+                longitude = lng0 + (lng1 - lng0) * step / 20
+                yield latitude, longitude
+                for direction in range(16):
+                    angle = direction * math.pi / 8
+                    distance = 0.95 * buffer
+                    yield (
+                        latitude + distance * math.cos(angle) / meters_per_degree,
+                        longitude
+                        + distance
+                        * math.sin(angle)
+                        / (meters_per_degree * math.cos(math.radians(latitude))),
+                    )
+
+    def test_get_route_paths(self):
+        paths = tile_prefetch.get_route_paths(self._route)
+        self.assertEqual([len(path) for path in paths], [311, 229])
+        self.assertEqual(paths[0][0], (41.98007, -87.88056))
+        encoded = FlexiblePolyline.encode(
+            [(50.1, 8.6, 10), (50.2, 8.7, 20)], 5, PolylineThirdDimension.altitude
+        )
+        self.assertEqual(
+            tile_prefetch.get_route_paths(encoded), [[(50.1, 8.6), (50.2, 8.7)]]
+        )
+        self.assertEqual(
+            tile_prefetch.get_route_paths([[50.1, 8.6, 0], [50.2, 8.7, 0]]),
+            [[(50.1, 8.6), (50.2, 8.7)]],
+        )
+
+    def test_tiles_along_path_cover_the_corridor(self):
+        path = tile_prefetch.get_route_paths(self._route)[0]
+        for zoom, buffer in ((14, 0), (16, 0), (16, 300)):
+            tiles = MercatorProjection.get_tiles_along_path(path, zoom, buffer)
+            self.assertEqual(len(tiles), len(set(tiles)))
+            points = list(self._sample(path, buffer))
+            columns, rows = MercatorProjection.get_columns_rows(
+                [point[0] for point in points],
+                [point[1] for point in points],
+                zoom,
+                use_numpy=False,
+            )
+            sampled = set(zip(columns, rows))
+            self.assertLessEqual(sampled, set(tiles))
+            # Corner tiles aside, the corridor holds little more than needed.
+            self.assertLess(len(tiles), 1.5 * len(sampled) + 10)
+
+    def test_tiles_along_path_across_the_antimeridian(self):
+        tiles = MercatorProjection.get_tiles_along_path(
+            [(-17.7, 178.0), (-17.7, -178.0)], 4
+        )
+        self.assertEqual(tiles, [(15, 8), (0, 8)])
+
+    def test_get_tiles_along_route(self):
+        tiles = list(tile_prefetch.get_tiles_along_route(self._route, [12, 14], 250))
+        self.assertEqual(len(tiles), len(set(tiles)))
+        self.assertEqual({zoom for zoom, _, _ in tiles}, {12, 14})
+        self.assertEqual(tiles[0], (12, 1048, 1520))
+
+    @responses.activate
+    def test_get_maptiles_along_route(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        store = MBTilesStore(os.path.join(directory, "route.mbtiles"))
+        self.addCleanup(store.close)
+        with open("testdata/tiles/berlin.png", "rb") as f:
+            tile = f.read()
+        responses.add(
+            responses.GET,
+            re.compile(r"https://[1-4]\.base\.maps\.ls\.hereapi\.com/maptile/2\.1/.*"),
+            tile,
+        )
+        api = herepy.MapTileApi(api_key="api_key", tile_store=store)
+        expected = list(tile_prefetch.get_tiles_along_route(self._route, [13], 250))
+        tiles = list(api.get_maptiles_along_route(self._route, [13], max_workers=4))
+        self.assertEqual(sorted(tiles), sorted(key + (tile,) for key in expected))
+        self.assertEqual(len(store), len(expected))
+        self.assertEqual(
+            list(api.get_maptiles_along_route(self._route, [13], skip_stored=True)), []
+        )
+        self.assertEqual(len(responses.calls), len(expected))
+
+    @responses.activate
+    def test_get_vectortiles_along_route_reports_errors(self):
+        with open("testdata/models/unauthorized_error.json", "rb") as f:
+            responses.add(
+                responses.GET,
+                re.compile(r"https://vector\.hereapi\.com/v2/vectortiles/.*"),
+                f.read(),
+                status=401,
+            )
+        api = herepy.VectorTileApi(api_key="api_key")
+        tiles = list(api.get_vectortiles_along_route([[52.5, 13.38]], [12], 0))
+        self.assertEqual(len(tiles), 1)
+        zoom, column, row, error = tiles[0]
+        self.assertEqual((zoom, column, row), (12, 2200, 1343))
+        self.assertIsInstance(error, herepy.UnauthorizedError)
+
+    async def test_async_get_vectortiles_along_route(self):
+        session = FakeClientSession(b"\x1a\x05water")
+        api = AsyncVectorTileApi(api_key="api_key", session=session)
+        expected = list(tile_prefetch.get_tiles_along_route(self._route, [12], 250))
+        tiles = [
+            tile
+            async for tile in api.get_vectortiles_along_route(
+                self._route, [12], max_concurrency=2
+            )
+        ]
+        self.assertEqual(
+            sorted(tiles), sorted(key + (b"\x1a\x05water",) for key in expected)
+        )
+        self.assertEqual(len(session.requests), len(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
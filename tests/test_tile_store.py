@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+import responses
+
+import herepy
+from herepy.aio import AsyncVectorTileApi
+from herepy.tile_store import MBTilesStore
+
+
+class FakeClientResponse(object):
+    def __init__(self, url, content, headers=None):
+        self.status = 200
+        self.headers = headers or {}
+        self.url = url
+        self._content = content
+
+    async def read(self):
+        return self._content
+
+    def release(self):
+        pass
+
+
+class FakeClientSession(object):
+    closed = False
+
+    def __init__(self, content, headers=None):
+        self._content = content
+        self._headers = headers
+        self.requests = []
+
+    async def request(self, method, url, headers=None, **kwargs):
+        self.requests.append((url, headers))
+        return FakeClientResponse(url, self._content, self._headers)
+
+
+class MBTilesStoreTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self._path = os.path.join(directory, "tiles.mbtiles")
+
+    def test_put_and_get(self):
+        with MBTilesStore(self._path, batch_size=2) as store:
+            self.assertIsNone(store.get(12, 2200, 1343))
+            store.put(12, 2200, 1343, b"tile")
+            self.assertEqual(store.get(12, 2200, 1343), b"tile")
+            self.assertIn((12, 2200, 1343), store)
+            self.assertNotIn((12, 2200, 1344), store)
+            self.assertEqual(len(store), 1)
+
+    def test_batches_writes(self):
+        store = MBTilesStore(self._path, batch_size=2)
+        self.addCleanup(store.close)
+        reader = sqlite3.connect(self._path)
+        self.addCleanup(reader.close)
+        count = "SELECT COUNT(*) FROM tiles"
+        store.put(1, 0, 0, b"a")
+        self.assertEqual(reader.execute(count).fetchone()[0], 0)
+        store.put(1, 1, 0, b"b")
+        self.assertEqual(reader.execute(count).fetchone()[0], 2)
+        store.put(1, 1, 1, b"c")
+        store.flush()
+        self.assertEqual(reader.execute(count).fetchone()[0], 3)
+
+    def test_mbtiles_layout(self):
+        with MBTilesStore(self._path, metadata={"name": "berlin", "format": "png"}):
+            pass
+        with MBTilesStore(self._path) as store:
+            store.put(12, 2200, 1343, b"tile")
+            store.set_metadata({"minzoom": 12})
+            self.assertEqual(
+                store.get_metadata(),
+                {"name": "berlin", "format": "png", "minzoom": "12"},
+            )
+        connection = sqlite3.connect(self._path)
+        self.addCleanup(connection.close)
+        self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(
+            connection.execute("SELECT * FROM tiles").fetchall(),
+            [(12, 2200, 4095 - 1343, b"tile")],
+        )
+
+
+class TileStoreWrappersTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self._store = MBTilesStore(os.path.join(directory, "tiles.mbtiles"))
+        self.addCleanup(self._store.close)
+        with open("testdata/tiles/berlin.png", "rb") as f:
+            self._tile = f.read()
+
+    @responses.activate
+    def test_map_tiles_are_stored_and_served(self):
+        url = re.compile(r"https://[1-4]\.base\.maps\.ls\.hereapi\.com/maptile/2\.1/.*")
+        responses.add(responses.GET, url, self._tile)
+        api = herepy.MapTileApi(api_key="api_key", tile_store=self._store)
+        tile = api.get_maptile(52.525439, 13.38727, 12)
+        self.assertEqual(tile, self._tile)
+        self.assertIn((12, 2200, 1343), self._store)
+        self.assertEqual(api.get_maptile(52.525439, 13.38727, 12), self._tile)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_seeding_resumes(self):
+        url = re.compile(r"https://[1-4]\.base\.maps\.ls\.hereapi\.com/maptile/2\.1/.*")
+        responses.add(responses.GET, url, self._tile)
+        api = herepy.MapTileApi(api_key="api_key", tile_store=self._store)
+        bbox = [52.6, 13.2], [52.4, 13.6]
+        for _ in zip(range(3), api.get_maptiles_in_bbox(*bbox, [12], max_workers=1)):
+            pass
+        stored = len(self._store)
+        self.assertGreaterEqual(stored, 3)
+        calls = len(responses.calls)
+        tiles = list(api.get_maptiles_in_bbox(*bbox, [12], skip_stored=True))
+        expected = len(list(herepy.MercatorProjection.get_tiles_in_bbox(*bbox, 12)))
+        self.assertEqual(len(tiles), expected - stored)
+        self.assertEqual(len(responses.calls) - calls, expected - stored)
+        self.assertEqual(len(self._store), expected)
+
+    @responses.activate
+    def test_errors_are_not_stored(self):
+        with open("testdata/models/unauthorized_error.json", "rb") as f:
+            responses.add(
+                responses.GET,
+                "https://vector.hereapi.com/v2/vectortiles/base/mc/12/2200/1343/omv",
+                f.read(),
+                status=401,
+            )
+        api = herepy.VectorTileApi(api_key="api_key", tile_store=self._store)
+        with self.assertRaises(herepy.UnauthorizedError):
+            api.get_vectortile_by_tile(2200, 1343, 12)
+        self.assertNotIn((12, 2200, 1343), self._store)
+
+    @responses.activate
+    def test_gateway_errors_are_not_stored(self):
+        url = re.compile(r"https://[1-4]\.base\.maps\.ls\.hereapi\.com/maptile/2\.1/.*")
+        responses.add(responses.GET, url, b"<html>Bad Gateway</html>", status=502)
+        responses.add(responses.GET, url, self._tile)
+        api = herepy.MapTileApi(api_key="api_key", tile_store=self._store)
+        tiles = list(api.get_maptiles_in_bbox([85, -180], [1, -1], [1]))
+        self.assertEqual(tiles[0][:3], (1, 0, 0))
+        self.assertIsInstance(tiles[0][3], herepy.HEREError)
+        self.assertNotIn((1, 0, 0), self._store)
+        tiles = list(
+            api.get_maptiles_in_bbox([85, -180], [1, -1], [1], skip_stored=True)
+        )
+        self.assertEqual(tiles, [(1, 0, 0, self._tile)])
+        self.assertEqual(self._store.get(1, 0, 0), self._tile)
+
+    async def test_async_vector_tiles_are_stored_and_served(self):
+        session = FakeClientSession(b"\x1a\x05water")
+        api = AsyncVectorTileApi(
+            api_key="api_key", session=session, tile_store=self._store
+        )
+        self.assertEqual(
+            await api.get_vectortile(52.525439, 13.38727, 12), b"\x1a\x05water"
+        )
+        self.assertEqual(
+            await api.get_vectortile(52.525439, 13.38727, 12), b"\x1a\x05water"
+        )
+        self.assertEqual(len(session.requests), 1)
+        self.assertEqual(self._store.get(12, 2200, 1343), b"\x1a\x05water")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+
+import unittest
+from unittest.mock import patch
+
+import requests
+import responses
+
+import herepy
+from herepy import tracing
+from herepy.aio import AsyncGeocoderApi
+from herepy.here_api import HEREApi
+from herepy.retry import RetryPolicy
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+except ImportError:  # pragma: no cover
+    trace = None
+
+
+class FakeClientResponse(object):
+    def __init__(self, content):
+        self.status = 200
+        self.headers = {}
+        self.url = "https://geocode.search.hereapi.com/v1/geocode"
+        self._content = content
+
+    async def read(self):
+        return self._content
+
+    def release(self):
+        pass
+
+
+class FakeClientSession(object):
+    closed = False
+
+    def __init__(self, content):
+        self._content = content
+        self.headers = []
+
+    async def request(self, method, url, headers=None, **kwargs):
+        self.headers.append(headers)
+        return FakeClientResponse(self._content)
+
+
+@unittest.skipIf(trace is None, "OpenTelemetry is not installed")
+class TracingTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        # Spans go to this provider only, the global one is left alone.
+        patcher = patch.object(
+            tracing, "_get_tracer", return_value=provider.get_tracer("herepy")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        with open("testdata/models/geocoder.json", "rb") as f:
+            self._geocoder = f.read()
+
+    def _get_spans(self):
+        return {span.name: span for span in self.exporter.get_finished_spans()}
+
+    def _assert_span_tree(self, spans, method_name):
+        method_span = spans[method_name]
+        http_span = spans["GET"]
+        parse_span = spans["herepy.parse"]
+        decode_span = spans["herepy.decode_json"]
+        self.assertIsNone(method_span.parent)
+        self.assertEqual(method_span.attributes["herepy.service"], "geocoding")
+        self.assertEqual(http_span.parent.span_id, method_span.context.span_id)
+        self.assertEqual(parse_span.parent.span_id, method_span.context.span_id)
+        self.assertEqual(decode_span.parent.span_id, parse_span.context.span_id)
+        self.assertEqual(http_span.kind, trace.SpanKind.CLIENT)
+        self.assertEqual(http_span.attributes["http.response.status_code"], 200)
+        self.assertIn("apiKey=REDACTED", http_span.attributes["url.full"])
+        return http_span
+
+    @responses.activate
+    def test_spans(self):
+        responses.add(
+            responses.GET,
+            "https://geocode.search.hereapi.com/v1/geocode",
+            self._geocoder,
+        )
+        api = herepy.GeocoderApi(api_key="api_key", session=HEREApi.create_session())
+        self.assertIsInstance(api.free_form("Berlin"), herepy.GeocoderResponse)
+        http_span = self._assert_span_tree(self._get_spans(), "GeocoderApi.free_form")
+        self.assertIn("herepy.timing.ttfb", http_span.attributes)
+        traceparent = responses.calls[0].request.headers["traceparent"]
+        self.assertEqual(
+            traceparent.split("-")[1:3],
+            [
+                "{0:032x}".format(http_span.context.trace_id),
+                "{0:016x}".format(http_span.context.span_id),
+            ],
+        )
+
+    async def test_async_spans(self):
+        session = FakeClientSession(self._geocoder)
+        api = AsyncGeocoderApi(api_key="api_key", session=session)
+        response = await api.free_form("Berlin")
+        self.assertIsInstance(response, herepy.GeocoderResponse)
+        http_span = self._assert_span_tree(self._get_spans(), "GeocoderApi.free_form")
+        self.assertIn(
+            "{0:016x}".format(http_span.context.span_id),
+            session.headers[0]["traceparent"],
+        )
+
+    @responses.activate
+    @patch("herepy.here_api.time.sleep")
+    def test_retried_call(self, sleep):
+        url = "https://router.hereapi.com/v8/routes"
+        responses.add(responses.GET, url, body=requests.ConnectionError("reset"))
+        responses.add(responses.GET, url, "{}", status=200)
+        api = HEREApi(
+            api_key="api_key",
+            session=HEREApi.create_session(),
+            retry_policy=RetryPolicy(),
+        )
+        api._request("GET", url, service="routing")
+        failed, succeeded = self.exporter.get_finished_spans()
+        self.assertEqual(failed.status.status_code, trace.StatusCode.ERROR)
+        self.assertEqual(failed.attributes["error.type"], "ConnectionError")
+        self.assertNotIn("http.request.resend_count", failed.attributes)
+        self.assertEqual(succeeded.attributes["http.request.resend_count"], 1)
+        self.assertEqual(succeeded.attributes["herepy.service"], "routing")
+
+    def test_methods_are_wrapped_once(self):
+        self.assertTrue(herepy.RoutingApi.route_v8._herepy_traced)
+        self.assertEqual(herepy.RoutingApi.route_v8.__name__, "route_v8")
+        self.assertIs(
+            tracing.trace_method(herepy.RoutingApi.route_v8, "route_v8"),
+            herepy.RoutingApi.route_v8,
+        )
@@ -2,6 +2,7 @@
 
 import os
 import unittest
+from unittest.mock import patch
 
 import herepy
 from herepy.utils import Utils
@@ -37,3 +38,28 @@ class UtilsTest(unittest.TestCase):
         }
         url = Utils.build_url("https://router.hereapi.com/v8/routes", data)
         self.assertEqual(url, "https://router.hereapi.com/v8/routes?key1=val&key2%5Bsub_key%5D=sub_val&key2%5Bsub_key2%5D=sub_val2")
+
+    def test_get_cache_key(self):
+        key = Utils.get_cache_key(
+            "get", "https://here.com/v1/geocode?q=Berlin&apiKey=secret&lang=de"
+        )
+        self.assertEqual(key, "GET https://here.com/v1/geocode?lang=de&q=Berlin")
+        self.assertEqual(
+            key,
+            Utils.get_cache_key(
+                "GET", "https://here.com/v1/geocode?apiKey=other&lang=de&q=Berlin"
+            ),
+        )
+        self.assertNotEqual(
+            Utils.get_cache_key("POST", "https://here.com/v8/matrix", {"a": 1}),
+            Utils.get_cache_key("POST", "https://here.com/v8/matrix", {"a": 2}),
+        )
+
+    def test_use_numpy(self):
+        self.assertFalse(Utils.use_numpy(False))
+        self.assertTrue(Utils.use_numpy(True))
+        self.assertTrue(Utils.use_numpy(None))
+        with patch("herepy.utils.numpy", None):
+            self.assertFalse(Utils.use_numpy(None))
+            with self.assertRaises(herepy.HEREError):
+                Utils.use_numpy(True)
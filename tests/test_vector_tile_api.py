@@ -24,7 +24,7 @@ class VectorTileApiTest(unittest.TestCase):
             self._api._base_url, "https://vector.hereapi.com/v2/vectortiles/"
         )
 
-    @patch("herepy.vector_tile_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_vector_tile_succeed(self, mock_get):
         with open("testdata/tiles/omv", "rb") as tile:
             mock_get.return_value = Mock(ok=True)
@@ -34,7 +34,18 @@ class VectorTileApiTest(unittest.TestCase):
         )
         self.assertIsNotNone(vector_tile)
 
-    @patch("herepy.vector_tile_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
+    def test_get_vector_tile_with_utf8_content_succeed(self, mock_get):
+        mock_get.return_value = Mock(ok=True)
+        mock_get.return_value.content = b"\x1a\x05water"
+        for json_decoder in ("json", None):
+            api = VectorTileApi(api_key="api_key", json_decoder=json_decoder)
+            vector_tile = api.get_vectortile(
+                latitude=52.525439, longitude=13.38727, zoom=12
+            )
+            self.assertEqual(vector_tile, b"\x1a\x05water")
+
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_vector_tile_fails(self, mock_get):
         mock_get.return_value = Mock(ok=True)
         mock_get.return_value.content = None
@@ -43,7 +54,7 @@ class VectorTileApiTest(unittest.TestCase):
         )
         self.assertIsNone(vector_tile)
 
-    @patch("herepy.vector_tile_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_vector_tile_when_receives_unauthorized_error(self, mock_get):
         with open("testdata/models/unauthorized_error.json", "rb") as f:
             mock_get.return_value = Mock(ok=True)
@@ -54,7 +65,7 @@ class VectorTileApiTest(unittest.TestCase):
             )
         self.assertEqual("apiKey invalid. apiKey not found.", str(cm.exception))
 
-    @patch("herepy.vector_tile_api.requests.get")
+    @patch("herepy.here_api.requests.Session.request")
     def test_get_vector_tile_when_receives_not_authorize_access_error(self, mock_get):
         with open("testdata/models/not_authorize_access.json", "rb") as f:
             mock_get.return_value = Mock(ok=True)